@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Memory held by the parsed INSERT payload: row dicts, columns as parsed, and
+columns with the vector column packed to float32 by pack_float_vectors.
+caller.insert does not pack: pymilvus serializes list columns fastest, see
+bench_pymilvus_payload.
+
+    python -m benchmarks.bench_columnar
+"""
+import random
+import time
+import tracemalloc
+
+import numpy as np
+
+from sqlparser import parse, set_cache_size
+from sqlparser.vectors import pack_float_vectors
+
+
+def insert_sql(rows, dim):
+    values = ', '.join(
+        '(%d, [%s])' % (i, ', '.join('%.6f' % random.random() for _ in range(dim)))
+        for i in range(rows)
+    )
+    return f'insert into book (book_id, book_intro) values {values};'
+
+
+def parse_layout(sql, layout):
+    query = parse(sql, columnar=layout != 'rows')
+    if layout == 'packed':
+        # 长期保存插入数据时可以这样打包，这里不再保留解析出的列表
+        packed = pack_float_vectors(query['columns']['book_intro'])
+        query['columns']['book_intro'] = np.frombuffer(packed.buffer, dtype=np.float32).reshape(-1, packed.dim)
+    return query
+
+
+def measure(sql, layout):
+    tracemalloc.start()
+    start = time.perf_counter()
+    query = parse_layout(sql, layout)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del query
+    return elapsed, retained, peak
+
+
+def main():
+    set_cache_size(0)
+    print('%-8s %-6s %-9s %10s %14s %14s' % ('rows', 'dim', 'layout', 'seconds', 'retained (MB)', 'peak (MB)'))
+    for rows, dim in [(1000, 128), (1000, 768), (10000, 128)]:
+        sql = insert_sql(rows, dim)
+        for layout in ('rows', 'columns', 'packed'):
+            elapsed, retained, peak = measure(sql, layout)
+            print('%-8d %-6d %-9s %10.4f %14.2f %14.2f' % (rows, dim, layout, elapsed, retained / 2 ** 20, peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
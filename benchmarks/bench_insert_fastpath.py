@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+INSERT ... VALUES through the fast path against the full ply grammar.
+
+    python -m benchmarks.bench_insert_fastpath
+"""
+import random
+import time
+
+from sqlparser.fastpath import parse_insert
+from sqlparser.grammar import parse_handle
+
+
+def insert_sql(rows, dim):
+    values = ', '.join(
+        "(%d, '%s', [%s])" % (i, 'name_%d' % i, ', '.join('%.6f' % random.random() for _ in range(dim)))
+        for i in range(rows)
+    )
+    return f'insert into book (book_id, book_name, book_intro) values {values};'
+
+
+def timed(func, sql, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(sql)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    print('%-8s %-6s %12s %12s %9s' % ('rows', 'dim', 'grammar (s)', 'fast (s)', 'speedup'))
+    for rows, dim in [(1000, 8), (10000, 8), (1000, 128), (1000, 768)]:
+        sql = insert_sql(rows, dim)
+        slow = timed(parse_handle, sql)
+        fast = timed(parse_insert, sql)
+        print('%-8d %-6d %12.4f %12.4f %8.1fx' % (rows, dim, slow, fast, slow / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Parse time of INSERT ... VALUES against row count and of a vector literal
+against its dimension. With left-recursive list rules the time per row and
+per component should stay flat as the input grows.
+
+    python -m benchmarks.bench_list_scaling
+"""
+import random
+import time
+
+from sqlparser.grammar import parse_handle
+
+
+def insert_sql(rows, dim=8):
+    values = ', '.join(
+        '(%d, [%s])' % (i, ', '.join('%.6f' % random.random() for _ in range(dim)))
+        for i in range(rows)
+    )
+    return f'insert into book (book_id, book_intro) values {values};'
+
+
+def search_sql(dim):
+    vector = ', '.join('%.6f' % random.random() for _ in range(dim))
+    return f'select book_id from book order by book_intro <-> [[{vector}]] limit 10 with {{"metric_type":"L2"}};'
+
+
+def timed(sql, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_handle(sql)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    print('%-10s %12s %14s' % ('rows', 'seconds', 'us per row'))
+    for rows in [100, 1000, 10000]:
+        elapsed = timed(insert_sql(rows))
+        print('%-10d %12.4f %14.2f' % (rows, elapsed, elapsed / rows * 1e6))
+
+    print()
+    print('%-10s %12s %14s' % ('dim', 'seconds', 'us per dim'))
+    for dim in [128, 1024, 8192, 32768]:
+        elapsed = timed(search_sql(dim))
+        print('%-10d %12.4f %14.2f' % (dim, elapsed, elapsed / dim * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of sqlparser.parse over a corpus covering every statement family
+of grammar.py: database, collection, partition and index DDL, INSERT/UPSERT
+with 1 to 100k rows, searches with vectors of 128 to 32768 dimensions, and
+queries/deletes with deep and long WHERE clauses. No Milvus server needed.
+
+For every case it reports statements/s, tokens/s, the peak memory of one
+parse and the number of memory blocks allocated by the parse that the
+result still holds (both from tracemalloc). The parse cache is disabled.
+
+    python -m benchmarks.bench_parser                  # compare with the baseline
+    python -m benchmarks.bench_parser --save           # write a new baseline
+    python -m benchmarks.bench_parser --quick -k where # a subset, fewer rounds
+
+A case regresses when its statements/s falls below the baseline by more than
+--tolerance, or its peak memory grows by more than --tolerance; the exit
+status is then 1. Throughput is compared after scaling by a fixed pure
+Python workload timed in both runs, so a baseline saved on a different or
+busier machine still gives usable ratios.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from sqlparser import parse, set_cache_size
+from sqlparser.grammar import L
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_parser.json')
+
+
+def ddl():
+    return [
+        ('ddl', 'create_db', 'create database db1;'),
+        ('ddl', 'use_db', 'use db1;'),
+        ('ddl', 'show_db', 'show databases;'),
+        ('ddl', 'drop_db', 'drop database db1;'),
+        ('ddl', 'create_coll', 'create collection book (book_id int64 primary key, word_count int32, '
+                               'book_name varchar(200) description("name"), tags varchar(64) array(16), '
+                               'meta json, book_intro float vector(768)) with {"num_shards": 2};'),
+        ('ddl', 'show_coll', 'show collections;'),
+        ('ddl', 'drop_coll', 'drop collection book;'),
+        ('ddl', 'alias', 'create alias publication for book;'),
+        ('ddl', 'rename_coll', 'rename collection book to novel in db1;'),
+        ('ddl', 'load_coll', 'load collection book with {"replica_number": 2};'),
+        ('ddl', 'compact_coll', 'compact collection book;'),
+        ('ddl', 'create_part', 'create partition p1 on book;'),
+        ('ddl', 'load_part', 'load partition p1, p2, p3 on book;'),
+        ('ddl', 'show_part', 'show partitions on book;'),
+        ('ddl', 'create_idx', 'create index idx on book(book_intro) with {"index_type": "IVF_FLAT", '
+                              '"metric_type": "L2", "nlist": 1024};'),
+        ('ddl', 'show_idx', 'show indexes on book;'),
+        ('ddl', 'bulk_insert', 'bulk insert collection book from "1.json", "2.json";'),
+    ]
+
+
+def insert_sql(rows, dim=8):
+    values = ', '.join(
+        "(%d, 'name_%d', [%s])" % (i, i, ', '.join('%.6f' % random.random() for _ in range(dim)))
+        for i in range(rows))
+    return f'insert into book (book_id, book_name, book_intro) values {values};'
+
+
+def inserts(quick):
+    sizes = (1, 100, 10000) if quick else (1, 100, 10000, 100000)
+    cases = [('insert', f'rows_{rows}', insert_sql(rows)) for rows in sizes]
+    cases.append(('insert', 'upsert_part_100', insert_sql(100).replace(
+        'insert into book', 'upsert into partition p1 on book', 1)))
+    return cases
+
+
+def vector_sql(dim, count=1):
+    vectors = ', '.join('[%s]' % ', '.join('%.6f' % random.random() for _ in range(dim))
+                        for _ in range(count))
+    return (f'select book_id from book order by book_intro <-> [{vectors}] limit 10 '
+            f'where word_count > 100 with {{"metric_type": "L2", "nprobe": 16}};')
+
+
+def searches(quick):
+    dims = (128, 1024) if quick else (128, 1024, 8192, 32768)
+    cases = [('search', f'dim_{dim}', vector_sql(dim)) for dim in dims]
+    cases.append(('search', 'dim_128_x100', vector_sql(128, 100)))
+    cases.append(('search', 'binary', 'select book_id from partition p1, p2 on book order by bits <-> '
+                                      '[[1, 255, 7, 9]] limit 5 with {"metric_type": "HAMMING"};'))
+    return cases
+
+
+def nested(depth):
+    condition = 'a = 0'
+    for i in range(1, depth):
+        condition = f'(a = {i} or {condition}) and b > {i}'
+    return condition
+
+
+def wheres(quick):
+    terms = 1000 if quick else 10000
+    cases = [
+        ('where', 'simple', 'select book_id, book_name from book limit 10 where book_id in [1, 2, 3] '
+                            'and book_name like "a%";'),
+        ('where', 'functions', 'select * from book where json_contains_any(meta["tags"], [1, 2]) '
+                               'and array_length(tags) >= 2 and not word_count between 1 and 10;'),
+        ('where', 'arithmetic', 'select count(*) from book where word_count > 10 * 60 * 60 - 2 ** 4;'),
+        ('where', 'nested_50', f'select book_id from book where {nested(50)};'),
+        ('where', f'or_{terms}', 'delete from book where ' + ' or '.join(
+            f'(owner = "u{i}" and level >= {i % 5})' for i in range(terms // 2)) + ';'),
+        ('where', f'in_{terms * 10}', 'delete from book where book_id in [%s];' % ', '.join(
+            str(i) for i in range(terms * 10))),
+    ]
+    return cases
+
+
+def corpus(quick):
+    # 固定随机数种子，每次生成相同的语句
+    random.seed(1)
+    return ddl() + inserts(quick) + searches(quick) + wheres(quick)
+
+
+def count_tokens(sql):
+    lexer = L.clone()
+    lexer.input(sql)
+    count = 0
+    while lexer.token() is not None:
+        count += 1
+    return count
+
+
+def throughput(sql, min_time, rounds=5):
+    # 取多轮中最快的一轮，减少机器负载波动的影响
+    best = 0.0
+    for _ in range(rounds):
+        runs = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while runs == 0 or elapsed < min_time / rounds:
+            parse(sql)
+            runs += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, runs / elapsed)
+    return best
+
+
+def calibrate(rounds=5):
+    # 固定的纯 Python 计算量，用来折算不同时刻、不同机器的速度差异
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        for i in range(200000):
+            total += len(str(i)) * (i % 7)
+        best = max(best, 1 / (time.perf_counter() - start))
+    return best
+
+
+def memory(sql):
+    gc.collect()
+    tracemalloc.start()
+    query = parse(sql)
+    peak = tracemalloc.get_traced_memory()[1]
+    # 解析过程中分配、仍被解析结果持有的内存块数
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    del query
+    return peak, blocks
+
+
+def run(cases, min_time):
+    results = dict()
+    for family, name, sql in cases:
+        key = f'{family}/{name}'
+        tokens = count_tokens(sql)
+        parse(sql)   # 预热
+        rate = throughput(sql, min_time)
+        peak, blocks = memory(sql)
+        results[key] = {'stmts_per_s': rate, 'tokens_per_s': rate * tokens, 'tokens': tokens,
+                        'peak_kb': peak / 1024, 'blocks': blocks}
+    return results
+
+
+def report(results, baseline, speed, tolerance):
+    regressions = []
+    print('%-24s %8s %12s %14s %11s %9s %8s' % ('case', 'tokens', 'stmts / s', 'tokens / s',
+                                                'peak (KB)', 'blocks', 'vs base'))
+    for key, result in results.items():
+        change = ''
+        base = baseline.get(key)
+        if base is not None:
+            # 按校准的结果折算机器速度后再比较
+            ratio = result['stmts_per_s'] / base['stmts_per_s'] / speed
+            change = '%7.2fx' % ratio
+            if ratio < 1 - tolerance:
+                regressions.append(f'{key}: {ratio:.2f}x the baseline throughput')
+            if result['peak_kb'] > base['peak_kb'] * (1 + tolerance) and result['peak_kb'] - base['peak_kb'] > 64:
+                regressions.append(f'{key}: peak memory {result["peak_kb"]:.0f} KB, '
+                                   f'baseline {base["peak_kb"]:.0f} KB')
+        print('%-24s %8d %12.1f %14.0f %11.1f %9d %8s' % (
+            key, result['tokens'], result['stmts_per_s'], result['tokens_per_s'],
+            result['peak_kb'], result['blocks'], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline file, default %(default)s')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown, default %(default)s')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds per case, default %(default)s')
+    parser.add_argument('--quick', action='store_true', help='smaller statements, fewer rounds')
+    parser.add_argument('-k', dest='pattern', default='', help='only run cases containing this text')
+    args = parser.parse_args(argv)
+
+    set_cache_size(0)
+    cases = [case for case in corpus(args.quick) if args.pattern in f'{case[0]}/{case[1]}']
+    calibration = calibrate()
+    results = run(cases, 0.1 if args.quick else args.min_time)
+    calibration = max(calibration, calibrate())
+
+    baseline, speed = dict(), 1.0
+    if not args.save and os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            saved = json.load(file)
+        baseline, speed = saved['results'], calibration / saved['calibration']
+        print(f'machine speed vs baseline: {speed:.2f}x')
+    regressions = report(results, baseline, speed, args.tolerance)
+
+    if args.save:
+        with open(args.baseline, 'w') as file:
+            json.dump({'python': sys.version.split()[0], 'calibration': calibration, 'results': results}, file, indent=1, sort_keys=True)
+            file.write('\n')
+        print(f'baseline written to {args.baseline}')
+    elif regressions:
+        print('\nregressions:')
+        for regression in regressions:
+            print('  ' + regression)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
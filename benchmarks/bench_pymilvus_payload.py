@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Request preparation inside pymilvus for the vector layouts the caller could
+hand over: plain lists, array('f'), array('f') converted back with tolist()
+and rows of a numpy float32 matrix for search; list columns against a
+column packed with pack_float_vectors and viewed as a numpy matrix for
+insert. Runs pymilvus' own request builders (parameter checks, placeholder
+packing, field data), everything but the RPC, so no Milvus server is
+needed.
+
+    python -m benchmarks.bench_pymilvus_payload
+"""
+import random
+import time
+from array import array
+
+import numpy as np
+from pymilvus import CollectionSchema, DataType, FieldSchema
+from pymilvus.client.check import check_pass_param
+from pymilvus.client.prepare import Prepare as RequestPrepare
+from pymilvus.orm.prepare import Prepare as DataPrepare
+
+from sqlparser.vectors import pack_float_vectors
+
+
+def timed(func, repeat=5):
+    try:
+        func()
+    except Exception:
+        # pymilvus 不接受这种格式
+        return None
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def search_request(data):
+    check_pass_param(limit=10, round_decimal=-1, anns_field='v', search_data=data)
+    RequestPrepare.search_requests_with_expr('c', data, 'v', {'metric_type': 'L2', 'params': {}}, 10)
+
+
+def insert_request(schema, fields_info, columns):
+    entities = DataPrepare.prepare_insert_data(columns, schema)
+    RequestPrepare.batch_insert_param('c', entities, None, fields_info)
+
+
+def packed_column(vectors):
+    packed = pack_float_vectors(vectors)
+    return np.frombuffer(packed.buffer, dtype=np.float32).reshape(-1, packed.dim)
+
+
+def layouts(vectors):
+    # 每种格式给出一个函数，返回交给 pymilvus 的数据；tolist 包括转换本身的耗时
+    packed = [array('f', vector) for vector in vectors]
+    matrix = np.array(vectors, dtype=np.float32)
+    return {
+        'list': lambda: vectors,
+        'array': lambda: packed,
+        'tolist': lambda: [vector.tolist() for vector in packed],
+        'numpy': lambda: list(matrix),
+    }
+
+
+def report(request, rows, dim, name, elapsed):
+    ms = 'rejected' if elapsed is None else '%.2f' % (elapsed * 1000)
+    print('%-8s %-6d %-6d %-8s %10s' % (request, rows, dim, name, ms))
+
+
+def main():
+    print('%-8s %-6s %-6s %-8s %10s' % ('request', 'rows', 'dim', 'layout', 'ms'))
+    for nq, dim in [(1, 768), (100, 768), (1000, 128)]:
+        vectors = [[random.random() for _ in range(dim)] for _ in range(nq)]
+        for name, data in layouts(vectors).items():
+            report('search', nq, dim, name, timed(lambda: search_request(data())))
+
+    for rows, dim in [(1000, 128), (100, 768)]:
+        schema = CollectionSchema([FieldSchema('id', DataType.INT64, is_primary=True),
+                                   FieldSchema('v', DataType.FLOAT_VECTOR, dim=dim)])
+        fields_info = schema.to_dict()['fields']
+        ids = list(range(rows))
+        vectors = [[random.random() for _ in range(dim)] for _ in range(rows)]
+        report('insert', rows, dim, 'list', timed(lambda: insert_request(schema, fields_info, [ids, vectors])))
+        report('insert', rows, dim, 'packed', timed(lambda: insert_request(schema, fields_info, [ids, packed_column(vectors)])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Per-dispatch cost of reading the configuration in caller/, before and after
+caller.settings. No Milvus server needed.
+
+    python -m benchmarks.bench_settings
+
+"before" is what every call_query() did until then: a new ConfigParser that
+reads config.ini and looks the options up one by one. "after" is
+get_settings() and the attribute reads, with the usual mtime check once per
+second, and "after, check" stats the file on every call (CHECK_INTERVAL = 0).
+"""
+import argparse
+import os
+import sys
+import time
+from configparser import ConfigParser
+
+from caller import settings as settings_module
+from caller.settings import get_settings
+
+CONFIG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.ini')
+
+
+def before():
+    # call_query 原来的读取方式
+    configur = ConfigParser()
+    configur.read(CONFIG)
+    section = 'Connection'
+    using = configur.get(section, 'alias')
+    timeout = None
+    consistency_level = 'Bounded'
+    in_chunk_size = 10000
+    max_workers = 4
+    section = 'Query'
+    if 'timeout' in configur[section]:
+        timeout = configur.getfloat(section, 'timeout')
+    if 'consistency_level' in configur[section]:
+        consistency_level = configur.get(section, 'consistency_level')
+    if 'in_chunk_size' in configur[section]:
+        in_chunk_size = configur.getint(section, 'in_chunk_size')
+    if 'max_workers' in configur[section]:
+        max_workers = configur.getint(section, 'max_workers')
+    return using, timeout, consistency_level, in_chunk_size, max_workers
+
+
+def after():
+    settings = get_settings(CONFIG)
+    using = settings.connection.alias
+    timeout = settings.query.timeout
+    consistency_level = settings.query.consistency_level
+    in_chunk_size = settings.query.in_chunk_size
+    max_workers = settings.query.max_workers
+    return using, timeout, consistency_level, in_chunk_size, max_workers
+
+
+def per_call(func, min_time, rounds=5):
+    # 取多轮中最快的一轮
+    best = None
+    for _ in range(rounds):
+        runs = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while runs == 0 or elapsed < min_time / rounds:
+            func()
+            runs += 1
+            elapsed = time.perf_counter() - start
+        best = elapsed / runs if best is None else min(best, elapsed / runs)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds per case, default %(default)s')
+    args = parser.parse_args(argv)
+
+    assert before() == after()
+    base = per_call(before, args.min_time)
+    results = [('before', base), ('after', per_call(after, args.min_time))]
+    interval = settings_module.CHECK_INTERVAL
+    settings_module.CHECK_INTERVAL = 0.0
+    try:
+        results.append(('after, check', per_call(after, args.min_time)))
+    finally:
+        settings_module.CHECK_INTERVAL = interval
+
+    print('%-14s %12s %10s' % ('case', 'us / call', 'speedup'))
+    for name, seconds in results:
+        print('%-14s %12.2f %9.0fx' % (name, seconds * 1e6, base / seconds))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Cold start: import time of sqlparser and caller.caller in a fresh
+interpreter, and what building the tables at import time would cost.
+
+    python -m benchmarks.bench_startup
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT = '''
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+'''
+
+# 不使用预生成的分析表，相当于每次启动都重新生成
+BUILD = '''
+import time
+from ply import lex, yacc
+from sqlparser import lexer, grammar
+start = time.perf_counter()
+lex.lex(module=lexer, optimize=False)
+yacc.yacc(module=grammar, write_tables=False, tabmodule='_no_such_tab', debug=False)
+print(time.perf_counter() - start)
+'''
+
+
+def run(code):
+    times = []
+    for _ in range(RUNS):
+        proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return None
+        times.append(float(proc.stdout.split()[-1]))
+    return statistics.median(times)
+
+
+def main():
+    print('%-36s %12s' % ('', 'median (ms)'))
+    for name, code in [('import sqlparser', IMPORT.format(module='sqlparser')),
+                       ('import caller.caller', IMPORT.format(module='caller.caller')),
+                       ('build tables without lextab/parsetab', BUILD)]:
+        seconds = run(code)
+        print('%-36s %12s' % (name, 'unavailable' if seconds is None else '%.1f' % (seconds * 1000)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Parse throughput with 1..N threads calling sqlparser.parse concurrently.
+
+    python -m benchmarks.bench_threads
+
+Per-thread lexer and parser instances make parse() safe to call from
+several threads without an external lock; they do not make it faster. The
+parser is pure Python and the GIL serializes it, so total throughput does
+not grow with the thread count and drops under contention (about 17.6k
+statements/s with one thread, 10.9k with eight on the machine this was
+written on). Use processes to parse in parallel.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlparser import parse, set_cache_size
+
+STATEMENTS = 20000
+
+
+def statement(i):
+    return (f'select book_id, word_count from book{i % 97} limit 10 offset {i % 7} '
+            f'with {{"expr": "word_count >= {i} and book_id in [1, 2, 3]"}};')
+
+
+def run(threads, sqls):
+    chunk = (len(sqls) + threads - 1) // threads
+    parts = [sqls[i:i + chunk] for i in range(0, len(sqls), chunk)]
+
+    def work(part):
+        for sql in part:
+            parse(sql)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(work, parts))
+    return time.perf_counter() - start
+
+
+def main():
+    # 关闭缓存，测量的是解析本身
+    set_cache_size(0)
+    sqls = [statement(i) for i in range(STATEMENTS)]
+    print('%-8s %10s %16s' % ('threads', 'seconds', 'statements/s'))
+    for threads in sorted({1, 2, 4, 8, os.cpu_count() or 1}):
+        elapsed = run(threads, sqls)
+        print('%-8d %10.3f %16.0f' % (threads, elapsed, len(sqls) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
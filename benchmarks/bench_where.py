@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Parse time of WHERE clauses with 1k/10k/100k OR/AND terms, like the
+predicates generated from ACL lists. The time per term should stay flat
+as the number of terms grows. The last columns give the memory held by the
+parse result, with only the rendered expression (the default) and with the
+tree kept by parse(sql, tree=True).
+
+    python -m benchmarks.bench_where
+"""
+import time
+import tracemalloc
+
+from sqlparser import parse, set_cache_size
+
+
+def acl_sql(terms):
+    # (owner == "u1" and level >= 1) or (owner == "u2" and level >= 2) or ...
+    pairs = ' or '.join(f'(owner = "u{i}" and level >= {i % 5})' for i in range(terms // 2))
+    return f'select doc_id from docs where {pairs};'
+
+
+def flat_sql(terms):
+    return 'delete from docs where ' + ' or '.join(f'doc_id = {i}' for i in range(terms)) + ';'
+
+
+def retained(sql, tree):
+    # 解析结果仍在引用的内存，不包括解析过程中的临时对象
+    tracemalloc.start()
+    query = parse(sql, tree=tree)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del query
+    return size
+
+
+def main():
+    set_cache_size(0)
+    print('%-6s %-8s %12s %10s %16s %12s %12s' % ('shape', 'terms', 'expr (KB)', 'seconds', 'us / term',
+                                                  'held (KB)', 'tree (KB)'))
+    for name, build in [('acl', acl_sql), ('flat', flat_sql)]:
+        for terms in (1000, 10000, 100000):
+            sql = build(terms)
+            start = time.perf_counter()
+            query = parse(sql)
+            elapsed = time.perf_counter() - start
+            print('%-6s %-8d %12.0f %10.3f %16.2f %12.0f %12.0f' % (
+                name, terms, len(query['expr']) / 1024, elapsed, elapsed / terms * 1e6,
+                retained(sql, False) / 1024, retained(sql, True) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+asyncio counterpart of caller.execute.
+
+    from caller.async_caller import execute
+
+    results = await asyncio.gather(*(execute(parse(sql, tree=True)) for sql in statements))
+
+Every statement is dispatched through func_map on a dedicated thread pool,
+so the event loop is never blocked by a Milvus request. At most
+max_concurrency statements ([Executor] in config.ini) run at the same time,
+the others wait in the event loop without holding a thread. Cancelling the
+awaiting task does not interrupt a request already sent.
+"""
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from caller.caller import func_map
+from caller.settings import get_settings
+from sqlparser.prepared import PreparedStatement
+
+_lock = threading.Lock()
+_executor = None
+# asyncio.Semaphore 只能在一个事件循环中使用，每个循环一个
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=get_settings().executor.max_concurrency,
+                                           thread_name_prefix='milvus')
+        return _executor
+
+
+def _get_semaphore(loop):
+    with _lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _semaphores[loop] = asyncio.Semaphore(get_settings().executor.max_concurrency)
+        return semaphore
+
+
+async def execute(query, params=None):
+    """
+    Run one statement, a parsed dict or a prepared statement, and return
+    what the synchronous caller returns.
+    """
+    if isinstance(query, PreparedStatement):
+        query = query.bind(params)
+    func = func_map[query['type']]
+    loop = asyncio.get_running_loop()
+    async with _get_semaphore(loop):
+        return await loop.run_in_executor(_get_executor(), func, query)
+
+
+def shutdown(wait=True):
+    """
+    Stop the thread pool, the next execute() starts a new one with the
+    current max_concurrency.
+    """
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
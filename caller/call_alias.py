@@ -1,59 +1,50 @@
-from pymilvus import utility, Collection
-from configparser import ConfigParser 
+from pymilvus import utility
+from caller.settings import get_settings
+from caller.handles import get_collection, invalidate
 
 def create_alias(query):
     collection_name = query['coll']
     alias = query['alias']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Alias'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.alias.timeout
 
     if timeout is None:
         utility.create_alias(collection_name=collection_name, alias=alias, using=using)
     else:
         utility.create_alias(collection_name=collection_name, alias=alias, using=using, timeout=timeout)
+    invalidate(using, alias)
         
 def drop_alias(query):
     alias = query['alias']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Alias'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.alias.timeout
 
     if timeout is None:
         utility.drop_alias(alias=alias, using=using)
     else:
         utility.drop_alias(alias=alias, using=using, timeout=timeout)
+    invalidate(using, alias)
         
 def show_alias(query):
     collection_name = query['coll']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
     alias_list = None
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     alias_list = [alias for alias in collection.aliases]
     
     # print output
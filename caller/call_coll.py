@@ -1,19 +1,15 @@
 from pymilvus import CollectionSchema, FieldSchema, utility, Collection, DataType
-from configparser import ConfigParser
+from caller.settings import get_settings
+from caller.handles import get_collection, put_collection, invalidate
 
 
 def show_coll(query):
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.collection.timeout
 
     collection_list = None
     collection_names = []
@@ -34,22 +30,19 @@ def show_coll(query):
 def drop_coll(query):
     collection_name = query['name']
 
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.collection.timeout
 
     if timeout is None:
         utility.drop_collection(collection_name=collection_name, using=using)
     else:
         utility.drop_collection(collection_name=collection_name, using=using, timeout=timeout)
+    # 别名也可能指向这个 collection，清空这个连接的全部缓存
+    invalidate(using)
 
 
 def rename_coll(query):
@@ -57,17 +50,12 @@ def rename_coll(query):
     new_collection_name = query['new_coll']
     new_db_name = query['new_db']
 
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.collection.timeout
 
     if timeout is None:
         utility.rename_collection(old_collection_name=old_collection_name, new_collection_name=new_collection_name,
@@ -75,6 +63,7 @@ def rename_coll(query):
     else:
         utility.rename_collection(old_collection_name=old_collection_name, new_collection_name=new_collection_name,
                                   new_db_name=new_db_name, using=using, timeout=timeout)
+    invalidate(using)
 
 
 def load_coll(query):
@@ -83,25 +72,16 @@ def load_coll(query):
     if 'replica_number' in query:
         replica_number = query['replica_number']
 
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
-
-    timeout = None
-    _async = False
-    _refresh = False
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
-    if '_async' in configur[section]:
-        _async = configur.getboolean(section, '_async')
-    if '_refresh' in configur[section]:
-        _refresh = configur.getboolean(section, '_refresh')
-
-    collection = Collection(collection_name, using=using)
+    using = settings.connection.alias
+
+    timeout = settings.collection.timeout
+    _async = settings.collection._async
+    _refresh = settings.collection._refresh
+
+    collection = get_collection(collection_name, using)
     if timeout is None:
         collection.load(replica_number=replica_number, _async=_async, _refresh=_refresh)
     else:
@@ -111,19 +91,14 @@ def load_coll(query):
 def release_coll(query):
     collection_name = query['name']
 
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.collection.timeout
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     if timeout is None:
         collection.release()
     else:
@@ -133,19 +108,14 @@ def release_coll(query):
 def compact_coll(query):
     collection_name = query['name']
 
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.collection.timeout
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     if timeout is None:
         collection.compact()
     else:
@@ -181,17 +151,12 @@ def create_coll(query):
     field_dicts = [str_to_dtype_for_field(item) for item in query['fields']]
     collection_name = query['name']
 
-    configur = ConfigParser()
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Collection'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.collection.timeout
 
     # convert field dict to FieldSchema
     # pymilvus的construct_from_dict不能将vector的dim、array的max_capacity、varchar的max_length解析，这里分开处理
@@ -232,4 +197,5 @@ def create_coll(query):
     collection = Collection(name=collection_name, schema=schema, using=using,
                             num_shards=query['params'].get('num_shards', 1),
                             num_partitions=query['params'].get('num_partitions', None),
-                            timeout=timeout)
\ No newline at end of file
+                            timeout=timeout)
+    put_collection(collection_name, using, collection)
@@ -0,0 +1,8 @@
+from caller.settings import reload_settings
+
+
+def reload_config(query):
+    # 连接参数 (host, port 等) 在下一次 connect 时才生效
+    settings = reload_settings()
+    print('config reloaded from ' + settings.path)
+    return settings
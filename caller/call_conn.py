@@ -1,50 +1,51 @@
 from pymilvus import connections
-from configparser import ConfigParser 
+from caller.settings import get_settings
+from caller.handles import invalidate
+from caller.pool import build_pool, get_pool, set_pool
 from pymilvus.exceptions import MilvusException
 
 
 def connect():
-    configur = ConfigParser() 
-    configur.read('config.ini')
-    section = 'Connection'
+    settings = get_settings()
 
     # optional arguments
-    user = None
-    password = None
-    if 'user' in configur[section]:
-        user = configur.get(section, 'user')
-    if 'password' in configur[section]:
-        password = configur.get(section, 'password')
-
-    # necessary arguments
-    alias = configur.get(section, 'alias')
-    host = configur.get(section, 'host')
-    port = configur.get(section, 'port')
-
-    if user is None or password is None:
-        connections.connect(
-            alias = alias,
-            host = host,
-            port = port
-        )
-    else:
-        connections.connect(
-            alias = alias,
-            user = user,
-            password = password,
-            host = host,
-            port = port
-        )
+    user = settings.connection.user
+    password = settings.connection.password
+
+    # 每个 endpoint 建立 pool_size 个连接，第一个连接的 alias 为配置的 alias
+    pool = build_pool(settings)
+    for member in pool.members:
+        # necessary arguments
+        alias = member.alias
+        host = member.host
+        port = member.port
+
+        if user is None or password is None:
+            connections.connect(
+                alias = alias,
+                host = host,
+                port = port
+            )
+        else:
+            connections.connect(
+                alias = alias,
+                user = user,
+                password = password,
+                host = host,
+                port = port
+            )
+    set_pool(pool)
+    # 新的连接可能指向另一个服务或 database
+    invalidate(pool.primary)
     
 
 def disconnect():
-    configur = ConfigParser() 
-    configur.read('config.ini')
-    section = 'Connection'
-
-    # necessary arguments
-    alias = configur.get(section, 'alias')
+    pool = get_pool()
+    # 清空缓存需要在连接池移除之前，才能找到池中所有的连接
+    invalidate(pool.primary)
 
-    connections.disconnect(
-        alias = alias
-    )
\ No newline at end of file
+    for alias in pool.aliases:
+        connections.disconnect(
+            alias = alias
+        )
+    set_pool(None)
@@ -1,20 +1,17 @@
-from configparser import ConfigParser 
+from caller.settings import get_settings
+from caller.handles import invalidate
+from caller.pool import get_pool
 from pymilvus import db
 
 def create_db(query):
     db_name = query['name']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Database'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.database.timeout
 
     if timeout is None:
         db.create_database(db_name=db_name, using=using)
@@ -24,27 +21,24 @@ def create_db(query):
 def use_db(query):
     db_name = query['name']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    db.using_database(db_name=db_name, using=using)
+    # 连接池中的每个连接都切换 database
+    for alias in get_pool().aliases:
+        db.using_database(db_name=db_name, using=alias)
+    # collection 的名字属于 database，切换后缓存的对象都不再对应
+    invalidate(using)
 
 def show_db(query):
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Database'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.database.timeout
     
     db_list = None
     if timeout is None:
@@ -61,19 +55,15 @@ def show_db(query):
 def drop_db(query):
     db_name = query['name']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Database'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.database.timeout
 
     if timeout is None:
         db.drop_database(db_name=db_name, using=using)
     else:
-        db.drop_database(db_name=db_name, using=using, timeout=timeout)
\ No newline at end of file
+        db.drop_database(db_name=db_name, using=using, timeout=timeout)
+    invalidate(using)
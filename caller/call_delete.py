@@ -1,7 +1,15 @@
-from pymilvus import Collection
-from configparser import ConfigParser 
+from concurrent.futures import ThreadPoolExecutor
+
+from caller.settings import get_settings
+from caller.handles import get_collection
+
+from sqlparser.chunking import chunk_expr
 
 def delete(query):
+    if query.get('always_false'):
+        # 条件恒为假，没有要删除的行，不发送请求
+        print('delete 0 rows')
+        return
     count = None
     collection_name = query['coll_name']
     partition_name = None
@@ -9,21 +17,28 @@ def delete(query):
         partition_name = query['part_name']
     expr = query['expr']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Delete'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.delete.timeout
+    in_chunk_size = settings.delete.in_chunk_size
+    max_workers = settings.delete.max_workers
     
-    collection = Collection(name=collection_name, using=using)
-    if timeout is None:
-        count = collection.delete(expr=expr, partition_name=partition_name).delete_count
+    collection = get_collection(collection_name, using)
+
+    def run(expr):
+        if timeout is None:
+            return collection.delete(expr=expr, partition_name=partition_name).delete_count
+        else:
+            return collection.delete(expr=expr, partition_name=partition_name, timeout=timeout).delete_count
+
+    # 很长的 in 列表拆分成多个请求并行执行，删除的行数相加
+    exprs = chunk_expr(query.get('where'), in_chunk_size)
+    if exprs is None:
+        count = run(expr)
     else:
-        count = collection.delete(expr=expr, partition_name=partition_name, timeout=timeout).delete_count
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            count = sum(executor.map(run, exprs))
     print('delete ' + str(count) + ' rows')
\ No newline at end of file
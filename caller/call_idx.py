@@ -1,5 +1,6 @@
-from pymilvus import Collection, DataType
-from configparser import ConfigParser 
+from pymilvus import DataType
+from caller.settings import get_settings
+from caller.handles import get_collection
 
 def create_idx(query):
     index_name = query['idx']
@@ -10,19 +11,14 @@ def create_idx(query):
         index_params = query['params']
     print(index_params)
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Index'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.index.timeout
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     # check field type, vector field only support vector index, scalar field only support scalar index
     is_vector = False
     for field in collection.schema.fields:
@@ -45,19 +41,14 @@ def drop_idx(query):
     collection_name = query['coll']
     index_name = query['idx']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Index'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.index.timeout
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     if timeout is None:
         collection.drop_index(index_name=index_name)
     else:
@@ -66,15 +57,13 @@ def drop_idx(query):
 def show_idx(query):
     collection_name = query['coll']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
     index_list = None
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     index_list = [index.index_name + ' : ' + ('scalar index' if len(index.params) == 0 else 'vector index') for index in collection.indexes]
     
     # print output
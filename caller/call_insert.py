@@ -1,5 +1,32 @@
-from pymilvus import Collection, DataType, utility
-from configparser import ConfigParser 
+from array import array
+
+from pymilvus import DataType, utility
+from caller.settings import get_settings
+from caller.handles import get_collection
+from sqlparser.columnar import to_rows
+
+
+def _column_data(collection, query):
+    # 按行的数据直接交给pymilvus
+    if 'columns' not in query:
+        return query['data']
+
+    columns = query['columns']
+    fields = [field for field in collection.schema.fields
+              if not field.auto_id and not getattr(field, 'is_dynamic', False)]
+    # 列式插入需要按schema的顺序给出所有field，动态field只能按行插入
+    if set(columns) != set(field.name for field in fields):
+        return to_rows(columns, query['num_rows'])
+
+    data = []
+    for field in fields:
+        column = columns[field.name]
+        # pymilvus 对 ndarray 调用 tolist() 再逐个向量序列化，交给它列表最快；
+        # 只有 float vector 列中的 F32'...' 字面量 (array('f')) 需要转换，其他列保持原来的值
+        if field.dtype == DataType.FLOAT_VECTOR:
+            column = [vector.tolist() if isinstance(vector, array) else vector for vector in column]
+        data.append(column)
+    return data
 
 def bulk_insert(query):
     collection_name = query['coll']
@@ -8,17 +35,12 @@ def bulk_insert(query):
     if 'part' in query:
         partition_name = query['part']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Insert'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.insert.timeout
 
     if timeout is None:
         for file in files:
@@ -31,24 +53,19 @@ def insert(query):
     count = None
     collection_name = query['coll_name']
     partition_name = None
-    data = query['data']
     if 'part_name' in query:
         partition_name = query['part_name']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
+
+    timeout = settings.insert.timeout
 
-    timeout = None
-    section = 'Insert'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    collection = get_collection(collection_name, using)
+    data = _column_data(collection, query)
 
-    collection = Collection(name=collection_name, using=using)
-        
     if timeout is None:
         count = collection.insert(data=data, partition_name=partition_name).insert_count
     else:
@@ -63,24 +80,19 @@ def upsert(query):
     count = None
     collection_name = query['coll_name']
     partition_name = None
-    data = query['data']
     if 'part_name' in query:
         partition_name = query['part_name']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
+
+    timeout = settings.insert.timeout
 
-    timeout = None
-    section = 'Insert'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    collection = get_collection(collection_name, using)
+    data = _column_data(collection, query)
 
-    collection = Collection(name=collection_name, using=using)
-        
     if timeout is None:
         count = collection.upsert(data=data, partition_name=partition_name).upsert_count
     else:
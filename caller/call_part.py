@@ -1,5 +1,6 @@
-from pymilvus import Collection, Partition
-from configparser import ConfigParser 
+from pymilvus import Partition
+from caller.settings import get_settings
+from caller.handles import get_collection
 
 def create_part(query):
     collection_name = query['coll']
@@ -8,28 +9,24 @@ def create_part(query):
     if 'description' in query:
         description = query['description']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     collection.create_partition(partition_name=partition_name, description=description)
     
 def show_part(query):
     collection_name = query['coll']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
     partition_list = None
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     # partition_list = [partition.name + ' --- ' + partition.description for partition in collection.partitions]
     partition_list = [partition.name for partition in collection.partitions]
 
@@ -43,19 +40,14 @@ def drop_part(query):
     collection_name = query['coll']
     partition_name = query['part']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Partition'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.partition.timeout
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     if timeout is None:
         collection.drop_partition(partition_name=partition_name)
     else:
@@ -68,25 +60,16 @@ def load_part(query):
     if 'replica_number' in query:
         replica_number = query['replica_number']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using -- connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    _async = False
-    _refresh = False
-    section = 'Partition'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
-    if '_async' in configur[section]:
-        _async = configur.getboolean(section, '_async')
-    if '_refresh' in configur[section]:
-        _refresh = configur.getboolean(section, '_refresh')
+    timeout = settings.partition.timeout
+    _async = settings.partition._async
+    _refresh = settings.partition._refresh
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     if timeout is None:
         collection.load(partition_names=partition_names, replica_number=replica_number, _async=_async, _refresh=_refresh)
     else:
@@ -96,19 +79,14 @@ def release_part(query):
     collection_name = query['coll']
     partition_names = query['parts']
     
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    section = 'Partition'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
+    timeout = settings.partition.timeout
 
-    collection = Collection(collection_name, using=using)
+    collection = get_collection(collection_name, using)
     for name in partition_names:
         partition = Partition(collection=collection, name=name)
         if timeout is None:
@@ -1,21 +1,25 @@
-from pymilvus import Collection
-from configparser import ConfigParser 
+from concurrent.futures import ThreadPoolExecutor
+
+from caller.settings import get_settings
+from caller.handles import get_collection
+from caller.pool import get_pool
+
+from sqlparser.chunking import chunk_expr
 
 def query(query):
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    if query.get('always_false'):
+        # 条件恒为假，不发送请求；count(*) 的结果为 0
+        result_list = [{'count(*)': 0}] if 'count(*)' in query['fields'] else []
+        for result in result_list:
+            print(result)
+        return result_list
 
-    # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    settings = get_settings()
 
-    timeout = None
-    consistency_level = 'Bounded'  # (Strong, Bounded, Session, Eventually), default: Bounded
-    section = 'Query'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
-    if 'consistency_level' in configur[section]:
-        consistency_level = configur.get(section, 'consistency_level')
+    timeout = settings.query.timeout
+    consistency_level = settings.query.consistency_level  # (Strong, Bounded, Session, Eventually), default: Bounded
+    in_chunk_size = settings.query.in_chunk_size
+    max_workers = settings.query.max_workers
 
     collection_name = query['coll_name']
     field_list = query['fields']
@@ -27,16 +31,35 @@ def query(query):
 
     result_list = None
     output_fields = None # set this list according to field_list
-    collection = Collection(collection_name, using=using)
     output_fields = field_list
+    pool = get_pool()
 
-    if timeout is None:
-        result_list = collection.query(expr=expr, output_fields=output_fields, partition_names=partition_names,
-                                       limit=limit, offset=offset, consistency_level=consistency_level)
+    def run(expr):
+        # using is connection alias，每个请求选择连接池中未完成请求最少的连接
+        with pool.using() as using:
+            collection = get_collection(collection_name, using)
+            if timeout is None:
+                return collection.query(expr=expr, output_fields=output_fields, partition_names=partition_names,
+                                        limit=limit, offset=offset, consistency_level=consistency_level)
+            else:
+                return collection.query(expr=expr, output_fields=output_fields, partition_names=partition_names, timeout=timeout, 
+                                        limit=limit, offset=offset, consistency_level=consistency_level)
+
+    # 很长的 in 列表拆分成多个请求并行执行；有 offset 时各分块的结果无法合并，不拆分
+    exprs = chunk_expr(query.get('where'), in_chunk_size) if offset is None else None
+    if exprs is None:
+        result_list = run(expr)
     else:
-        result_list = collection.query(expr=expr, output_fields=output_fields, partition_names=partition_names, timeout=timeout, 
-                                       limit=limit, offset=offset, consistency_level=consistency_level)
-        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunks = list(executor.map(run, exprs))
+        if output_fields == ['count(*)']:
+            result_list = [{'count(*)': sum(chunk[0]['count(*)'] for chunk in chunks)}]
+        else:
+            # 每一行只会出现在一个分块中，直接拼接
+            result_list = [result for chunk in chunks for result in chunk]
+            if limit is not None:
+                result_list = result_list[:limit]
+
     for result in result_list:
         print(result)
 
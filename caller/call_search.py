@@ -1,30 +1,59 @@
-from pymilvus import Collection, DataType
-from configparser import ConfigParser 
+from array import array
+
+import numpy as np
+from pymilvus import DataType
+from caller.settings import get_settings
+from caller.handles import get_collection
+from caller.pool import get_pool
+
+def _open_vectors(path):
+    # 以内存映射的方式打开向量文件，返回二维数组，不把整个矩阵读进内存
+    if path.endswith('.npy'):
+        vectors = np.load(path, mmap_mode='r')
+        return vectors.reshape(1, -1) if vectors.ndim == 1 else vectors
+    if path.endswith('.fvecs'):
+        # 每行为 int32 的维度 d，后面跟 d 个 float32
+        raw = np.memmap(path, dtype=np.int32, mode='r')
+        dim = int(raw[0]) if raw.size else 0
+        if dim <= 0 or raw.size % (dim + 1) != 0:
+            raise ValueError(f'{path} is not a valid .fvecs file')
+        return raw.reshape(-1, dim + 1)[:, 1:].view(np.float32)
+    if path.endswith('.bvecs'):
+        # 每行为 int32 的维度 d，后面跟 d 个 uint8
+        raw = np.memmap(path, dtype=np.uint8, mode='r')
+        dim = int(raw[:4].view(np.int32)[0]) if raw.size >= 4 else 0
+        if dim <= 0 or raw.size % (dim + 4) != 0:
+            raise ValueError(f'{path} is not a valid .bvecs file')
+        return raw.reshape(-1, dim + 4)[:, 4:]
+    raise ValueError(f'unsupported vector file {path}, use .npy, .fvecs or .bvecs')
+
+def _file_batches(ref, binary, batch_size):
+    vectors = _open_vectors(ref['file'])[ref['start']:ref['stop']]
+    # 每次只把一个批次转换成 float 列表 (binary vector 为 bytes)；
+    # pymilvus 用 struct.pack(*v) 序列化每个向量，逐个取 numpy 标量比 Python 的列表慢得多
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size]
+        if binary:
+            yield [row.tobytes() for row in np.ascontiguousarray(batch, dtype=np.uint8)]
+        else:
+            yield np.asarray(batch, dtype=np.float32).tolist()
 
 def search(query):
-    configur = ConfigParser() 
-    configur.read('config.ini')
+    if query.get('always_false'):
+        # 条件恒为假，不发送请求
+        return []
+
+    settings = get_settings()
 
     # using is connection alias
-    section = 'Connection'
-    using = configur.get(section, 'alias')
+    using = settings.connection.alias
 
-    timeout = None
-    consistency_level = 'Bounded'  # (Strong, Bounded, Session, Eventually), default: Bounded
-    _async = False
-    _callback = False
-    round_decimal = -1
-    section = 'Search'
-    if 'timeout' in configur[section]:
-        timeout = configur.getfloat(section, 'timeout')
-    if 'consistency_level' in configur[section]:
-        consistency_level = configur.get(section, 'consistency_level')
-    if '_async' in configur[section]:
-        _async = configur.getboolean(section, '_async')
-    if '_callback' in configur[section]:
-        _callback = configur.getboolean(section, '_callback')
-    if 'round_decimal' in configur[section]:
-        round_decimal = configur.getint(section, 'round_decimal')
+    timeout = settings.search.timeout
+    consistency_level = settings.search.consistency_level  # (Strong, Bounded, Session, Eventually), default: Bounded
+    _async = settings.search._async
+    _callback = settings.search._callback
+    round_decimal = settings.search.round_decimal
+    batch_size = settings.search.batch_size
     param = query['param']
 
     collection_name = query['coll_name']
@@ -39,41 +68,47 @@ def search(query):
     result_dict_list = []
     output_fields = [] # set this list according to field_list
     
-    collection = Collection(collection_name, using=using)
     output_fields = field_list
+    pool = get_pool()
 
-    # for binary vector
-    new_data = []
-    for vector in data:
-        all_int = True
-        for num in vector:
-            if not isinstance(num, int):
-                all_int = False
-                break
-        if all_int:
-            new_data.append(bytes(vector))
-        else:
-            new_data.append(vector)
-    data = new_data
-
-    if timeout is None:
-        result = collection.search(data=data, anns_field=anns_field, param=param, limit=limit, expr=expr, 
-                                   partition_names=partition_names, output_fields=output_fields, round_decimal=round_decimal,
-                                   consistency_level=consistency_level, _async=_async, _callback=_callback)
+    if isinstance(data, dict):
+        # FILE '...'：按 batch_size 分批搜索，anns field 为 binary vector 时每行转换为 bytes
+        binary = any(field.name == anns_field and field.dtype == DataType.BINARY_VECTOR
+                     for field in get_collection(collection_name, using).schema.fields)
+        batches = _file_batches(data, binary, batch_size)
+    # 解析时保证了同一次搜索的向量类型一致：float vector 为 array('f')，pymilvus 不接受 array，
+    # 转换回 Python 的列表 (见 benchmarks/bench_pymilvus_payload.py)；
+    # binary vector (包括 X'..'/B64'..' 字面量) 已是 bytes，原样交给 pymilvus
+    elif data and isinstance(data[0], array):
+        batches = [[vector.tolist() for vector in data]]
     else:
-        result = collection.search(data=data, anns_field=anns_field, param=param, limit=limit, expr=expr, 
-                                   partition_names=partition_names, output_fields=output_fields, round_decimal=round_decimal,
-                                   timeout=timeout, consistency_level=consistency_level, _async=_async, _callback=_callback)
+        batches = [data]
+
+    results = []
+    for data in batches:
+        # 每个批次选择连接池中未完成请求最少的连接
+        with pool.using() as read_using:
+            collection = get_collection(collection_name, read_using)
+            if timeout is None:
+                result = collection.search(data=data, anns_field=anns_field, param=param, limit=limit, expr=expr, 
+                                           partition_names=partition_names, output_fields=output_fields, round_decimal=round_decimal,
+                                           consistency_level=consistency_level, _async=_async, _callback=_callback)
+            else:
+                result = collection.search(data=data, anns_field=anns_field, param=param, limit=limit, expr=expr, 
+                                           partition_names=partition_names, output_fields=output_fields, round_decimal=round_decimal,
+                                           timeout=timeout, consistency_level=consistency_level, _async=_async, _callback=_callback)
+        results.append(result)
 
-    for hits in result:
-        for hit in hits:
-            # get the value of an output field specified in the search request.
-            # dynamic fields are supported, but vector fields are not supported yet.    
-            result_dict = {'pk': hit.entity.pk, 'score': hit.entity.score}
-            result_dict = result_dict | hit.fields
-            result_dict_list.append(result_dict)
+        for hits in result:
+            for hit in hits:
+                # get the value of an output field specified in the search request.
+                # dynamic fields are supported, but vector fields are not supported yet.    
+                result_dict = {'pk': hit.entity.pk, 'score': hit.entity.score}
+                result_dict = result_dict | hit.fields
+                result_dict_list.append(result_dict)
     
     for result_dict in result_dict_list:
         print(result_dict)
 
-    return result
+    # 返回每个查询向量的 Hits，按查询向量的顺序；从文件分批搜索时各批次的结果依次拼接
+    return [hits for result in results for hits in result]
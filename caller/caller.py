@@ -8,6 +8,8 @@ from caller.call_insert import *
 from caller.call_delete import *
 from caller.call_query import *
 from caller.call_search import *
+from caller.call_config import *
+from sqlparser.prepared import PreparedStatement
 
 func_map = {
     'connect' : connect,
@@ -39,5 +41,13 @@ func_map = {
     'upsert' : upsert,
     'delete' : delete,
     'query' : query,
-    'search' : search
+    'search' : search,
+    'reload_config' : reload_config
 }
+
+
+def execute(query, params=None):
+    # query 可以是 parse 得到的字典，也可以是 prepare 得到的预编译语句
+    if isinstance(query, PreparedStatement):
+        query = query.bind(params)
+    return func_map[query['type']](query)
@@ -0,0 +1,92 @@
+"""
+Cache of pymilvus Collection handles per connection.
+
+Collection(name, using=...) sends a describe-collection request and keeps
+the schema; the handle is reused by every later statement on the same
+collection, so inserts and searches send only their own request. Statements
+that change what a name refers to (create/drop/rename collection, aliases,
+use/drop database, connect/disconnect) call invalidate(). Changes made by
+other clients are picked up after cache_ttl seconds of [Collection] in
+config.ini; cache_ttl = 0 disables the cache.
+"""
+import threading
+import time
+
+from caller.settings import get_settings
+from caller.pool import get_pool
+
+
+class HandleCache:
+    """
+    Thread-safe map of (connection alias, collection name) to the handle
+    returned by factory(name, using).
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._handles = dict()
+        # 每个连接的失效次数，用来丢弃创建期间已经失效的对象
+        self._generations = dict()
+
+    def get(self, name, using, ttl=None):
+        if ttl is not None and ttl <= 0:
+            return self._factory(name, using)
+        key = (using, name)
+        entry = self._handles.get(key)
+        now = time.monotonic()
+        if entry is not None and (ttl is None or now - entry[1] < ttl):
+            return entry[0]
+        generation = self._generations.get(using, 0)
+        handle = self._factory(name, using)
+        with self._lock:
+            if self._generations.get(using, 0) == generation:
+                self._handles[key] = (handle, now)
+        return handle
+
+    def put(self, name, using, handle):
+        with self._lock:
+            self._generations[using] = self._generations.get(using, 0) + 1
+            self._handles[(using, name)] = (handle, time.monotonic())
+
+    def invalidate(self, using, name=None):
+        """
+        Forget the handle of one name, or every handle of the connection.
+        """
+        with self._lock:
+            self._generations[using] = self._generations.get(using, 0) + 1
+            if name is not None:
+                self._handles.pop((using, name), None)
+            else:
+                for key in [key for key in self._handles if key[0] == using]:
+                    del self._handles[key]
+
+    def __len__(self):
+        return len(self._handles)
+
+
+def _open(name, using):
+    # 在这里导入，HandleCache 本身不依赖 pymilvus
+    from pymilvus import Collection
+    return Collection(name, using=using)
+
+
+_cache = HandleCache(_open)
+
+
+def get_collection(name, using):
+    return _cache.get(name, using, get_settings().collection.cache_ttl)
+
+
+def put_collection(name, using, collection):
+    # 刚创建的 collection，下一条语句不需要再请求
+    invalidate(using, name)
+    if get_settings().collection.cache_ttl != 0:
+        _cache.put(name, using, collection)
+
+
+def invalidate(using, name=None):
+    # DDL 在连接池的第一个连接上执行，池中其他连接缓存的对象同样失效
+    pool = get_pool()
+    for alias in pool.aliases if using in pool.aliases else [using]:
+        _cache.invalidate(alias, name)
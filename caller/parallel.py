@@ -0,0 +1,108 @@
+"""
+Run a sequence of statements with independent reads in parallel.
+
+    run_statements(split_statements(script), func_map, parallel=8)
+
+Consecutive SELECT/search and SHOW statements run on up to `parallel`
+threads. Every other statement (DDL, USE, INSERT, DELETE, ...) is a barrier:
+it runs alone, after all the statements before it finished and before any
+statement after it starts, so the results are those of running the script
+one statement at a time. What each statement prints, results and errors,
+is written in the order of the statements.
+"""
+import io
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from sqlparser import parse
+
+READ_TYPES = frozenset(['query', 'search', 'show_db', 'show_coll', 'show_alias', 'show_part', 'show_idx'])
+# 每个线程最多提前提交的语句数，限制保存在内存中的输出
+READ_AHEAD = 4
+
+_local = threading.local()
+
+
+class _Stdout:
+    # 执行语句的线程写入各自的缓冲区，其他线程照常输出
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = getattr(_local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def _captured_stdout():
+    stdout = sys.stdout
+    sys.stdout = _Stdout(stdout)
+    try:
+        yield stdout
+    finally:
+        sys.stdout = stdout
+
+
+def _execute(func_map, query):
+    # 出错时打印错误，与逐条执行时相同
+    try:
+        func_map[query['type']](query)
+    except Exception as result:
+        print('%s' % result)
+
+
+def _capture(func_map, query):
+    _local.buffer = io.StringIO()
+    try:
+        _execute(func_map, query)
+        return _local.buffer.getvalue()
+    finally:
+        _local.buffer = None
+
+
+def _done(text):
+    future = Future()
+    future.set_result(text)
+    return future
+
+
+def run_statements(statements, func_map, parallel=1):
+    """
+    Parse and execute SQL statements through func_map, up to parallel read
+    statements at a time. parallel <= 1 runs them one by one.
+    """
+    if parallel <= 1:
+        for sql in statements:
+            try:
+                _execute(func_map, parse(sql, tree=True))
+            except Exception as result:
+                print('%s' % result)
+        return
+
+    with _captured_stdout() as stdout, ThreadPoolExecutor(max_workers=parallel) as executor:
+        pending = deque()
+
+        def drain(limit=0):
+            # 按语句的顺序输出，前面的语句完成后立即输出，不等后面的
+            while len(pending) > limit:
+                stdout.write(pending.popleft().result())
+
+        for sql in statements:
+            try:
+                query = parse(sql, tree=True)
+            except Exception as result:
+                pending.append(_done('%s\n' % result))
+                continue
+            if query['type'] in READ_TYPES:
+                pending.append(executor.submit(_capture, func_map, query))
+                drain(parallel * READ_AHEAD)
+            else:
+                drain()
+                _execute(func_map, query)
+        drain()
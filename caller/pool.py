@@ -0,0 +1,190 @@
+"""
+Pool of pymilvus connections to several Milvus endpoints.
+
+connect() opens pool_size connections to every endpoint of [Connection] in
+config.ini. The first one keeps the configured alias and carries DDL and
+writes; query and search run on the member with the fewest outstanding
+requests:
+
+    with get_pool().using() as using:
+        get_collection(name, using).search(...)
+
+A member is ejected for eject_seconds when a request fails because its
+endpoint is unreachable, or when its average latency grows beyond
+slow_factor times the fastest other member. After that time it is health
+checked before it gets requests again. When every member is ejected the
+one that comes back first is used anyway.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+from caller.settings import get_settings
+
+# 平均延迟的平滑系数，以及判断是否过慢前至少需要的请求数
+ALPHA = 0.3
+MIN_SAMPLES = 5
+
+
+class Member:
+    __slots__ = ('alias', 'host', 'port', 'outstanding', 'latency', 'samples', 'ejected_until')
+
+    def __init__(self, alias, host, port):
+        self.alias = alias
+        self.host = host
+        self.port = port
+        self.outstanding = 0
+        self.latency = 0.0
+        self.samples = 0
+        self.ejected_until = None
+
+    def __repr__(self):
+        return f'Member({self.alias!r}, {self.host!r}, {self.port!r})'
+
+
+def _check(member):
+    # 在这里导入，Pool 本身不依赖 pymilvus
+    from pymilvus import utility
+    try:
+        utility.get_server_version(using=member.alias)
+        return True
+    except Exception:
+        return False
+
+
+def _unavailable(error):
+    from grpc import RpcError
+    from pymilvus.exceptions import MilvusUnavailableException
+    return isinstance(error, (MilvusUnavailableException, RpcError, ConnectionError, TimeoutError))
+
+
+class Pool:
+    """
+    Thread-safe least-outstanding-requests selection among members, the
+    first member is the primary one.
+    """
+
+    def __init__(self, members, eject_seconds=30.0, slow_factor=3.0, check=_check, unavailable=_unavailable):
+        self.members = list(members)
+        self.eject_seconds = eject_seconds
+        self.slow_factor = slow_factor
+        self._check = check
+        self._unavailable = unavailable
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self):
+        return self.members[0].alias
+
+    @property
+    def aliases(self):
+        return [member.alias for member in self.members]
+
+    def _readmit(self):
+        # 剔除时间已到的成员先做健康检查，通过后才重新分配请求；检查在锁外进行，
+        # 检查期间延长它的剔除时间，其他线程不会重复检查
+        now = time.monotonic()
+        with self._lock:
+            due = [member for member in self.members
+                   if member.ejected_until is not None and member.ejected_until <= now]
+            for member in due:
+                member.ejected_until = now + self.eject_seconds
+        for member in due:
+            if self._check(member):
+                with self._lock:
+                    member.ejected_until = None
+                    member.latency, member.samples = 0.0, 0
+
+    def acquire(self):
+        self._readmit()
+        with self._lock:
+            healthy = [member for member in self.members if member.ejected_until is None]
+            if healthy:
+                member = min(healthy, key=lambda member: (member.outstanding, member.latency))
+            else:
+                member = min(self.members, key=lambda member: member.ejected_until)
+            member.outstanding += 1
+            return member
+
+    def release(self, member, seconds, error=None):
+        with self._lock:
+            member.outstanding -= 1
+            if error is not None:
+                if self._unavailable(error):
+                    self._eject(member)
+                return
+            member.latency = seconds if member.samples == 0 else ALPHA * seconds + (1 - ALPHA) * member.latency
+            member.samples += 1
+            if member.samples < MIN_SAMPLES or member.ejected_until is not None:
+                return
+            others = [other.latency for other in self.members
+                      if other is not member and other.ejected_until is None and other.samples >= MIN_SAMPLES]
+            if others and member.latency > self.slow_factor * min(others):
+                self._eject(member)
+
+    def _eject(self, member):
+        # 至少保留一个可用的成员
+        if any(other.ejected_until is None for other in self.members if other is not member):
+            member.ejected_until = time.monotonic() + self.eject_seconds
+
+    @contextmanager
+    def using(self):
+        """
+        Run one read request on the least loaded member, yield its alias.
+        """
+        member = self.acquire()
+        error = None
+        start = time.perf_counter()
+        try:
+            yield member.alias
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.release(member, time.perf_counter() - start, error)
+
+
+def endpoints(settings):
+    """
+    Return [(host, port)] of [Connection]: endpoints = host:port, ... or
+    the single host and port.
+    """
+    connection = settings.connection
+    if not connection.endpoints.strip():
+        return [(connection.host, connection.port)]
+    result = []
+    for item in connection.endpoints.split(','):
+        host, _, port = item.strip().rpartition(':')
+        result.append((host, port) if host else (port, connection.port))
+    return result
+
+
+def build_pool(settings):
+    connection = settings.connection
+    members = []
+    for host, port in endpoints(settings):
+        for _ in range(max(connection.pool_size, 1)):
+            # 第一个连接使用配置的 alias，其余的依次编号
+            alias = connection.alias if not members else f'{connection.alias}-{len(members)}'
+            members.append(Member(alias, host, port))
+    return Pool(members, eject_seconds=connection.eject_seconds, slow_factor=connection.slow_factor)
+
+
+_pool = None
+
+
+def set_pool(pool):
+    global _pool
+    _pool = pool
+
+
+def get_pool():
+    """
+    Return the pool opened by connect(), a pool of only the configured alias
+    before that.
+    """
+    pool = _pool
+    if pool is None:
+        connection = get_settings().connection
+        pool = Pool([Member(connection.alias, connection.host, connection.port)])
+    return pool
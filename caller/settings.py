@@ -0,0 +1,119 @@
+"""
+Typed settings from config.ini, loaded once and shared by all caller modules.
+
+    settings = get_settings()
+    settings.connection.alias, settings.query.timeout, settings.search.batch_size
+
+Every section of config.ini is an attribute with every option of that
+section, options missing from the file have the defaults below. The file is
+read again when its modification time changes (checked at most once per
+CHECK_INTERVAL seconds), or explicitly with reload_settings() / the
+RELOAD CONFIG statement. The [Parser] section sizes the parse cache of
+sqlparser every time the file is read.
+"""
+import os
+import threading
+import time
+from configparser import ConfigParser
+from types import SimpleNamespace
+
+import sqlparser
+
+CONFIG_FILE = 'config.ini'
+CHECK_INTERVAL = 1.0
+
+# 每个 section 的选项及默认值；值的类型决定用哪个 getter 读取，默认值为 None 的是 float
+_DEFAULTS = {
+    'Connection': {'alias': 'default', 'user': None, 'password': None, 'host': 'localhost', 'port': '19530',
+                   'endpoints': '', 'pool_size': 1, 'eject_seconds': 30.0, 'slow_factor': 3.0},
+    'Database': {'timeout': None},
+    'Alias': {'timeout': None},
+    'Collection': {'timeout': None, '_async': False, '_refresh': False, 'cache_ttl': None},
+    'Partition': {'timeout': None, '_async': False, '_refresh': False},
+    'Index': {'timeout': None},
+    'Insert': {'timeout': None},
+    'Delete': {'timeout': None, 'in_chunk_size': 10000, 'max_workers': 4},
+    # consistency_level : (Strong, Bounded, Session, Eventually), default: Bounded
+    'Query': {'timeout': None, 'consistency_level': 'Bounded', 'in_chunk_size': 10000, 'max_workers': 4},
+    'Search': {'timeout': None, 'consistency_level': 'Bounded', '_async': False, '_callback': False,
+               'round_decimal': -1, 'batch_size': 1000},
+    'Executor': {'max_concurrency': 256},
+    'Parser': {'cache_size': 512, 'max_sql_length': 16384},
+}
+
+# 默认值为 None 但不是 float 的选项
+_STRINGS = {'user', 'password'}
+
+
+def _read(configur, section, option, default):
+    if option in _STRINGS or isinstance(default, str):
+        return configur.get(section, option)
+    if isinstance(default, bool):
+        return configur.getboolean(section, option)
+    if isinstance(default, int):
+        return configur.getint(section, option)
+    return configur.getfloat(section, option)
+
+
+class Settings:
+    """
+    One immutable snapshot of config.ini, a reload builds a new one.
+    """
+
+    def __init__(self, path=CONFIG_FILE):
+        configur = ConfigParser()
+        configur.read(path)
+        self.path = os.path.abspath(path)
+        self.mtime = _mtime(path)
+        for section, defaults in _DEFAULTS.items():
+            values = dict(defaults)
+            if configur.has_section(section):
+                for option in configur[section]:
+                    # 不认识的选项以字符串保留
+                    if option in defaults:
+                        values[option] = _read(configur, section, option, defaults[option])
+                    else:
+                        values[option] = configur.get(section, option)
+            setattr(self, section.lower(), SimpleNamespace(**values))
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+_lock = threading.Lock()
+_settings = None
+_checked_at = 0.0
+
+
+def reload_settings(path=CONFIG_FILE):
+    """
+    Read the config file again, return the new settings.
+    """
+    global _settings, _checked_at
+    with _lock:
+        _settings = Settings(path)
+        _checked_at = time.monotonic()
+        sqlparser.set_cache_size(_settings.parser.cache_size, _settings.parser.max_sql_length)
+        return _settings
+
+
+def get_settings(path=CONFIG_FILE):
+    """
+    Return the current settings, reading the file only the first time, after
+    it changed, or when the working directory changed to another config.ini.
+    """
+    global _checked_at
+    settings = _settings
+    # 换了配置文件时立即读取，只有修改时间的检查受检查间隔限制
+    if settings is None or settings.path != os.path.abspath(path):
+        return reload_settings(path)
+    now = time.monotonic()
+    if now - _checked_at >= CHECK_INTERVAL:
+        _checked_at = now
+        if settings.mtime != _mtime(path):
+            return reload_settings(path)
+    return settings
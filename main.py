@@ -1,9 +1,31 @@
-from sqlparser import parse
+import argparse
+import sys
+
+from sqlparser import parse, split_statements
 from sqlparser.exceptions import *
 from caller.caller import func_map
+from caller.parallel import run_statements
+
+
+def run_script(path, parallel=1):
+    # 执行脚本中的语句，出错时打印错误并继续执行下一条；
+    # parallel > 1 时相邻的查询语句并行执行，输出仍按语句的顺序
+    with open(path, encoding='utf-8') as script:
+        run_statements(split_statements(script), func_map, parallel)
+
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('script', nargs='?', help='SQL script to run instead of the interactive mode')
+    parser.add_argument('--parallel', type=int, default=1, help='read statements of the script run at the same time')
+    args = parser.parse_args()
+
     func_map['connect']()
+    # python main.py script.sql 执行脚本文件，否则进入交互模式
+    if args.script is not None:
+        run_script(args.script, args.parallel)
+        func_map['disconnect']()
+        sys.exit(0)
     while True:
         try:
             sql = input('milvus > ')
@@ -17,7 +39,7 @@ if __name__ == '__main__':
         if sql.lower() == 'exit' or sql.lower() == 'exit;':
             break
         try:    
-            query = parse(sql)
+            query = parse(sql, tree=True)
             current_db = func_map[query['type']](query)
         except Exception as result:
             print('%s' % result)
@@ -1,9 +1,66 @@
 # -*- coding: utf-8 -*-
 
+from . import instrument
 from .grammar import parse_handle
+from .cache import ParseCache
+from .fastpath import parse_insert
+from .columnar import to_columnar
+from .prepared import prepare, PreparedStatement
+from .script import split_statements
+from .canonical import canonical
 
-def parse(sql):
+_cache = ParseCache()
+
+def _parse_insert(sql, columnar=False):
+    # 注册了 instrument 的 hook 时快速路径同样计时
+    if instrument.enabled():
+        return instrument.parse_insert(sql, columnar)
+    return parse_insert(sql, columnar)
+
+def _parse(sql, tree=False):
+    # INSERT/UPSERT ... VALUES 先尝试快速路径，不认识的写法再交给完整的语法分析
+    query = _parse_insert(sql)
+    if query is None:
+        query = parse_handle(sql, tree)
+    return query
+
+def _parse_columnar(sql, tree=False):
+    query = _parse_insert(sql, columnar=True)
+    if query is None:
+        query = to_columnar(parse_handle(sql, tree))
+    return query
+
+def _parse_tree(sql):
+    return _parse(sql, tree=True)
+
+def _parse_columnar_tree(sql):
+    return _parse_columnar(sql, tree=True)
+
+def parse(sql, columnar=False, tree=False):
+    # columnar=True 时 INSERT/UPSERT 的数据按列给出，见 sqlparser.columnar
+    # tree=True 时 query['where'] 为 WHERE 条件的表达式树，见 sqlparser.nodes
     try:
-        return parse_handle(sql)
+        if columnar:
+            if tree:
+                return _cache.get(sql, _parse_columnar_tree, tag='columnar+tree')
+            return _cache.get(sql, _parse_columnar, tag='columnar')
+        if tree:
+            return _cache.get(sql, _parse_tree, tag='tree')
+        return _cache.get(sql, _parse)
     except Exception:
-        raise
\ No newline at end of file
+        raise
+
+def parse_many(stream, columnar=False, tree=False):
+    # 逐条读取并解析脚本中的语句，内存占用与脚本大小无关，解析失败时抛出异常
+    for sql in split_statements(stream):
+        yield parse(sql, columnar=columnar, tree=tree)
+
+def cache_info():
+    return _cache.info()
+
+def set_cache_size(maxsize, max_sql_length=None):
+    # max_sql_length 为进入缓存的语句的最大长度，None 时不变
+    _cache.resize(maxsize, max_sql_length)
+
+def clear_cache():
+    _cache.clear()
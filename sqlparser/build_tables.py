@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Regenerate the lexer and parser tables, lextab.py and parsetab.py, next to
+this file.
+
+    python -m sqlparser.build_tables
+
+grammar.py loads them in optimize mode without validating them, so run this
+after every change to lexer.py or to a grammar rule, tests/test_tables.py
+fails while the committed tables are stale.
+"""
+import os
+import sys
+
+from ply import lex, yacc
+
+from . import lexer, grammar
+
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def build():
+    # 重新检查所有规则后写出分析表
+    lexobj = lex.lex(module=lexer, optimize=False)
+    lexobj.writetab('lextab', OUTPUT_DIR)
+    for name in ('parsetab.py', 'parser.out'):
+        path = os.path.join(OUTPUT_DIR, name)
+        if os.path.exists(path):
+            os.remove(path)
+    # 导入 grammar 时已经加载了旧的 parsetab，签名未变时 yacc 会直接复用它而不写出新文件
+    sys.modules.pop(__package__ + '.parsetab', None)
+    yacc.yacc(module=grammar, tabmodule='parsetab', outputdir=OUTPUT_DIR, write_tables=True, debug=False)
+
+
+if __name__ == '__main__':
+    build()
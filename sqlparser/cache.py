@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import re
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+
+from .lexer import reserved
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+# 引号内的内容和 :name 参数原样保留，引号外的空白压缩为一个空格，关键字统一为小写
+_SEGMENT = re.compile(r"""('[^']*'|"[^"]*"|`[^`]*`|:[a-zA-Z][_a-zA-Z0-9]*)|([a-zA-Z][_a-zA-Z0-9]*)|([ \t\n]+)""")
+
+
+def _fold(match):
+    kept, word, space = match.groups()
+    if kept is not None:
+        return kept
+    if word is not None:
+        lower = word.lower()
+        return lower if lower in reserved else word
+    return ' '
+
+
+def normalize(sql):
+    """
+    Fold whitespace and keyword case outside of quoted strings, so that
+    statements producing the same tokens share one cache entry.
+    """
+    return _SEGMENT.sub(_fold, sql).strip()
+
+
+def _copy(value):
+    # query dict 只由 dict/list 和不可变的值组成，比 copy.deepcopy 快得多
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    # 向量缓冲区也是可变的，复制一份
+    if isinstance(value, array):
+        return value[:]
+    return value
+
+
+class ParseCache:
+    """
+    Bounded, thread-safe LRU cache of parsed statements.
+
+    Every lookup returns a fresh copy of the cached query dict, callers in
+    caller/ are free to modify what they get.
+    """
+
+    def __init__(self, maxsize=512, max_sql_length=16384):
+        self.maxsize = maxsize
+        # 大批量的INSERT几乎不会重复，缓存它们只会浪费内存；默认值容得下一个 768 维向量的搜索
+        self.max_sql_length = max_sql_length
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, sql, parse_func, tag=None):
+        # tag 区分同一条语句的不同解析方式，比如列式的INSERT
+        if self.maxsize <= 0 or len(sql) > self.max_sql_length:
+            return parse_func(sql)
+
+        key = normalize(sql)
+        if tag is not None:
+            key = (tag, key)
+        with self._lock:
+            query = self._entries.get(key)
+            if query is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(query)
+            self.misses += 1
+
+        # 解析失败时直接抛出异常，不缓存
+        query = parse_func(sql)
+
+        with self._lock:
+            self._entries[key] = query
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return _copy(query)
+
+    def resize(self, maxsize, max_sql_length=None):
+        with self._lock:
+            self.maxsize = maxsize
+            if max_sql_length is not None:
+                self.max_sql_length = max_sql_length
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
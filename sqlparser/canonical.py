@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Canonical form and fingerprint of a statement, for result caches and for
+coalescing identical requests.
+
+Two statements get the same fingerprint when they only differ in ways that
+cannot change the result: whitespace and keyword case, the order of the
+terms of an and/or, the order and duplicates of an IN list, the side a
+constant is written on (`3 < a` is `a > 3`), redundant parentheses and
+double negation, plus everything simplify() already normalises.
+
+    expr, key = canonical(parse(sql, tree=True))
+
+expr is the canonical WHERE expression (it is still a valid Milvus
+expression), key a hex digest over the whole statement. Without the tree
+query['expr'] is treated like a WITH expression, which normalises less
+(a between renders as `1 <= a <= 5`, outside the condition grammar). A
+`WITH {"expr": ...}` expression goes to Milvus verbatim: it is parsed with
+the SQL condition grammar when it is already written in Milvus syntax, and
+otherwise only normalised textually.
+"""
+import hashlib
+import json
+import re
+from array import array
+
+from .exceptions import LexerException, GrammarException
+from .grammar import parse_condition
+from .nodes import Literal, Paren, Call, Compare, In, Not, BoolOp, to_expr, _dumps
+from .param import Param
+from .simplify import simplify
+
+_FLIP = {'<': '>', '>': '<', '<=': '>=', '>=': '<=', '==': '==', '!=': '!='}
+
+# milvus 的 == 写成 SQL 的 =，引号内的内容不变
+_MILVUS_EQ = re.compile(r"""('[^']*'|"[^"]*")|==""")
+# 引号外的空白；milvus 的 field 名区分大小写，不能像 cache.normalize 那样改写关键字
+_MILVUS_SPACE = re.compile(r"""('[^']*'|"[^"]*")|[ \t\r\n]+""")
+# 引号外的空白和括号，用于比较 WITH 中的表达式与解析后的渲染结果
+_MILVUS_SHAPE = re.compile(r"""('[^']*'|"[^"]*")|[ \t\r\n()]+""")
+
+
+def _literal(node):
+    while isinstance(node, Paren):
+        node = node.expr
+    return isinstance(node, Literal)
+
+
+def _canonical(node):
+    # 返回 (规范化的节点, 渲染结果)，渲染结果用作 and/or 中子条件排序的依据
+    if isinstance(node, BoolOp):
+        children = []
+        for value in node.values:
+            child, text = _canonical(value)
+            if isinstance(child, BoolOp) and child.op == node.op:
+                children.extend((value, to_expr(value)) for value in child.values)
+            else:
+                children.append((child, text))
+        # 相同的子条件只保留一个
+        children = sorted(dict((text, child) for child, text in children).items())
+        values = [Paren(child) if node.op == 'and' and isinstance(child, BoolOp) else child
+                  for _, child in children]
+        if len(values) == 1:
+            return values[0], children[0][0]
+        result = BoolOp(node.op, values)
+        return result, to_expr(result)
+
+    if isinstance(node, Not):
+        operand, _ = _canonical(node.operand)
+        if isinstance(operand, Not):
+            # not not x 与 x 相同，null 时两者都为 null
+            result = operand.operand
+            if isinstance(result, Paren) and isinstance(result.expr, BoolOp):
+                result = result.expr
+        else:
+            result = Not(Paren(operand) if isinstance(operand, BoolOp) else operand)
+        return result, to_expr(result)
+
+    if isinstance(node, Paren):
+        if isinstance(node.expr, Call):
+            return node, to_expr(node)
+        return _canonical(node.expr)
+
+    if isinstance(node, Compare):
+        left, right, op = node.left, node.right, node.op
+        # 常量写在右侧；两侧都不是常量时按渲染结果排序
+        if _literal(left) and not _literal(right):
+            left, right, op = right, left, _FLIP[op]
+        elif not _literal(left) and not _literal(right) and to_expr(right) < to_expr(left):
+            left, right, op = right, left, _FLIP[op]
+        result = Compare(op, left, right)
+        return result, to_expr(result)
+
+    if isinstance(node, In) and isinstance(node.values, list):
+        values = sorted(dict((_dumps(value), value) for value in node.values).items())
+        result = In(node.target, [value for _, value in values], node.negated)
+        return result, to_expr(result)
+
+    return node, to_expr(node)
+
+
+def canonical_tree(node):
+    """
+    Canonical form of a WHERE tree, a tree or True / False.
+    """
+    result = simplify(node)
+    if isinstance(result, bool):
+        return result
+    return _canonical(result)[0]
+
+
+def _shape(expr):
+    # 字符串按内容比较，'x' 与 "x" 相同
+    return _MILVUS_SHAPE.sub(lambda m: json.dumps(m.group(1)[1:-1]) if m.group(1) else '', expr)
+
+
+def _parse_expr(expr):
+    # WITH 中给出的 milvus 表达式，能用条件的语法解析时返回表达式树
+    try:
+        tree = parse_condition(_MILVUS_EQ.sub(lambda m: m.group(1) or '=', expr))
+    except (LexerException, GrammarException):
+        return None
+    # 表达式原样发给 milvus，用了 <>、AND 这类只有 SQL 才有的写法时渲染结果与原文不同，
+    # 不能与合法的表达式共用指纹；比较的是化简之前的树，化简改变的顺序不影响判断
+    if tree is None or _shape(to_expr(tree)) != _shape(expr):
+        return None
+    return tree
+
+
+def _compact(expr):
+    return _MILVUS_SPACE.sub(lambda m: m.group(1) or ' ', expr).strip()
+
+
+def canonical_expr(query):
+    """
+    Canonical WHERE expression of a parsed statement, '' without a
+    condition.
+    """
+    tree = query.get('where')
+    if tree is None and query.get('expr'):
+        tree = _parse_expr(query['expr'])
+        if tree is None:
+            return _compact(query['expr'])
+    if tree is None:
+        return ''
+    result = canonical_tree(tree)
+    if isinstance(result, bool):
+        # 恒为真或恒为假的条件保留原表达式，milvus 不接受空表达式
+        return to_expr(_canonical(tree)[0])
+    return to_expr(result)
+
+
+def _feed(digest, value):
+    # 按类型写入摘要，dict 的 key 排序，向量直接写入其二进制内容
+    if isinstance(value, dict):
+        digest.update(b'{')
+        for key in sorted(value, key=str):
+            _feed(digest, key)
+            _feed(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _feed(digest, item)
+        digest.update(b']')
+    elif isinstance(value, (bytes, array)):
+        digest.update(b'b%d:' % (len(value) * getattr(value, 'itemsize', 1)))
+        digest.update(value)
+    elif isinstance(value, Param):
+        digest.update(value.marker.encode())
+    else:
+        digest.update(json.dumps(value, default=repr).encode('utf-8'))
+    digest.update(b',')
+
+
+def canonical(query):
+    """
+    Return (expr, fingerprint) of a parsed statement: the canonical WHERE
+    expression and a hex digest identifying statements with the same result.
+    """
+    expr = canonical_expr(query)
+    statement = {key: value for key, value in query.items()
+                 if key not in ('expr', 'where', 'always_false')}
+    # 查询和搜索的结果与 field、partition 的顺序无关
+    if query.get('type') in ('query', 'search'):
+        for key in ('fields', 'parts'):
+            if isinstance(statement.get(key), list):
+                statement[key] = sorted(set(statement[key]))
+    statement['expr'] = expr
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, statement)
+    return expr, digest.hexdigest()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Splitting of WHERE clauses with a very long IN list.
+
+`id in [...]` with 100k primary keys gives an expression of several MB that
+Milvus rejects. When the IN list is one of the terms of the top level and,
+the statement is the union of the same statement with the list cut into
+chunks: the values are deduplicated first, so every row matches at most
+one chunk. caller/ runs the chunks in parallel and
+merges the results.
+"""
+from .nodes import Paren, In, BoolOp, to_expr
+from .simplify import simple_kind
+
+
+def _splittable(node, chunk_size):
+    # 只拆分已经去重的数字或字符串列表
+    return (isinstance(node, In) and not node.negated and simple_kind(node.values) is not None
+            and len(node.values) > chunk_size)
+
+
+def chunk_expr(where, chunk_size):
+    """
+    Return the expressions of the chunks of a WHERE tree, or None when it
+    has no IN list longer than chunk_size at the top level.
+    """
+    if where is None or chunk_size <= 0:
+        return None
+    root = where.expr if isinstance(where, Paren) else where
+    terms = root.values if isinstance(root, BoolOp) and root.op == 'and' else [root]
+    # not in 不能拆分成并集；有多个长列表时拆分最长的一个
+    candidates = [index for index, term in enumerate(terms) if _splittable(term, chunk_size)]
+    if not candidates:
+        return None
+    index = max(candidates, key=lambda i: len(terms[i].values))
+    # 预编译语句绑定的列表没有经过化简，这里再去重一次
+    target, values = terms[index].target, sorted(set(terms[index].values))
+
+    exprs = []
+    for start in range(0, len(values), chunk_size):
+        term = In(target, values[start:start + chunk_size])
+        if len(terms) == 1:
+            exprs.append(to_expr(term))
+        else:
+            exprs.append(to_expr(BoolOp('and', terms[:index] + [term] + terms[index + 1:])))
+    return exprs
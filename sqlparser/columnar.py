@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Column-oriented INSERT/UPSERT payload.
+
+Instead of one dict per row, query['columns'] maps every field name to the
+list of its values, as parsed. query['num_rows'] keeps the row count, the
+row-wise query['data'] is absent. Values are not packed: pymilvus serializes
+list columns fastest, and vectors.pack_float_vectors can pack the column of
+a FLOAT_VECTOR field for callers that keep the payload.
+"""
+def columns_from_rows(fields, rows):
+    # 值保持原样：不知道 schema 时无法区分 float vector 和 JSON、动态 field 中的数字列表
+    return {name: [row[index] for row in rows] for index, name in enumerate(fields)}
+
+
+def to_columnar(query):
+    # 语法分析得到的是按行的字典，这里转换成列式
+    if query.get('type') not in ('insert', 'upsert') or 'data' not in query:
+        return query
+    data = query.pop('data')
+    fields = list(data[0]) if data else []
+    rows = [[row[name] for name in fields] for row in data]
+    query['columns'] = columns_from_rows(fields, rows)
+    query['num_rows'] = len(rows)
+    return query
+
+
+def to_rows(columns, num_rows):
+    names = list(columns)
+    if not names:
+        return [dict() for _ in range(num_rows)]
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
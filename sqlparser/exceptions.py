@@ -5,4 +5,7 @@ class LexerException(Exception):
     pass
 
 class GrammarException(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class ParameterException(Exception):
+    pass
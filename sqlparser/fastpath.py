@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Fast path for INSERT/UPSERT ... VALUES statements.
+
+The VALUES tail is scanned with one compiled regex and rewritten into a JSON
+array, which json.loads turns into rows in C. Lists of plain numbers (float
+vectors) are matched by a single regex match and copied through unchanged.
+Anything the scanner does not recognise makes parse_insert() return None and
+the statement goes through the full grammar instead, so both paths always
+agree on what is accepted and on the result.
+"""
+import json
+import re
+
+from .lexer import reserved
+from .columnar import columns_from_rows
+
+_WS = r'[ \t\n]*'
+_NAME = r'[a-zA-Z][_a-zA-Z0-9]*'
+# 词法分析时 t_BOOLEAN 和 t_NULL 先于 t_STRING 匹配，nullable 会被拆成 null 和 able
+_LITERAL_PREFIXES = ('true', 'false', 'null')
+_JSON_NUMBER = r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?'
+
+_HEADER = re.compile(
+    rf'{_WS}(insert|upsert)[ \t\n]+into[ \t\n]+'
+    rf'(?:partition[ \t\n]+({_NAME})[ \t\n]+on[ \t\n]+)?({_NAME}){_WS}'
+    rf'\(({_WS}(?:{_NAME}(?:{_WS},{_WS}{_NAME})*)?{_WS})\){_WS}values(?![_a-zA-Z0-9])',
+    re.IGNORECASE
+)
+
+_TOKEN = re.compile(rf'''{_WS}(?:
+     (?P<span>\[{_WS}(?:{_JSON_NUMBER}{_WS},{_WS})*{_JSON_NUMBER}{_WS}\])
+    |(?P<json_str>"[^"\\\x00-\x1f]*")
+    |(?P<float>[-+]?[0-9]+(?:\.[0-9]*(?:[eE][-+]?[0-9]+)?|[eE][-+]?[0-9]+))
+    |(?P<int>[-+]?(?:0|[1-9][0-9]*))
+    |(?P<str>'[^']*'|"[^"]*"|`[^`]*`)
+    |(?P<word>true|false|null)(?![_a-zA-Z0-9])
+    |(?P<open>\()
+    |(?P<close>\))
+    |(?P<punct>[\[\]{{}},:])
+    |(?P<end>;{_WS}$)
+)''', re.VERBOSE)
+
+
+def _scan_values(tail):
+    # 把 VALUES 之后的部分改写成 JSON 数组，遇到不认识的写法返回 None
+    pieces = []
+    append = pieces.append
+    in_tuple = False
+    match = _TOKEN.scanner(tail).match
+    while True:
+        m = match()
+        if m is None:
+            return None
+        kind = m.lastgroup
+        if kind == 'end':
+            break
+        if kind == 'open':
+            if in_tuple:
+                return None
+            in_tuple = True
+            append('[')
+        elif kind == 'close':
+            if not in_tuple:
+                return None
+            in_tuple = False
+            append(']')
+        elif kind == 'punct':
+            token = m.group(kind)
+            if not in_tuple and token != ',':
+                return None
+            append(token)
+        elif not in_tuple:
+            return None
+        elif kind == 'span' or kind == 'json_str' or kind == 'word':
+            append(m.group(kind))
+        elif kind == 'int':
+            append(str(int(m.group(kind))))
+        elif kind == 'float':
+            append(repr(float(m.group(kind))))
+        else:
+            append(json.dumps(m.group(kind)[1:-1]))
+    if in_tuple:
+        return None
+    try:
+        # 用空格连接，避免 "1 2" 这样缺少逗号的写法被拼成合法的 JSON
+        return json.loads('[' + ' '.join(pieces) + ']')
+    except ValueError:
+        return None
+
+
+def scan_insert(sql):
+    """
+    Scan an INSERT/UPSERT ... VALUES statement into (kind, partition,
+    collection, fields, rows), or return None when it has to go through the
+    grammar.
+    """
+    header = _HEADER.match(sql)
+    if header is None:
+        return None
+    kind, part_name, coll_name, field_names = header.groups()
+    fields = [name.strip() for name in field_names.split(',')] if field_names.strip() else []
+    for name in [part_name, coll_name] + fields:
+        if name is not None and (name.lower() in reserved or name.startswith(_LITERAL_PREFIXES)):
+            return None
+
+    rows = _scan_values(sql[header.end():])
+    if rows is None:
+        return None
+    width = len(fields)
+    for row in rows:
+        # 值的个数少于field时交给语法分析，由它报错
+        if len(row) < width:
+            return None
+    return kind, part_name, coll_name, fields, rows
+
+
+def build_insert(scanned, columnar=False):
+    kind, part_name, coll_name, fields, rows = scanned
+    query = dict()
+    query['type'] = kind.lower()
+    if part_name is not None:
+        query['part_name'] = part_name
+    query['coll_name'] = coll_name
+    if columnar:
+        query['columns'] = columns_from_rows(fields, rows)
+        query['num_rows'] = len(rows)
+    else:
+        query['data'] = [dict(zip(fields, row)) for row in rows]
+    return query
+
+
+def parse_insert(sql, columnar=False):
+    """
+    Parse an INSERT/UPSERT ... VALUES statement without ply, or return None
+    when the statement has to go through the grammar.
+    """
+    scanned = scan_insert(sql)
+    if scanned is None:
+        return None
+    return build_insert(scanned, columnar)
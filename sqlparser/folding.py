@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Constant folding of arithmetic in WHERE clauses, with Milvus semantics.
+
+Milvus evaluates arithmetic on int64 and float64 values: int op int stays an
+int and / truncates towards zero, % only takes ints, ** always gives a
+float. Anything Milvus would reject or where the result would differ, such
+as a division by zero, an int64 overflow or a result that is not finite, is
+left unfolded so that Milvus still reports or evaluates it itself.
+"""
+import math
+
+from .nodes import Literal, UnaryOp, BinaryOp, Paren
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _number(node):
+    # 括号内的数字常量也可以参与计算
+    while isinstance(node, Paren):
+        node = node.expr
+    if isinstance(node, Literal) and type(node.value) in (int, float):
+        return node.value
+    return None
+
+
+def _truncate_div(a, b):
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+def _truncate_mod(a, b):
+    remainder = abs(a) % abs(b)
+    return -remainder if a < 0 else remainder
+
+
+def _compute(op, a, b):
+    # 返回 None 表示不折叠
+    ints = type(a) is int and type(b) is int
+    if op == '+':
+        result = a + b
+    elif op == '-':
+        result = a - b
+    elif op == '*':
+        result = a * b
+    elif op == '/':
+        if b == 0:
+            return None
+        result = _truncate_div(a, b) if ints else a / b
+    elif op == '%':
+        if not ints or b == 0:
+            return None
+        result = _truncate_mod(a, b)
+    elif op == '**':
+        try:
+            result = math.pow(a, b)
+        except (OverflowError, ValueError):
+            return None
+    else:
+        return None
+    return _checked(result)
+
+
+def _checked(result):
+    # 超出 int64 范围的整数和非有限的浮点数不折叠
+    if type(result) is int:
+        return result if _INT64_MIN <= result <= _INT64_MAX else None
+    return result if math.isfinite(result) else None
+
+
+def fold(node):
+    """
+    Fold a UnaryOp, BinaryOp or Paren whose operands are number literals into
+    one Literal. Operands are expected to be folded already, the grammar calls
+    this at every reduction of constant_expr.
+    """
+    if isinstance(node, Paren):
+        value = _number(node.expr)
+        if value is None:
+            return node
+        # 负数保留一层括号，避免 (-2) ** 2 变成 -2 ** 2
+        return Paren(Literal(value)) if value < 0 else Literal(value)
+
+    if isinstance(node, UnaryOp):
+        value = _number(node.operand)
+        if value is None:
+            return node
+        # -(-9223372036854775807 - 1) 超出 int64 范围
+        result = _checked(-value if node.op == '-' else value)
+        return node if result is None else Literal(result)
+
+    if isinstance(node, BinaryOp):
+        left = _number(node.left)
+        right = _number(node.right)
+        result = None
+        if left is not None and right is not None:
+            result = _compute(node.op, left, right)
+        if result is None:
+            return node
+        if node.op == '**' and result < 0:
+            # 负数的底数一定来自括号，结果也保留括号，(-2) ** 3 ** 2 不能变成 -8.0 ** 2
+            return Paren(Literal(result))
+        return Literal(result)
+    return node
@@ -1,10 +1,33 @@
 # -*- coding: utf-8 -*-
+import copy
 import json
+import threading
+from array import array
 
 from ply import lex,yacc
 
-from . import lexer
+from . import lexer, instrument
 from .exceptions import GrammarException
+from .param import Param
+from .vectors import pack_vectors
+from .nodes import (Literal, Identifier, UnaryOp, BinaryOp, Paren, Call, Compare,
+                    Between, Like, In, Not, BoolOp, to_expr)
+from .folding import fold
+from .simplify import simplify
+
+# 条件和算术表达式的优先级与 milvus 相同，这样得到的表达式树与 milvus 的理解一致；
+# 渲染时按原样输出，不额外添加括号。milvus 中 ** 为左结合
+precedence = (
+    ('left', 'OR'),
+    ('left', 'AND'),
+    ('right', 'NOT'),
+    ('left', '+', '-'),
+    ('left', '*', '/', '%'),
+    ('right', 'UMINUS'),
+    ('left', 'POW'),
+    # -1 作为负数字面量，而不是一元负号加 1
+    ('right', 'NUMBER', 'FLOAT'),
+)
 
 def p_expression(p):
     """ expression : db END
@@ -15,6 +38,7 @@ def p_expression(p):
                    | delete END
                    | query END
                    | search END
+                   | reload_config END
     """
     p[0] = p[1]
 
@@ -175,22 +199,22 @@ def p_create_coll(p):
             'params' : dict()
         }
 
+# 列表都用左递归、原地append构造，避免右递归每一步复制整个尾部列表(O(n^2))
 def p_field_list(p):
-    """ field_list : field field_list
-                   | COMMA field field_list
+    """ field_list : field_list field
+                   | field_list COMMA field
                    | empty
     """
     if len(p) == 2:
         p[0] = list()
-    if len(p) == 3:
-        p[0] = p[1] + p[2]
-    elif len(p) == 4:
-        p[0] = p[2] + p[3]
+    else:
+        p[0] = p[1]
+        p[0].append(p[len(p) - 1])
 
 def p_field(p):
     """ field : STRING type attr_list
     """
-    p[0] = [{'name' : p[1] } | p[2] | p[3]]
+    p[0] = {'name' : p[1] } | p[2] | p[3]
 
 def p_type(p):
     """ type : STRING
@@ -331,12 +355,13 @@ def p_release_part(p):
 
 def p_part_list(p):
     """ part_list : empty
-                  | COMMA STRING part_list
+                  | part_list COMMA STRING
     """
     if len(p) == 2:
         p[0] = []
     else:
-        p[0] = [p[2]] + p[3]
+        p[0] = p[1]
+        p[0].append(p[3])
 
 ###################################################
 ############           Index           ############
@@ -423,16 +448,15 @@ def p_bulk_insert(p):
         }
 
 def p_file_list(p):
-    """ file_list : QSTRING file_list
-                  | COMMA QSTRING file_list
+    """ file_list : file_list QSTRING
+                  | file_list COMMA QSTRING
                   | empty
     """
     if len(p) == 2:
         p[0] = []
-    elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
     else:
-        p[0] = [p[2]] + p[3]
+        p[0] = p[1]
+        p[0].append(p[len(p) - 1])
 
 def p_insert_coll(p):
     """ insert_coll : INSERT INTO STRING "(" field_name_list ")" VALUES values_list
@@ -493,15 +517,15 @@ def p_upsert_part(p):
     p[0]['data'] = data
 
 def p_field_name_list(p):
-    """ field_name_list : field_name field_name_list
-                        | COMMA field_name field_name_list
+    """ field_name_list : field_name_list field_name
+                        | field_name_list COMMA field_name
                         | empty
     """
-    p[0] = list()
-    if len(p) == 3:
-        p[0] = p[1] + p[2]
-    elif len(p) == 4:
-        p[0] = p[2] + p[3]
+    if len(p) == 2:
+        p[0] = list()
+    else:
+        p[0] = p[1]
+        p[0].append(p[len(p) - 1])
 
 def p_field_name(p):
     """ field_name : STRING
@@ -509,36 +533,43 @@ def p_field_name(p):
                    | "*"
     """
     if len(p) == 2:
-        p[0] = [ p[1] ]
+        p[0] = p[1]
     elif len(p) == 5:
-        p[0] = [ 'count(*)' ]
+        p[0] = 'count(*)'
 
 def p_values_list(p):
-    """ values_list : value_tuple values_list
-                    | COMMA value_tuple values_list
+    """ values_list : values_list value_tuple
+                    | values_list COMMA value_tuple
                     | empty
     """
-    p[0] = list()
-    if len(p) == 3:
-        p[0] = p[1] + p[2]
-    elif len(p) == 4:
-        p[0] = p[2] + p[3]
+    if len(p) == 2:
+        p[0] = list()
+    else:
+        p[0] = p[1]
+        p[0].append(p[len(p) - 1])
 
 def p_value_tuple(p):
     """ value_tuple : "(" value_list ")"
     """
-    p[0] = [ p[2] ]
+    p[0] = p[2]
 
 def p_value_list(p):
-    """ value_list : value value_list
-                   | COMMA value value_list
+    """ value_list : value_list value
+                   | value_list COMMA value
                    | empty
     """
-    p[0] = list()
-    if len(p) == 3:
-        p[0] = p[1] + p[2]
-    elif len(p) == 4:
-        p[0] = p[2] + p[3]
+    if len(p) == 2:
+        p[0] = list()
+    else:
+        # value 为只含一个元素的列表
+        p[0] = p[1]
+        p[0].append(p[len(p) - 1][0])
+
+def _scalar(value):
+    # X'..'、B64'..' 和 F32'..' 只能作为搜索向量或插入的值，milvus 表达式和 json 中没有对应的字面量
+    if isinstance(value, (bytes, array)):
+        raise GrammarException("Vector literals are only allowed in search vectors and insert values")
+    return value
 
 def p_value(p):
     """ value : single_value
@@ -549,20 +580,20 @@ def p_value(p):
         p[0] = [ p[2] ]
     
 def p_json_value(p):
-    """ json_value : kv_pair json_value
-                   | COMMA kv_pair json_value
+    """ json_value : json_value kv_pair
+                   | json_value COMMA kv_pair
                    | empty
     """
-    p[0] = dict()
-    if len(p) == 3:
-        p[0] = p[1] | p[2]
-    elif len(p) == 4:
-        p[0] = p[2] | p[3]
+    if len(p) == 2:
+        p[0] = dict()
+    else:
+        p[0] = p[1]
+        p[0].update(p[len(p) - 1])
 
 def p_kv_pair(p):
     """ kv_pair : QSTRING ":" value
     """
-    p[0] = { p[1] : p[3][0] }
+    p[0] = { p[1] : _scalar(p[3][0]) }
 
 def p_single_value(p):
     """ single_value : number_expr
@@ -572,6 +603,9 @@ def p_single_value(p):
                      | "[" multi_value "]"
                      | BOOLEAN
                      | NULL
+                     | PARAM
+                     | BYTES
+                     | FLOAT_VECTOR
     """
     if len(p) == 2:
         p[0] = p[1]
@@ -579,15 +613,15 @@ def p_single_value(p):
         p[0] = p[2]
 
 def p_multi_value(p):
-    """ multi_value : single_value multi_value
-                    | COMMA single_value multi_value
+    """ multi_value : multi_value single_value
+                    | multi_value COMMA single_value
                     | empty
     """
-    p[0] = list()
-    if len(p) == 3:
-        p[0] = [p[1]] + p[2]
-    elif len(p) == 4:
-        p[0] = [p[2]] + p[3]
+    if len(p) == 2:
+        p[0] = list()
+    else:
+        p[0] = p[1]
+        p[0].append(_scalar(p[len(p) - 1]))
 
 ###################################################
 ############         Delete          ############
@@ -606,7 +640,7 @@ def p_delete_coll(p):
     p[0]['type'] = 'delete'
     p[0]['coll_name'] = p[3]
     if len(p) == 5:
-        p[0]['expr'] = p[4]['expr']
+        _set_where(p[0], p[4])
     elif len(p) == 10:
         p[0][p[6]] = p[8]
 
@@ -619,7 +653,7 @@ def p_delete_part(p):
     p[0]['part_name'] = p[4]
     p[0]['coll_name'] = p[6]
     if len(p) == 8:
-        p[0]['expr'] = p[7]['expr']
+        _set_where(p[0], p[7])
     elif len(p) == 13:
         p[0][p[9]] = p[11]
 
@@ -646,7 +680,7 @@ def p_query_coll(p):
     if len(p) == 13:
         p[0][p[9]] = p[11]
     elif len(p) == 8:
-        p[0]['expr'] = p[7]['expr']
+        _set_where(p[0], p[7])
 
 def p_query_part(p):
     """ query_part : SELECT field_name_list FROM PARTITION part_name_list ON STRING limit offset WITH "{" QSTRING ":" QSTRING "}"
@@ -662,7 +696,7 @@ def p_query_part(p):
     if len(p) == 16:
         p[0][p[12]] = p[14]
     elif len(p) == 11:
-        p[0]['expr'] = p[10]['expr']
+        _set_where(p[0], p[10])
 
 def p_part_name_list(p):
     """ part_name_list : field_name_list
@@ -689,10 +723,13 @@ def p_search_coll(p):
     p[0]['data'] = p[11]
     p[0]['limit'] = p[12]
     # p[0]['offset'] = p[13]
-    p[0]['expr'] = p[14]['expr']
+    _set_where(p[0], p[14])
     p[0]['parts'] = None
     if 'expr' in p[17]:
+        # WITH 里给出的 expr 优先，没有对应的表达式树
         p[0]['expr'] = p[17]['expr']
+        p[0]['where'] = None
+        p[0].pop('always_false', None)
         del p[17]['expr']
 
     new_param_list = dict()
@@ -714,10 +751,12 @@ def p_search_part(p):
     p[0]['data'] = p[14]
     p[0]['limit'] = p[15]
     # p[0]['offset'] = p[16]
-    p[0]['expr'] = p[17]['expr']
+    _set_where(p[0], p[17])
     p[0]['parts'] = p[5]
     if 'expr' in p[20]:
         p[0]['expr'] = p[20]['expr']
+        p[0]['where'] = None
+        p[0].pop('always_false', None)
         del p[20]['expr']
 
     new_param_list = dict()
@@ -730,14 +769,57 @@ def p_search_part(p):
 
 def p_vec_list(p):
     """ vec_list : "[" value_list "]"
+                 | PARAM
+                 | STRING QSTRING
+                 | STRING QSTRING "[" row_slice "]"
     """
-    p[0] = p[2]
+    if len(p) == 2:
+        p[0] = p[1]
+    elif p[1] != '[':
+        # FILE 'queries.npy' [start:stop]：查询向量从文件读取，caller 用内存映射按批次搜索
+        # FILE 不是保留字，避免名为 file 的 field 或 collection 失效
+        if p[1].lower() != 'file':
+            raise GrammarException("Syntax error in input!")
+        p[0] = {'file': p[2], 'start': None, 'stop': None}
+        if len(p) == 6:
+            p[0]['start'], p[0]['stop'] = p[4]
+    else:
+        # 向量在这里就打包成 float32 缓冲区或 bytes，caller 不再逐个元素转换
+        try:
+            p[0] = pack_vectors(p[2])
+        except ValueError as e:
+            raise GrammarException(str(e))
+
+def p_row_slice(p):
+    """ row_slice : slice_bound ":" slice_bound
+    """
+    p[0] = (p[1], p[3])
+
+def p_slice_bound(p):
+    """ slice_bound : number_expr
+                    | empty
+    """
+    p[0] = p[1]
 
 def p_search_param_list(p):
     """ search_param_list : coll_param_list
     """
     p[0] = p[1]
 
+###################################################
+############           Config          ############
+###################################################
+
+def p_reload_config(p):
+    """ reload_config : STRING STRING
+    """
+    # reload 和 config 不作为保留字，以免影响同名的集合和字段
+    if p[1].lower() != 'reload' or p[2].lower() != 'config':
+        raise GrammarException("Syntax error in input!")
+    p[0] = {
+        'type' : 'reload_config'
+    }
+
 ###################################################
 ############           Where           ############
 ###################################################
@@ -745,10 +827,27 @@ def p_where(p):
     """ where : WHERE conditions
               | empty
     """
+    # 条件在这里才渲染成字符串；只有 parse_handle(sql, tree=True) 时才保留表达式树的根节点
     if len(p) == 2:
-        p[0] = {'expr': ''}
-    elif len(p) == 3:
-        p[0] = p[2]
+        p[0] = {'expr': '', 'where': None, 'always_false': False}
+    elif not p.lexer.simplify:
+        # parse_condition：保持条件原来的样子
+        p[0] = {'expr': to_expr(p[2]), 'where': p[2], 'always_false': False}
+    else:
+        # 化简后的条件恒为真或恒为假时保留原条件，恒为假时由 caller 直接返回空结果
+        tree = simplify(p[2])
+        if isinstance(tree, bool):
+            tree, always_false = p[2], not tree
+        else:
+            always_false = False
+        p[0] = {'expr': to_expr(tree), 'where': tree if p.lexer.tree else None, 'always_false': always_false}
+
+def _set_where(query, where):
+    query['expr'] = where['expr']
+    query['where'] = where['where']
+    # 只有条件恒为假时才有 always_false，不影响其他语句的结果
+    if where['always_false']:
+        query['always_false'] = True
 
 
 
@@ -760,29 +859,30 @@ def p_conditions(p):
                    | compare
                    | condition_function
     """
-    bool_expr = None
     if len(p) == 2:
         # compare
-        bool_expr = p[1]['expr']
+        p[0] = p[1]
     elif len(p) == 3:
         # not
-        bool_expr = f'not {p[2]["expr"]}'
+        p[0] = Not(p[2])
     elif len(p) == 4:
-        if '(' in p:
+        if p[1] == '(':
             # brackets
-            bool_expr = f'({p[2]["expr"]})'
-        elif p[2].upper() == 'AND':
-            bool_expr = f'{p[1]["expr"]} and {p[3]["expr"]}'
-        elif p[2].upper() == 'OR':
-            bool_expr = f'{p[1]["expr"]} or {p[3]["expr"]}'
-
-    p[0] = {
-        'expr': bool_expr
-    }
+            p[0] = Paren(p[2])
+        else:
+            # and, or 为左结合，a or b or c 直接追加到左边的 BoolOp 中，
+            # 成千上万项的条件也只是一个节点，构造和渲染的耗时与项数成线性关系
+            op = p[2].lower()
+            if isinstance(p[1], BoolOp) and p[1].op == op:
+                p[1].values.append(p[3])
+                p[0] = p[1]
+            else:
+                p[0] = BoolOp(op, [p[1], p[3]])
 
 def p_limit(p):
     """ limit : empty
               | LIMIT number_expr
+              | LIMIT PARAM
     """
     if len(p) == 2:
         p[0] = None
@@ -792,6 +892,7 @@ def p_limit(p):
 def p_offset(p):
     """ offset : empty
                | OFFSET number_expr
+               | OFFSET PARAM
     """
     if len(p) == 2:
         p[0] = None
@@ -799,21 +900,6 @@ def p_offset(p):
         p[0] = p[2]
 
 
-def p_binary_arith_op(p):
-    """ binary_arith_op : "*" "*"
-                        | "+"
-                        | "-"
-                        | "*"
-                        | "/"
-                        | "%"
-    """
-    if len(p) == 3:
-        # **
-        p[0] = "**"
-    elif len(p) == 2:
-        p[0] = p[1]
-
-
 def p_unary_arith_op(p):
     """ unary_arith_op : "+"
                        | "-"
@@ -823,23 +909,38 @@ def p_unary_arith_op(p):
 
 def p_constant_expr(p):
     """ constant_expr : value
-                      | constant_expr binary_arith_op constant_expr
-                      | unary_arith_op constant_expr
+                      | constant_expr "+" constant_expr
+                      | constant_expr "-" constant_expr
+                      | constant_expr "*" constant_expr
+                      | constant_expr "/" constant_expr
+                      | constant_expr "%" constant_expr
+                      | constant_expr POW constant_expr
+                      | unary_arith_op constant_expr %prec UMINUS
                       | "(" constant_expr ")"
     """
-    # 不在算术表达式中添加括号，直接将原表达式传入milvus，以此回避运算符优先级等问题
+    # 两侧都是数字常量的运算在这里折叠成一个常量，见 sqlparser.folding
     if len(p) == 2:
-        p[0] = json.dumps(p[1][0])
+        p[0] = Literal(_scalar(p[1][0]))
     elif len(p) == 3:
         # unary
-        p[0] = f"{p[1]}{p[2]}"
+        p[0] = fold(UnaryOp(p[1], p[2]))
     elif len(p) == 4:
-        if "(" in p:
+        if p[1] == "(":
             # brackets
-            p[0] = f"({p[2]})"
+            p[0] = fold(Paren(p[2]))
+        elif p[2] == '**':
+            # milvus 中负号不属于数字字面量，-2 ** 2 等于 -(2 ** 2)
+            left = p[1]
+            if isinstance(left, Literal) and type(left.value) in (int, float) and left.value < 0:
+                left = UnaryOp('-', Literal(-left.value))
+            if isinstance(left, UnaryOp):
+                # 一元负号的优先级低于 **，这里的 UnaryOp 只能来自上面的改写
+                p[0] = fold(UnaryOp(left.op, fold(BinaryOp('**', left.operand, p[3]))))
+            else:
+                p[0] = fold(BinaryOp('**', left, p[3]))
         else:
             # binary
-            p[0] = f"{p[1]} {p[2]} {p[3]}"
+            p[0] = fold(BinaryOp(p[2], p[1], p[3]))
 
 
 def p_identifier(p):
@@ -849,13 +950,13 @@ def p_identifier(p):
     """
     if len(p) == 2:
         # simple name
-        p[0] = p[1]
+        p[0] = Identifier(p[1])
     elif len(p) == 5:
         if isinstance(p[3], str):
-            p[0] = f'{p[1]}["{p[3]}"]'
+            p[0] = Identifier(f'{p[1].name}["{p[3]}"]')
         else:
             # number
-            p[0] = f'{p[1]}[{p[3]}]'
+            p[0] = Identifier(f'{p[1].name}[{p[3]}]')
 
 
 def p_comparable(p):
@@ -869,10 +970,10 @@ def p_comparable(p):
         p[0] = p[1]
     elif len(p) == 4:
         # brackets
-        p[0] = f"({p[2]})"
+        p[0] = Paren(p[2])
     elif len(p) == 5:
         # ARRAY_LENGTH(id)
-        p[0] = f"ARRAY_LENGTH({p[3]})"
+        p[0] = Call('ARRAY_LENGTH', [p[3]])
 
 
 def p_compare(p):
@@ -883,16 +984,17 @@ def p_compare(p):
                 | identifier BETWEEN value AND value
                 | identifier NOT BETWEEN value AND value
                 | identifier in "[" value_list "]"
+                | identifier in PARAM
     """
-    bool_expr = None
     if len(p) == 4:
         # comparison, like
 
         if p[2] in ['LIKE', 'NOT LIKE']:
             # like
-            bool_expr = f'({p[1]} LIKE "{p[3]}")'
-            if p[2].startswith('NOT'):
-                bool_expr = f'(not {bool_expr})'
+            p[0] = Like(p[1], p[3], p[2].startswith('NOT'))
+        elif p[2] in ['in', 'not in']:
+            # in, the whole list is a parameter
+            p[0] = In(p[1], p[3], p[2].startswith('not'))
         else:
             # comparison
             comp = p[2]
@@ -900,23 +1002,17 @@ def p_compare(p):
                 comp = '!='
             elif comp == '=':
                 comp = '=='
-            bool_expr = f'({p[1]} {comp} {p[3]})'
+            p[0] = Compare(comp, p[1], p[3])
     elif len(p) == 6:
         if p[2] in ['in', 'not in']:
             # in
-            bool_expr = f'({p[1]} in {p[4]})'
-            if p[2].startswith('not'):
-                bool_expr = f'(not {bool_expr})'
+            p[0] = In(p[1], [_scalar(value) for value in p[4]], p[2].startswith('not'))
         else:
             # between and
-            bool_expr = f'({p[3][0]} <= {p[1]} <= {p[5][0]})'
+            p[0] = Between(p[1], _scalar(p[3][0]), _scalar(p[5][0]))
     elif len(p) == 7:
         # not between and
-        bool_expr = f'(not ({p[4][0]} <= {p[1]} <= {p[6][0]}))'
-
-    p[0] = {
-        'expr': bool_expr
-    }
+        p[0] = Between(p[1], _scalar(p[4][0]), _scalar(p[6][0]), negated=True)
 
 
 def p_like(p):
@@ -942,14 +1038,8 @@ def p_in(p):
 def p_condition_function(p):
     """ condition_function : condition_function_def "(" identifier COMMA value ")"
     """
-    p[0] = dict()
-    if len(p) == 7:
-        json_value = json.dumps(p[5][0])
-        p[0]['func_name'] = p[1]
-        p[0]['expr'] = f'({p[1]}({p[3]}, {json_value}))'
-    else:
-        p[0]['func_name'] = p[1]
-        p[0]['expr'] = f'({p[1]}({p[3]}))'
+    # 和比较一样，函数条件的两侧带括号
+    p[0] = Paren(Call(p[1], [p[3], Literal(_scalar(p[5][0]))]))
 
 
 def p_condition_function_def(p):
@@ -1005,12 +1095,51 @@ tokens = lexer.tokens
 
 DEBUG = False
 
-L = lex.lex(module=lexer, optimize=False, debug=DEBUG)
-P = yacc.yacc(debug=DEBUG)
+# 分析表由 python -m sqlparser.build_tables 预先生成在 lextab.py/parsetab.py 里，
+# optimize 模式下直接载入，不再检查规则和签名。修改 lexer.py 或语法规则之后必须重新生成
+L = lex.lex(module=lexer, optimize=True, lextab='sqlparser.lextab', debug=DEBUG)
+P = yacc.yacc(debug=DEBUG, optimize=True, tabmodule='sqlparser.parsetab')
+
+# lexer 的 lexdata/lexpos 和 parser 的 statestack/symstack 都是解析过程中的可变状态，
+# 每个线程使用自己的副本；分析表只读，在副本之间共享
+_local = threading.local()
 
 
-def parse_handle(sql):
-    return P.parse(input=sql,lexer=L,debug=DEBUG)
+def _thread_instances():
+    try:
+        return _local.lexer, _local.parser
+    except AttributeError:
+        _local.lexer = L.clone()
+        _local.parser = copy.copy(P)
+        return _local.lexer, _local.parser
+
+
+def parse_handle(sql, tree=False):
+    """
+    Parse one statement into a query dict. Safe to call from several threads
+    at once, every thread parses with its own lexer and parser instance.
+    query['where'] holds the tree of the WHERE condition only when tree is
+    True, otherwise it is None and the condition is kept as query['expr'].
+    """
+    lexer_, parser = _thread_instances()
+    lexer_.param_count = 0
+    lexer_.simplify = True
+    lexer_.tree = tree
+    # 注册了 instrument 的 hook 时按阶段计时，否则与原来完全相同
+    if instrument.enabled():
+        return instrument.parse(sql, lexer_, parser, debug=DEBUG)
+    return parser.parse(input=sql,lexer=lexer_,debug=DEBUG)
+
+
+def parse_condition(condition):
+    """
+    Parse a WHERE condition into its tree as written, without simplify().
+    Raises LexerException / GrammarException like parse_handle.
+    """
+    lexer_, parser = _thread_instances()
+    lexer_.param_count = 0
+    lexer_.simplify = False
+    return parser.parse(input='delete from c where ' + condition + ';', lexer=lexer_, debug=DEBUG)['where']
 
 
 
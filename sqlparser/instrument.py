@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in timing of parse_handle, split into its phases.
+
+    from sqlparser import instrument
+
+    registry = instrument.MetricsRegistry()
+    instrument.add_hook(registry.record)      # or any callable taking ParseStats
+    ...
+    registry.snapshot()                       # totals per statement type
+
+While no hook is registered parsing runs exactly as before. With a hook,
+every parsed statement produces one ParseStats: the time spent in the
+lexer, in the semantic actions (the p_* functions building dicts, nodes and
+strings) and in the LALR table walk itself, the number of tokens and the
+size of the result. INSERT/UPSERT statements taken by the fast path are
+reported too, with the VALUES scan as lex time, building the rows or
+columns as action time, and no tokens or table walk. Hooks run in the
+parsing thread, after the statement was parsed or failed; an exception
+raised by a hook propagates to the caller.
+"""
+import copy
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from . import fastpath
+
+ParseStats = namedtuple('ParseStats', [
+    'statement_type',   # query['type']，解析失败时为 None
+    'sql_length',
+    'tokens',           # 快速路径的 INSERT/UPSERT 不分词，为 0
+    'lex_seconds',
+    'action_seconds',
+    'parse_seconds',    # 查表、移进和归约本身，不含 lex 和语义动作
+    'total_seconds',
+    'output_bytes',     # 解析结果 (dict/list/str 等) 占用的内存
+    'error',            # 解析失败时的异常，否则为 None
+])
+
+_hooks = []
+_hooks_lock = threading.Lock()
+_local = threading.local()
+
+
+def add_hook(hook):
+    """
+    Call hook(ParseStats) after every parse_handle call.
+    """
+    global _hooks
+    with _hooks_lock:
+        # 复制后替换，parse_handle 读取时不需要加锁
+        _hooks = _hooks + [hook]
+
+
+def remove_hook(hook):
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = hooks
+
+
+def enabled():
+    return bool(_hooks)
+
+
+def _output_bytes(value):
+    # 用显式的栈遍历，很大的 INSERT 也不会超出递归深度
+    total = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif hasattr(item, '__slots__'):
+            stack.extend(getattr(item, name) for name in item.__slots__ if hasattr(item, name))
+    return total
+
+
+class _Timer:
+    __slots__ = ('lex', 'actions', 'tokens')
+
+    def reset(self):
+        self.lex = 0.0
+        self.actions = 0.0
+        self.tokens = 0
+
+
+def _timed_action(func, timer):
+    def action(p):
+        start = time.perf_counter()
+        try:
+            func(p)
+        finally:
+            timer.actions += time.perf_counter() - start
+    return action
+
+
+def _instances(parser):
+    # 每个线程一个带计时的 parser 副本，它的 productions 换成计时的语义动作；
+    # 未开启时使用的 parser 不受影响
+    try:
+        return _local.parser, _local.timer
+    except AttributeError:
+        timer = _Timer()
+        timed = copy.copy(parser)
+        timed.productions = []
+        for production in parser.productions:
+            production = copy.copy(production)
+            if production.callable is not None:
+                production.callable = _timed_action(production.callable, timer)
+            timed.productions.append(production)
+        _local.parser, _local.timer = timed, timer
+        return timed, timer
+
+
+def parse(sql, lexer, parser, debug=False):
+    """
+    Parse like parser.parse(), timing each phase and passing the ParseStats
+    to the registered hooks.
+    """
+    timed, timer = _instances(parser)
+    timer.reset()
+    token = lexer.token
+
+    def next_token():
+        start = time.perf_counter()
+        tok = token()
+        timer.lex += time.perf_counter() - start
+        if tok is not None:
+            timer.tokens += 1
+        return tok
+
+    query = error = None
+    start = time.perf_counter()
+    try:
+        query = timed.parse(input=sql, lexer=lexer, debug=debug, tokenfunc=next_token)
+        return query
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        total = time.perf_counter() - start
+        _report(sql, query, error, timer.tokens, timer.lex, timer.actions,
+                max(total - timer.lex - timer.actions, 0.0), total)
+
+
+def parse_insert(sql, columnar=False):
+    """
+    Parse like fastpath.parse_insert(), passing the ParseStats to the
+    registered hooks. Nothing is reported when the statement is not for the
+    fast path, parse_handle() reports it.
+    """
+    start = time.perf_counter()
+    scanned = fastpath.scan_insert(sql)
+    scanned_at = time.perf_counter()
+    if scanned is None:
+        return None
+    query = error = None
+    try:
+        query = fastpath.build_insert(scanned, columnar)
+        return query
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        end = time.perf_counter()
+        _report(sql, query, error, 0, scanned_at - start, end - scanned_at, 0.0, end - start)
+
+
+def _report(sql, query, error, tokens, lex, actions, parse, total):
+    stats = ParseStats(
+        statement_type=query.get('type') if isinstance(query, dict) else None,
+        sql_length=len(sql),
+        tokens=tokens,
+        lex_seconds=lex,
+        action_seconds=actions,
+        parse_seconds=parse,
+        total_seconds=total,
+        output_bytes=_output_bytes(query) if query is not None else 0,
+        error=error,
+    )
+    for hook in _hooks:
+        hook(stats)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe totals of ParseStats per statement type, a ready-made hook
+    for exporting to a monitoring system.
+    """
+
+    FIELDS = ('count', 'errors', 'tokens', 'lex_seconds', 'action_seconds', 'parse_seconds',
+              'total_seconds', 'output_bytes')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = dict()
+        self._max = dict()
+
+    def record(self, stats):
+        key = stats.statement_type or 'error'
+        with self._lock:
+            totals = self._totals.get(key)
+            if totals is None:
+                totals = self._totals[key] = dict.fromkeys(self.FIELDS, 0)
+            totals['count'] += 1
+            totals['errors'] += stats.error is not None
+            for name in self.FIELDS[2:]:
+                totals[name] += getattr(stats, name)
+            self._max[key] = max(self._max.get(key, 0.0), stats.total_seconds)
+
+    __call__ = record
+
+    def snapshot(self):
+        """
+        Return {statement type: totals}, with max_total_seconds, the slowest
+        statement of each type. Failed statements are under 'error'.
+        """
+        with self._lock:
+            return {key: dict(totals, max_total_seconds=self._max[key])
+                    for key, totals in self._totals.items()}
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+            self._max.clear()
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
+import base64
+import binascii
+import sys
+from array import array
 
 from .exceptions import LexerException
+from .param import Param
 
 reserved = {
     'select': 'SELECT',
@@ -75,6 +80,10 @@ tokens = (
     'FLOAT',
     'END',
     'COMMA',
+    'PARAM',
+    'BYTES',
+    'FLOAT_VECTOR',
+    'POW',
 ) + tuple(set(reserved.values()))
 
 # 原来的<和>移到literals里了，COMPARISON里少了这两个符号，写条件时需要单独做下判断
@@ -100,6 +109,35 @@ def t_NULL(t):
     return t
 
 
+def t_BYTES(t):
+    r"[xX]'[^']*'|[bB]64'[^']*'"
+    # binary vector 字面量：X'0fa3' (十六进制) 或 B64'D6M=' (base64)，直接解码为 bytes
+    try:
+        if t.value[0] in 'xX':
+            t.value = bytes.fromhex(t.value[2:-1])
+        else:
+            t.value = base64.b64decode(t.value[4:-1], validate=True)
+    except (ValueError, binascii.Error):
+        raise LexerException("Illegal binary literal at line %s pos %s" % (t.lineno, t.lexpos))
+    return t
+
+
+def t_FLOAT_VECTOR(t):
+    r"[fF]32'[^']*'"
+    # float vector 字面量：F32'...' 为 little-endian float32 的 base64 编码，解码为 array('f')
+    try:
+        raw = base64.b64decode(t.value[4:-1], validate=True)
+    except (ValueError, binascii.Error):
+        raise LexerException("Illegal float vector literal at line %s pos %s" % (t.lineno, t.lexpos))
+    if len(raw) % 4 != 0:
+        raise LexerException("Float vector literal length must be a multiple of 4 bytes at line %s pos %s" % (t.lineno, t.lexpos))
+    t.value = array('f')
+    t.value.frombytes(raw)
+    if sys.byteorder == 'big':
+        t.value.byteswap()
+    return t
+
+
 def t_STRING(t):
     r"[a-zA-Z][_a-zA-Z0-9]*"
     t.type = reserved.get(t.value.lower(), 'STRING')
@@ -113,6 +151,28 @@ def t_QSTRING(t):
     # r"\"(?:[^\"\\]|\\[\"\\/bfnrt]|\\u[0-9a-fA-F]{4})*\"|'(?:[^'\\]|\\['\\/bfnrt]|\\u[0-9a-fA-F]{4})*'"
     return t
 
+def t_PARAM(t):
+    r"\?|:[a-zA-Z][_a-zA-Z0-9]*"
+    # {"key":value} 里紧跟在引号后面的冒号不是参数
+    data = t.lexer.lexdata
+    i = t.lexpos - 1
+    while i >= 0 and data[i] in ' \t\n':
+        i -= 1
+    if t.value != '?' and i >= 0 and data[i] in '\'"`':
+        t.type = ':'
+        t.value = ':'
+        t.lexer.lexpos = t.lexpos + 1
+        return t
+
+    if t.value == '?':
+        # 位置参数按出现顺序编号，每次解析前由 parse_handle 清零
+        count = getattr(t.lexer, 'param_count', 0)
+        t.lexer.param_count = count + 1
+        t.value = Param(count)
+    else:
+        t.value = Param(t.value[1:])
+    return t
+
 def t_FLOAT(t):
     # r"(-?\d+)(\.\d+)?"
     r"[0-9]+(\.([0-9]+)?([eE][-+]?[0-9]+)?|[eE][-+]?[0-9]+)"
@@ -126,6 +186,13 @@ def t_NUMBER(t):
     return t
 
 
+def t_POW(t):
+    r"\*[ \t\n]*\*"
+    # 兼容原来 * * 的写法
+    t.value = '**'
+    return t
+
+
 def t_error(t):
     raise LexerException("Illegal character '%s' at line %s pos %s"
                          % (t.value[0], t.lineno, t.lexpos))
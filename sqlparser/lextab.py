@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ALIAS', 'ALIASES', 'AND', 'ARRAY_CONTAINS', 'ARRAY_CONTAINS_ALL', 'ARRAY_CONTAINS_ANY', 'ARRAY_LENGTH', 'AUTO', 'BETWEEN', 'BOOLEAN', 'BULK', 'BY', 'BYTES', 'COLLECTION', 'COLLECTIONS', 'COMMA', 'COMPACT', 'COMPARISON', 'COUNT', 'CREATE', 'DATABASE', 'DATABASES', 'DELETE', 'DESCRIPTION', 'DROP', 'END', 'FLOAT', 'FLOAT_VECTOR', 'FOR', 'FROM', 'ID', 'IN', 'INDEX', 'INDEXES', 'INSERT', 'INTO', 'JSON_CONTAINS', 'JSON_CONTAINS_ALL', 'JSON_CONTAINS_ANY', 'KEY', 'LIKE', 'LIMIT', 'LOAD', 'NOT', 'NULL', 'NUMBER', 'OFFSET', 'ON', 'OR', 'ORDER', 'PARAM', 'PARTITION', 'PARTITIONS', 'POW', 'PRIMARY', 'QSTRING', 'RELEASE', 'RENAME', 'SELECT', 'SHOW', 'STRING', 'TO', 'UPSERT', 'USE', 'VALUES', 'WHERE', 'WITH'))
+_lexreflags   = 64
+_lexliterals  = '()<>{}@%.*[]:-^/+'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_BOOLEAN>(true|false))|(?P<t_NULL>(null))|(?P<t_BYTES>[xX]\'[^\']*\'|[bB]64\'[^\']*\')|(?P<t_FLOAT_VECTOR>[fF]32\'[^\']*\')|(?P<t_STRING>[a-zA-Z][_a-zA-Z0-9]*)|(?P<t_QSTRING>(\'[^\']*\')|(\\"[^\\"]*\\")|(`[^`]*`))|(?P<t_PARAM>\\?|:[a-zA-Z][_a-zA-Z0-9]*)|(?P<t_FLOAT>[0-9]+(\\.([0-9]+)?([eE][-+]?[0-9]+)?|[eE][-+]?[0-9]+))|(?P<t_NUMBER>(0|[1-9]\\d*))|(?P<t_POW>\\*[ \\t\\n]*\\*)|(?P<t_COMPARISON><>|!=|>=|<=|=)|(?P<t_COMMA>,)|(?P<t_END>;)', [None, ('t_BOOLEAN', 'BOOLEAN'), None, ('t_NULL', 'NULL'), None, ('t_BYTES', 'BYTES'), ('t_FLOAT_VECTOR', 'FLOAT_VECTOR'), ('t_STRING', 'STRING'), ('t_QSTRING', 'QSTRING'), None, None, None, ('t_PARAM', 'PARAM'), ('t_FLOAT', 'FLOAT'), None, None, None, ('t_NUMBER', 'NUMBER'), None, ('t_POW', 'POW'), (None, 'COMPARISON'), (None, 'COMMA'), (None, 'END')])]}
+_lexstateignore = {'INITIAL': ' \t\n'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Typed tree of a WHERE clause.
+
+grammar.py builds the tree from the conditions; to_expr() turns it into
+the Milvus bool expression kept in query['expr']. The root is stored in
+query['where'] only when the statement is parsed with tree=True. Nodes are treated as immutable: the parse cache
+shares them between lookups, passes over the tree build new nodes instead of
+modifying existing ones.
+
+Literal values stay plain Python values (or Param for prepared statements).
+Between and In keep their operands as raw values, the way the grammar has
+always rendered them.
+"""
+import json
+
+from .param import Param
+
+
+def _dumps(value):
+    # 预编译语句的参数先以占位标记写入表达式，执行时再替换为实际的值
+    if isinstance(value, Param):
+        return value.marker
+    try:
+        return json.dumps(value)
+    except TypeError:
+        if isinstance(value, list):
+            return '[' + ', '.join(_dumps(item) for item in value) + ']'
+        if isinstance(value, dict):
+            return '{' + ', '.join(f'{json.dumps(k)}: {_dumps(v)}' for k, v in value.items()) + '}'
+        raise
+
+
+class Node:
+    """
+    Base class of the tree nodes. The arguments of __init__ are the slots in
+    the order of __slots__, so a node can be rebuilt generically.
+    """
+
+    __slots__ = ()
+
+    def _parts(self):
+        # 依次给出字符串片段和子节点，由 to_expr 拼接
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        args = ', '.join(repr(getattr(self, name)) for name in self.__slots__)
+        return f'{type(self).__name__}({args})'
+
+
+class Literal(Node):
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def _parts(self):
+        return [_dumps(self.value)]
+
+
+class Identifier(Node):
+    # name 为 field 名，或者带下标的 json/array 元素，如 x["k"][0]
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def _parts(self):
+        return [self.name]
+
+
+class UnaryOp(Node):
+    __slots__ = ('op', 'operand')
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+    def _parts(self):
+        return [self.op, self.operand]
+
+
+class BinaryOp(Node):
+    # 算术运算：+ - * / % **
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def _parts(self):
+        return [self.left, f' {self.op} ', self.right]
+
+
+class Paren(Node):
+    __slots__ = ('expr',)
+
+    def __init__(self, expr):
+        self.expr = expr
+
+    def _parts(self):
+        return ['(', self.expr, ')']
+
+
+class Call(Node):
+    # ARRAY_LENGTH(x)、json_contains(x, v) 等函数调用
+    __slots__ = ('name', 'args')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def _parts(self):
+        parts = [self.name, '(']
+        for index, arg in enumerate(self.args):
+            if index:
+                parts.append(', ')
+            parts.append(arg)
+        parts.append(')')
+        return parts
+
+
+class Compare(Node):
+    # op 为 milvus 的写法：== != < > <= >=
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def _parts(self):
+        return ['(', self.left, f' {self.op} ', self.right, ')']
+
+
+class Between(Node):
+    __slots__ = ('target', 'low', 'high', 'negated')
+
+    def __init__(self, target, low, high, negated=False):
+        self.target = target
+        self.low = low
+        self.high = high
+        self.negated = negated
+
+    def _parts(self):
+        parts = [f'({self.low} <= ', self.target, f' <= {self.high})']
+        return ['(not '] + parts + [')'] if self.negated else parts
+
+
+class Like(Node):
+    __slots__ = ('target', 'pattern', 'negated')
+
+    def __init__(self, target, pattern, negated=False):
+        self.target = target
+        self.pattern = pattern
+        self.negated = negated
+
+    def _parts(self):
+        parts = ['(', self.target, f' LIKE "{self.pattern}")']
+        return ['(not '] + parts + [')'] if self.negated else parts
+
+
+class In(Node):
+    # values 为值的列表，或者整个列表是一个参数 (Param)
+    __slots__ = ('target', 'values', 'negated')
+
+    def __init__(self, target, values, negated=False):
+        self.target = target
+        self.values = values
+        self.negated = negated
+
+    def _parts(self):
+        parts = ['(', self.target, f' in {self.values})']
+        return ['(not '] + parts + [')'] if self.negated else parts
+
+
+class Not(Node):
+    __slots__ = ('operand',)
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    def _parts(self):
+        return ['not ', self.operand]
+
+
+class BoolOp(Node):
+    # op 为 and 或 or
+    __slots__ = ('op', 'values')
+
+    def __init__(self, op, values):
+        self.op = op
+        self.values = values
+
+    def _parts(self):
+        parts = []
+        for index, value in enumerate(self.values):
+            if index:
+                parts.append(f' {self.op} ')
+            parts.append(value)
+        return parts
+
+
+def to_expr(node):
+    """
+    Render a tree as a Milvus bool expression.
+    """
+    # 用显式的栈代替递归，很深的树也不会超出递归深度，耗时与结果长度成线性关系
+    pieces = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            pieces.append(item)
+        else:
+            stack.extend(reversed(item._parts()))
+    return ''.join(pieces)
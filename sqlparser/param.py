@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import re
+
+# 参数在表达式字符串中的占位标记，绑定时替换为实际的值
+MARKER = re.compile('\x00([0-9]+|[a-zA-Z][_a-zA-Z0-9]*)\x00')
+
+
+class Param:
+    """
+    A bind parameter of a prepared statement, `?` (key is its position)
+    or `:name` (key is the name).
+    """
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    @property
+    def marker(self):
+        return f'\x00{self.key}\x00'
+
+    def __str__(self):
+        return self.marker
+
+    __repr__ = __str__
+
+    def __eq__(self, other):
+        return isinstance(other, Param) and other.key == self.key
+
+    def __hash__(self):
+        return hash(('Param', self.key))
@@ -0,0 +1,240 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDrightNOTleft+-left*/%rightUMINUSleftPOWrightNUMBERFLOATALIAS ALIASES AND ARRAY_CONTAINS ARRAY_CONTAINS_ALL ARRAY_CONTAINS_ANY ARRAY_LENGTH AUTO BETWEEN BOOLEAN BULK BY BYTES COLLECTION COLLECTIONS COMMA COMPACT COMPARISON COUNT CREATE DATABASE DATABASES DELETE DESCRIPTION DROP END FLOAT FLOAT_VECTOR FOR FROM ID IN INDEX INDEXES INSERT INTO JSON_CONTAINS JSON_CONTAINS_ALL JSON_CONTAINS_ANY KEY LIKE LIMIT LOAD NOT NULL NUMBER OFFSET ON OR ORDER PARAM PARTITION PARTITIONS POW PRIMARY QSTRING RELEASE RENAME SELECT SHOW STRING TO UPSERT USE VALUES WHERE WITH expression : db END\n                   | coll END\n                   | part END\n                   | idx END\n                   | insert END\n                   | delete END\n                   | query END\n                   | search END\n                   | reload_config END\n     db : create_db\n           | show_db\n           | drop_db\n           | use_db\n     create_db : CREATE DATABASE STRING\n     use_db : USE STRING\n     show_db : SHOW DATABASES\n     drop_db : DROP DATABASE STRING\n     coll : show_coll\n             | drop_coll\n             | create_alias\n             | drop_alias\n             | show_alias\n             | rename_coll\n             | load_coll\n             | release_coll\n             | compact_coll\n             | create_coll\n     show_coll : SHOW COLLECTIONS\n     drop_coll : DROP COLLECTION STRING\n     create_alias : CREATE ALIAS STRING FOR STRING\n     drop_alias : DROP ALIAS STRING FOR STRING\n     show_alias : SHOW ALIASES FOR STRING\n     rename_coll : RENAME COLLECTION STRING TO STRING IN STRING\n     load_coll : LOAD COLLECTION STRING\n                  | LOAD COLLECTION STRING WITH "{" QSTRING ":" number_expr "}"\n     release_coll : RELEASE COLLECTION STRING\n     compact_coll : COMPACT COLLECTION STRING\n     create_coll : CREATE COLLECTION STRING "(" field_list ")" WITH "{" coll_param_list "}"\n                    | CREATE COLLECTION STRING "(" field_list ")"\n     field_list : field_list field\n                   | field_list COMMA field\n                   | empty\n     field : STRING type attr_list\n     type : STRING\n             | STRING "(" number_expr ")"\n             | STRING STRING "(" number_expr ")"\n             | STRING "(" number_expr ")" STRING "(" number_expr ")"\n     attr_list : empty\n                  | attr attr_list\n     attr : PRIMARY KEY\n             | PARTITION KEY\n             | AUTO ID\n             | DESCRIPTION "(" QSTRING ")"\n     coll_param_list : coll_param coll_param_list\n                        | COMMA coll_param coll_param_list\n                        | empty\n     coll_param : QSTRING ":" QSTRING\n                   | QSTRING ":" number_expr\n                   | QSTRING ":" float_expr\n     part : create_part\n             | show_part\n             | drop_part  \n             | load_part\n             | release_part\n     create_part : CREATE PARTITION STRING ON STRING\n                    | CREATE PARTITION STRING ON STRING WITH "{" QSTRING ":" QSTRING "}"\n     show_part : SHOW PARTITIONS ON STRING\n     drop_part : DROP PARTITION STRING ON STRING\n     load_part : LOAD PARTITION STRING part_list ON STRING\n                  | LOAD PARTITION STRING part_list ON STRING WITH "{" QSTRING ":" number_expr "}"\n     release_part : RELEASE PARTITION STRING part_list ON STRING\n     part_list : empty\n                  | part_list COMMA STRING\n     idx : create_idx\n            | show_idx\n            | drop_idx\n     create_idx : CREATE INDEX STRING ON STRING "(" STRING ")"\n                   | CREATE INDEX STRING ON STRING "(" STRING ")" WITH "{" idx_param_list "}"\n     idx_param_list : coll_param_list\n     show_idx : SHOW INDEXES ON STRING\n     drop_idx : DROP INDEX STRING ON STRING\n     insert : bulk_insert\n               | insert_coll\n               | insert_part\n               | upsert_coll\n               | upsert_part\n     bulk_insert : BULK INSERT PARTITION STRING ON STRING FROM file_list\n                    | BULK INSERT COLLECTION STRING FROM file_list\n     file_list : file_list QSTRING\n                  | file_list COMMA QSTRING\n                  | empty\n     insert_coll : INSERT INTO STRING "(" field_name_list ")" VALUES values_list\n     insert_part : INSERT INTO PARTITION STRING ON STRING "(" field_name_list ")" VALUES values_list\n     upsert_coll : UPSERT INTO STRING "(" field_name_list ")" VALUES values_list\n     upsert_part : UPSERT INTO PARTITION STRING ON STRING "(" field_name_list ")" VALUES values_list\n     field_name_list : field_name_list field_name\n                        | field_name_list COMMA field_name\n                        | empty\n     field_name : STRING\n                   | COUNT "(" "*" ")"\n                   | "*"\n     values_list : values_list value_tuple\n                    | values_list COMMA value_tuple\n                    | empty\n     value_tuple : "(" value_list ")"\n     value_list : value_list value\n                   | value_list COMMA value\n                   | empty\n     value : single_value\n     json_value : json_value kv_pair\n                   | json_value COMMA kv_pair\n                   | empty\n     kv_pair : QSTRING ":" value\n     single_value : number_expr\n                     | float_expr\n                     | QSTRING\n                     | "{" json_value "}"\n                     | "[" multi_value "]"\n                     | BOOLEAN\n                     | NULL\n                     | PARAM\n                     | BYTES\n                     | FLOAT_VECTOR\n     multi_value : multi_value single_value\n                    | multi_value COMMA single_value\n                    | empty\n     delete : delete_coll\n               | delete_part\n     delete_coll : DELETE FROM STRING where\n                    | DELETE FROM STRING WITH "{" QSTRING ":" QSTRING "}"\n     delete_part : DELETE FROM PARTITION STRING ON STRING where\n                    | DELETE FROM PARTITION STRING ON STRING WITH "{" QSTRING ":" QSTRING "}"\n     query : query_coll\n              | query_part\n     query_coll : SELECT field_name_list FROM STRING limit offset WITH "{" QSTRING ":" QSTRING "}"\n                   | SELECT field_name_list FROM STRING limit offset where\n     query_part : SELECT field_name_list FROM PARTITION part_name_list ON STRING limit offset WITH "{" QSTRING ":" QSTRING "}"\n                   | SELECT field_name_list FROM PARTITION part_name_list ON STRING limit offset where\n     part_name_list : field_name_list\n     search : search_coll\n               | search_part\n     search_coll : SELECT field_name_list FROM STRING ORDER BY STRING "<" "-" ">" vec_list limit offset where WITH "{" search_param_list "}"\n     search_part : SELECT field_name_list FROM PARTITION part_name_list ON STRING ORDER BY STRING "<" "-" ">" vec_list limit offset where WITH "{" search_param_list "}"\n     vec_list : "[" value_list "]"\n                 | PARAM\n                 | STRING QSTRING\n                 | STRING QSTRING "[" row_slice "]"\n     row_slice : slice_bound ":" slice_bound\n     slice_bound : number_expr\n                    | empty\n     search_param_list : coll_param_list\n     reload_config : STRING STRING\n     where : WHERE conditions\n              | empty\n     conditions : NOT conditions\n                   | conditions AND conditions\n                   | conditions OR conditions\n                   | "(" conditions ")"\n                   | compare\n                   | condition_function\n     limit : empty\n              | LIMIT number_expr\n              | LIMIT PARAM\n     offset : empty\n               | OFFSET number_expr\n               | OFFSET PARAM\n     unary_arith_op : "+"\n                       | "-"\n     constant_expr : value\n                      | constant_expr "+" constant_expr\n                      | constant_expr "-" constant_expr\n                      | constant_expr "*" constant_expr\n                      | constant_expr "/" constant_expr\n                      | constant_expr "%" constant_expr\n                      | constant_expr POW constant_expr\n                      | unary_arith_op constant_expr %prec UMINUS\n                      | "(" constant_expr ")"\n     identifier : STRING\n                   | identifier "[" number_expr "]"\n                   | identifier "[" QSTRING "]"\n     comparable : identifier\n                   | constant_expr\n                   | ARRAY_LENGTH "(" identifier ")"\n                   | "(" comparable ")"\n     compare : comparable COMPARISON comparable\n                | comparable ">" comparable\n                | comparable "<" comparable\n                | identifier like QSTRING\n                | identifier BETWEEN value AND value\n                | identifier NOT BETWEEN value AND value\n                | identifier in "[" value_list "]"\n                | identifier in PARAM\n     like : LIKE\n             | NOT LIKE\n     in : IN\n           | NOT IN\n     condition_function : condition_function_def "(" identifier COMMA value ")"\n     condition_function_def : JSON_CONTAINS\n                               | JSON_CONTAINS_ALL\n                               | JSON_CONTAINS_ANY\n                               | ARRAY_CONTAINS\n                               | ARRAY_CONTAINS_ALL\n                               | ARRAY_CONTAINS_ANY\n     number_expr : "+" NUMBER\n                    | "-" NUMBER\n                    | NUMBER\n     float_expr : "+" FLOAT\n                   | "-" FLOAT\n                   | FLOAT\n    empty :'
+    
+_lr_action_items = {'STRING':([0,44,48,57,68,69,70,71,72,78,79,80,81,82,84,85,86,87,88,89,91,92,93,94,95,101,102,103,115,116,118,120,122,123,124,125,126,128,129,130,131,132,136,137,138,139,146,148,152,156,157,160,161,169,170,171,172,174,175,176,177,180,181,213,218,221,223,224,226,227,240,241,247,248,249,259,266,279,284,285,286,287,289,299,301,310,350,351,352,366,368,389,390,391,392,420,422,440,444,446,481,482,],[44,67,83,-210,96,97,98,99,100,104,105,106,107,108,109,110,111,112,113,114,117,119,121,124,-98,133,134,135,144,145,147,149,154,155,-99,-96,124,-101,159,-210,162,163,164,165,166,167,-210,-210,193,-210,-97,221,-42,229,230,231,232,124,236,124,238,193,193,275,124,286,-40,221,291,292,193,193,193,193,193,193,193,346,347,-100,348,-210,-41,-210,-210,193,-43,-48,-210,124,124,-49,-50,-51,-52,443,445,460,-46,-53,460,-47,]),'CREATE':([0,],[45,]),'SHOW':([0,],[46,]),'DROP':([0,],[47,]),'USE':([0,],[48,]),'RENAME':([0,],[49,]),'LOAD':([0,],[50,]),'RELEASE':([0,],[51,]),'COMPACT':([0,],[52,]),'BULK':([0,],[53,]),'INSERT':([0,53,],[54,90,]),'UPSERT':([0,],[55,]),'DELETE':([0,],[56,]),'SELECT':([0,],[57,]),'$end':([1,58,59,60,61,62,63,64,65,66,],[0,-1,-2,-3,-4,-5,-6,-7,-8,-9,]),'END':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,67,73,74,83,96,104,105,110,112,114,121,133,134,135,150,153,155,159,162,164,165,166,173,179,182,183,186,187,189,191,193,194,204,205,207,208,209,210,211,212,214,216,222,229,231,233,234,242,267,268,269,270,271,275,276,277,280,281,292,295,296,298,300,303,304,305,306,307,308,309,311,312,313,321,324,328,329,330,331,332,333,336,340,343,344,345,347,359,362,363,364,365,367,375,376,379,385,401,404,408,409,411,419,424,432,433,434,435,437,442,451,455,456,457,467,468,469,470,493,501,505,],[58,59,60,61,62,63,64,65,66,-10,-11,-12,-13,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-60,-61,-62,-63,-64,-74,-75,-76,-82,-83,-84,-85,-86,-127,-128,-133,-134,-140,-141,-152,-16,-28,-15,-14,-17,-29,-34,-36,-37,-210,-32,-67,-80,-129,-154,-210,-30,-65,-31,-68,-81,-210,-153,-159,-160,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,-210,-161,-39,-69,-71,-88,-91,-155,-204,-207,-205,-208,-176,-210,-210,-164,-162,-163,-33,-210,-89,-210,-210,-156,-157,-158,-184,-177,-185,-181,-186,-187,-188,-192,-118,-170,-171,-172,-173,-174,-175,-117,-131,-136,-165,-166,-210,-77,-87,-90,-92,-104,-94,-179,-180,-183,-210,-35,-102,-130,-189,-191,-210,-38,-103,-210,-210,-190,-197,-138,-66,-105,-93,-95,-78,-70,-132,-135,-137,-142,-143,]),'DATABASE':([45,47,],[68,78,]),'ALIAS':([45,47,],[69,80,]),'COLLECTION':([45,47,49,50,51,52,90,],[70,79,84,85,87,89,116,]),'PARTITION':([45,47,50,51,90,91,92,93,123,286,287,352,390,391,392,422,444,446,482,],[71,81,86,88,115,118,120,122,156,-44,354,354,-50,-51,-52,-45,-46,-53,-47,]),'INDEX':([45,47,],[72,82,]),'DATABASES':([46,],[73,]),'COLLECTIONS':([46,],[74,]),'ALIASES':([46,],[75,]),'PARTITIONS':([46,],[76,]),'INDEXES':([46,],[77,]),'INTO':([54,55,],[91,92,]),'FROM':([56,57,94,95,124,125,128,145,157,232,285,],[93,-210,123,-98,-99,-96,-101,173,-97,295,-100,]),'COMMA':([57,94,95,111,113,124,125,128,130,141,142,143,146,148,156,157,160,161,173,174,176,186,188,189,193,194,204,205,206,207,208,209,210,211,212,218,223,230,233,234,257,258,267,268,269,270,273,274,285,286,287,289,295,296,298,299,300,301,320,324,325,327,336,337,350,351,352,357,362,363,364,365,366,367,368,373,374,375,376,377,380,389,390,391,392,395,403,404,412,415,422,426,429,431,432,433,434,436,444,446,448,449,450,455,456,457,462,473,482,496,503,],[-210,126,-98,-210,-210,-99,-96,-101,-210,170,-72,170,-210,-210,-210,-97,224,-42,-210,126,126,-116,-210,-121,-178,-114,-109,-115,-210,-119,-120,-122,-123,-206,-209,126,-40,-73,297,-91,326,-126,-204,-207,-205,-208,338,-112,-100,-44,-210,-41,-210,-89,-210,-210,-210,-210,-210,-118,-124,378,-117,-110,-43,-48,-210,396,297,-90,405,-104,126,405,126,413,-108,-179,-180,-125,-111,-49,-50,-51,-52,396,-210,-102,-106,-113,-45,396,396,413,-103,-210,-210,-107,-46,-53,-57,-58,-59,-105,405,405,-210,413,-47,396,396,]),'COUNT':([57,94,95,124,125,126,128,146,148,156,157,174,176,218,285,299,301,366,368,],[-210,127,-98,-99,-96,127,-101,-210,-210,-210,-97,127,127,127,-100,-210,-210,127,127,]),'*':([57,94,95,124,125,126,128,146,148,156,157,158,174,176,186,187,189,191,194,204,205,207,208,209,210,211,212,218,245,267,268,269,270,271,285,299,301,307,324,328,329,330,331,332,333,335,336,366,368,],[-210,128,-98,-99,-96,128,-101,-210,-210,-210,-97,220,128,128,-116,-169,-121,262,-114,-109,-115,-119,-120,-122,-123,-206,-209,128,262,-204,-207,-205,-208,-176,-100,-210,-210,-177,-118,262,262,-172,-173,-174,-175,262,-117,128,128,]),'FOR':([75,97,106,],[101,129,136,]),'ON':([76,77,95,99,100,107,108,111,113,124,125,128,141,142,143,144,147,149,154,156,157,218,219,230,285,],[102,103,-98,131,132,137,138,-210,-210,-99,-96,-101,169,-72,171,172,175,177,213,-210,-97,-139,284,-73,-100,]),')':([95,124,125,128,130,146,148,157,160,161,174,176,182,183,186,187,189,191,193,194,204,205,207,208,209,210,211,212,220,223,242,243,244,245,246,267,268,269,270,271,285,286,287,289,291,299,301,303,304,305,306,307,308,309,311,312,313,321,324,328,329,330,331,332,333,334,335,336,350,351,352,366,368,370,374,375,376,379,388,389,390,391,392,403,409,411,412,414,421,422,423,431,435,436,437,444,446,476,482,],[-98,-99,-96,-101,-210,-210,-210,-97,222,-42,235,237,-159,-160,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,285,-40,-155,305,306,307,-181,-204,-207,-205,-208,-176,-100,-44,-210,-41,359,-210,-210,-156,-157,-158,-184,-177,-185,-181,-186,-187,-188,-192,-118,-170,-171,-172,-173,-174,-175,379,307,-117,-43,-48,-210,406,407,306,-108,-179,-180,-183,422,-49,-50,-51,-52,-210,-189,-191,-106,437,444,-45,446,455,-190,-107,-197,-46,-53,482,-47,]),'(':([98,117,119,127,152,163,180,181,190,192,195,196,197,198,199,200,201,202,203,236,238,240,241,247,248,249,260,261,262,263,264,265,272,286,298,300,310,348,356,364,365,367,404,405,432,433,434,445,455,456,457,],[130,146,148,158,181,226,181,181,259,266,-198,-199,-200,-201,-202,-203,-167,-168,272,299,301,181,181,310,310,310,272,272,272,272,272,272,272,349,-210,-210,310,387,393,403,-104,403,-102,403,-103,-210,-210,466,-105,403,403,]),'TO':([109,],[139,]),'WITH':([110,121,153,155,162,179,182,183,186,187,189,191,193,194,204,205,207,208,209,210,211,212,214,216,222,229,242,267,268,269,270,271,275,276,277,280,281,303,304,305,306,307,308,309,311,312,313,321,324,328,329,330,331,332,333,336,344,345,347,359,375,376,379,385,409,411,419,435,437,461,463,471,472,478,479,487,489,490,494,497,500,],[140,151,-154,-210,225,-153,-159,-160,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,-210,-161,288,294,-155,-204,-207,-205,-208,-176,341,342,-164,-162,-163,-156,-157,-158,-184,-177,-185,-181,-186,-187,-188,-192,-118,-170,-171,-172,-173,-174,-175,-117,-165,-166,-210,400,-179,-180,-183,-210,-189,-191,441,-190,-197,-210,-145,-146,-210,-210,-144,492,-210,-147,-210,-210,502,]),'WHERE':([121,155,211,214,216,267,269,275,276,277,280,281,344,345,347,385,419,461,463,471,472,478,479,489,490,494,497,],[152,-210,-206,-210,-161,-204,-205,152,152,-164,-162,-163,-165,-166,-210,-210,152,-210,-145,-146,-210,152,-144,-210,-147,-210,152,]),'{':([140,151,152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,225,240,241,247,248,249,251,257,258,260,261,262,263,264,265,267,268,269,270,272,288,294,310,317,320,324,325,326,336,341,342,371,373,374,377,378,381,400,403,410,412,413,431,436,441,462,473,492,502,],[168,178,206,206,206,-116,-210,-121,-114,-167,-168,206,-109,-115,-119,-120,-122,-123,-206,-209,290,206,206,206,206,206,206,206,-126,206,206,206,206,206,206,-204,-207,-205,-208,206,357,361,206,206,-210,-118,-124,206,-117,382,383,206,206,-108,-125,206,206,429,-210,206,-106,206,206,-107,464,-210,206,496,503,]),'NOT':([152,180,181,185,193,240,241,246,375,376,],[180,180,180,252,-178,180,180,252,-179,-180,]),'ARRAY_LENGTH':([152,180,181,240,241,247,248,249,310,],[192,192,192,192,192,192,192,192,192,]),'JSON_CONTAINS':([152,180,181,240,241,],[195,195,195,195,195,]),'JSON_CONTAINS_ALL':([152,180,181,240,241,],[196,196,196,196,196,]),'JSON_CONTAINS_ANY':([152,180,181,240,241,],[197,197,197,197,197,]),'ARRAY_CONTAINS':([152,180,181,240,241,],[198,198,198,198,198,]),'ARRAY_CONTAINS_ALL':([152,180,181,240,241,],[199,199,199,199,199,]),'ARRAY_CONTAINS_ANY':([152,180,181,240,241,],[200,200,200,200,200,]),'+':([152,180,181,186,187,188,189,191,194,201,202,203,204,205,207,208,209,210,211,212,217,240,241,245,247,248,249,251,254,257,258,260,261,262,263,264,265,267,268,269,270,271,272,278,293,307,310,317,320,324,325,326,328,329,330,331,332,333,335,336,349,371,373,374,377,378,381,387,403,410,412,413,427,430,431,436,462,466,473,477,491,],[201,201,201,-116,-169,-210,-121,260,-114,-167,-168,201,-109,-115,-119,-120,-122,-123,-206,-209,282,201,201,260,201,201,201,315,282,315,-126,201,201,201,201,201,201,-204,-207,-205,-208,-176,201,282,282,-177,201,315,-210,-118,-124,315,-170,-171,-172,-173,-174,-175,260,-117,282,315,315,-108,-125,315,315,282,-210,315,-106,315,315,282,315,-107,-210,282,315,282,282,]),'-':([152,180,181,186,187,188,189,191,194,201,202,203,204,205,207,208,209,210,211,212,217,240,241,245,247,248,249,251,254,257,258,260,261,262,263,264,265,267,268,269,270,271,272,278,293,307,310,317,320,324,325,326,328,329,330,331,332,333,335,336,349,371,373,374,377,378,381,384,387,403,410,412,413,427,430,431,436,462,465,466,473,477,491,],[202,202,202,-116,-169,-210,-121,261,-114,-167,-168,202,-109,-115,-119,-120,-122,-123,-206,-209,283,202,202,261,202,202,202,316,283,316,-126,202,202,202,202,202,202,-204,-207,-205,-208,-176,202,283,283,-177,202,316,-210,-118,-124,316,-170,-171,-172,-173,-174,-175,261,-117,283,316,316,-108,-125,316,316,418,283,-210,316,-106,316,316,283,316,-107,-210,475,283,316,283,283,]),'QSTRING':([152,168,173,178,180,181,186,188,189,194,201,202,203,204,205,206,207,208,209,210,211,212,233,234,240,241,247,248,249,250,251,254,255,257,258,260,261,262,263,264,265,267,268,269,270,272,273,274,290,295,296,297,302,310,317,318,320,324,325,326,336,337,338,357,361,362,363,371,373,374,377,378,380,381,382,383,393,395,396,399,403,410,412,413,415,426,427,429,431,436,438,439,448,449,450,460,462,464,473,480,496,503,],[186,228,-210,239,186,186,-116,-210,-121,-114,-167,-168,186,-109,-115,-210,-119,-120,-122,-123,-206,-209,296,-91,186,186,186,186,186,313,186,323,-193,186,-126,186,186,186,186,186,186,-204,-207,-205,-208,186,339,-112,358,-210,-89,363,369,186,186,-194,-210,-118,-124,186,-117,-110,339,398,402,296,-90,186,186,-108,-125,186,-111,186,416,417,423,398,398,428,-210,186,-106,186,-113,398,448,398,186,-107,458,459,-57,-58,-59,471,-210,474,186,488,398,398,]),'[':([152,180,181,185,186,188,189,193,194,201,202,203,204,205,207,208,209,210,211,212,240,241,246,247,248,249,251,253,256,257,258,260,261,262,263,264,265,267,268,269,270,272,309,310,317,319,320,324,325,326,327,334,336,371,373,374,375,376,377,378,381,403,410,412,413,431,436,440,462,471,473,481,],[188,188,188,254,-116,-210,-121,-178,-114,-167,-168,188,-109,-115,-119,-120,-122,-123,-206,-209,188,188,254,188,188,188,188,320,-195,188,-126,188,188,188,188,188,188,-204,-207,-205,-208,188,254,188,188,-196,-210,-118,-124,188,254,254,-117,188,188,-108,-179,-180,-125,188,188,-210,188,-106,188,188,-107,462,-210,477,188,462,]),'BOOLEAN':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,240,241,247,248,249,251,257,258,260,261,262,263,264,265,267,268,269,270,272,310,317,320,324,325,326,336,371,373,374,377,378,381,403,410,412,413,431,436,462,473,],[207,207,207,-116,-210,-121,-114,-167,-168,207,-109,-115,-119,-120,-122,-123,-206,-209,207,207,207,207,207,207,207,-126,207,207,207,207,207,207,-204,-207,-205,-208,207,207,207,-210,-118,-124,207,-117,207,207,-108,-125,207,207,-210,207,-106,207,207,-107,-210,207,]),'NULL':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,240,241,247,248,249,251,257,258,260,261,262,263,264,265,267,268,269,270,272,310,317,320,324,325,326,336,371,373,374,377,378,381,403,410,412,413,431,436,462,473,],[208,208,208,-116,-210,-121,-114,-167,-168,208,-109,-115,-119,-120,-122,-123,-206,-209,208,208,208,208,208,208,208,-126,208,208,208,208,208,208,-204,-207,-205,-208,208,208,208,-210,-118,-124,208,-117,208,208,-108,-125,208,208,-210,208,-106,208,208,-107,-210,208,]),'PARAM':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,217,240,241,247,248,249,251,253,256,257,258,260,261,262,263,264,265,267,268,269,270,272,278,310,317,319,320,324,325,326,336,371,373,374,377,378,381,403,410,412,413,431,436,440,462,473,481,],[189,189,189,-116,-210,-121,-114,-167,-168,189,-109,-115,-119,-120,-122,-123,-206,-209,281,189,189,189,189,189,189,321,-195,189,-126,189,189,189,189,189,189,-204,-207,-205,-208,189,345,189,189,-196,-210,-118,-124,189,-117,189,189,-108,-125,189,189,-210,189,-106,189,189,-107,463,-210,189,463,]),'BYTES':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,240,241,247,248,249,251,257,258,260,261,262,263,264,265,267,268,269,270,272,310,317,320,324,325,326,336,371,373,374,377,378,381,403,410,412,413,431,436,462,473,],[209,209,209,-116,-210,-121,-114,-167,-168,209,-109,-115,-119,-120,-122,-123,-206,-209,209,209,209,209,209,209,209,-126,209,209,209,209,209,209,-204,-207,-205,-208,209,209,209,-210,-118,-124,209,-117,209,209,-108,-125,209,209,-210,209,-106,209,209,-107,-210,209,]),'FLOAT_VECTOR':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,240,241,247,248,249,251,257,258,260,261,262,263,264,265,267,268,269,270,272,310,317,320,324,325,326,336,371,373,374,377,378,381,403,410,412,413,431,436,462,473,],[210,210,210,-116,-210,-121,-114,-167,-168,210,-109,-115,-119,-120,-122,-123,-206,-209,210,210,210,210,210,210,210,-126,210,210,210,210,210,210,-204,-207,-205,-208,210,210,210,-210,-118,-124,210,-117,210,210,-108,-125,210,210,-210,210,-106,210,210,-107,-210,210,]),'NUMBER':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,217,240,241,247,248,249,251,254,257,258,260,261,262,263,264,265,267,268,269,270,272,278,282,283,293,310,315,316,317,320,324,325,326,336,349,371,373,374,377,378,381,387,403,410,412,413,427,430,431,436,462,466,473,477,491,],[211,211,211,-116,-210,-121,-114,267,269,211,-109,-115,-119,-120,-122,-123,-206,-209,211,211,211,211,211,211,211,211,211,-126,211,211,211,211,211,211,-204,-207,-205,-208,211,211,267,269,211,211,267,269,211,-210,-118,-124,211,-117,211,211,211,-108,-125,211,211,211,-210,211,-106,211,211,211,211,-107,-210,211,211,211,211,]),'FLOAT':([152,180,181,186,188,189,194,201,202,203,204,205,207,208,209,210,211,212,240,241,247,248,249,251,257,258,260,261,262,263,264,265,267,268,269,270,272,310,315,316,317,320,324,325,326,336,371,373,374,377,378,381,403,410,412,413,427,431,436,462,473,],[212,212,212,-116,-210,-121,-114,268,270,212,-109,-115,-119,-120,-122,-123,-206,-209,212,212,212,212,212,212,212,-126,212,212,212,212,212,212,-204,-207,-205,-208,212,212,268,270,212,-210,-118,-124,212,-117,212,212,-108,-125,212,212,-210,212,-106,212,212,212,-107,-210,212,]),'ORDER':([155,347,],[215,386,]),'LIMIT':([155,347,461,463,471,479,489,490,],[217,217,217,-145,-146,-144,217,-147,]),'OFFSET':([155,211,214,216,267,269,280,281,347,385,461,463,471,472,479,489,490,494,],[-210,-206,278,-161,-204,-205,-162,-163,-210,278,-210,-145,-146,278,-144,-210,-147,278,]),'IN':([167,185,193,246,252,375,376,],[227,256,-178,256,319,-179,-180,]),'AND':([179,182,183,186,187,189,191,193,194,204,205,207,208,209,210,211,212,242,243,267,268,269,270,271,303,304,305,306,307,308,309,311,312,313,314,321,324,328,329,330,331,332,333,336,372,375,376,379,409,411,435,437,],[240,-159,-160,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,-155,240,-204,-207,-205,-208,-176,-156,240,-158,-184,-177,-185,-181,-186,-187,-188,371,-192,-118,-170,-171,-172,-173,-174,-175,-117,410,-179,-180,-183,-189,-191,-190,-197,]),'OR':([179,182,183,186,187,189,191,193,194,204,205,207,208,209,210,211,212,242,243,267,268,269,270,271,303,304,305,306,307,308,309,311,312,313,321,324,328,329,330,331,332,333,336,375,376,379,409,411,435,437,],[241,-159,-160,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,-155,241,-204,-207,-205,-208,-176,-156,-157,-158,-184,-177,-185,-181,-186,-187,-188,-192,-118,-170,-171,-172,-173,-174,-175,-117,-179,-180,-183,-189,-191,-190,-197,]),'COMPARISON':([184,185,186,187,189,191,193,194,204,205,207,208,209,210,211,212,244,245,246,267,268,269,270,271,306,307,324,328,329,330,331,332,333,336,375,376,379,],[247,-181,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,247,-182,-181,-204,-207,-205,-208,-176,-184,-177,-118,-170,-171,-172,-173,-174,-175,-117,-179,-180,-183,]),'>':([184,185,186,187,189,191,193,194,204,205,207,208,209,210,211,212,244,245,246,267,268,269,270,271,306,307,324,328,329,330,331,332,333,336,375,376,379,418,475,],[248,-181,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,248,-182,-181,-204,-207,-205,-208,-176,-184,-177,-118,-170,-171,-172,-173,-174,-175,-117,-179,-180,-183,440,481,]),'<':([184,185,186,187,189,191,193,194,204,205,207,208,209,210,211,212,244,245,246,267,268,269,270,271,306,307,324,328,329,330,331,332,333,336,346,375,376,379,443,],[249,-181,-116,-169,-121,-182,-178,-114,-109,-115,-119,-120,-122,-123,-206,-209,249,-182,-181,-204,-207,-205,-208,-176,-184,-177,-118,-170,-171,-172,-173,-174,-175,-117,384,-179,-180,-183,465,]),'BETWEEN':([185,193,246,252,375,376,],[251,-178,251,317,-179,-180,]),'LIKE':([185,193,246,252,375,376,],[255,-178,255,318,-179,-180,]),'/':([186,187,189,191,194,204,205,207,208,209,210,211,212,245,267,268,269,270,271,307,324,328,329,330,331,332,333,335,336,],[-116,-169,-121,263,-114,-109,-115,-119,-120,-122,-123,-206,-209,263,-204,-207,-205,-208,-176,-177,-118,263,263,-172,-173,-174,-175,263,-117,]),'%':([186,187,189,191,194,204,205,207,208,209,210,211,212,245,267,268,269,270,271,307,324,328,329,330,331,332,333,335,336,],[-116,-169,-121,264,-114,-109,-115,-119,-120,-122,-123,-206,-209,264,-204,-207,-205,-208,-176,-177,-118,264,264,-172,-173,-174,-175,264,-117,]),'POW':([186,187,189,191,194,204,205,207,208,209,210,211,212,245,267,268,269,270,271,307,324,328,329,330,331,332,333,335,336,],[-116,-169,-121,265,-114,-109,-115,-119,-120,-122,-123,-206,-209,265,-204,-207,-205,-208,265,-177,-118,265,265,265,265,265,-175,265,-117,]),']':([186,188,189,194,204,205,207,208,209,210,211,212,257,258,267,268,269,270,320,322,323,324,325,336,373,374,377,412,436,462,473,483,485,486,491,495,],[-116,-210,-121,-114,-109,-115,-119,-120,-122,-123,-206,-209,324,-126,-204,-207,-205,-208,-210,375,376,-118,-124,-117,411,-108,-125,-106,-107,-210,479,490,-149,-150,-210,-148,]),'}':([186,189,194,204,205,206,207,208,209,210,211,212,267,268,269,270,273,274,324,336,337,357,360,369,380,394,395,397,415,425,426,428,429,447,448,449,450,452,453,454,458,459,488,496,498,499,503,504,],[-116,-121,-114,-109,-115,-210,-119,-120,-122,-123,-206,-209,-204,-207,-205,-208,336,-112,-118,-117,-110,-210,401,408,-111,424,-210,-56,-113,-54,-210,451,-210,-55,-57,-58,-59,467,-79,468,469,470,493,-210,501,-151,-210,505,]),':':([211,228,239,267,269,339,358,398,402,416,417,474,477,484,485,486,],[-206,293,302,-204,-205,381,399,427,430,438,439,480,-210,491,-149,-150,]),'BY':([215,386,],[279,420,]),'VALUES':([235,237,406,407,],[298,300,433,434,]),'PRIMARY':([286,287,352,390,391,392,422,444,446,482,],[-44,353,353,-50,-51,-52,-45,-46,-53,-47,]),'AUTO':([286,287,352,390,391,392,422,444,446,482,],[-44,355,355,-50,-51,-52,-45,-46,-53,-47,]),'DESCRIPTION':([286,287,352,390,391,392,422,444,446,482,],[-44,356,356,-50,-51,-52,-45,-46,-53,-47,]),'KEY':([353,354,],[390,391,]),'ID':([355,],[392,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression':([0,],[1,]),'db':([0,],[2,]),'coll':([0,],[3,]),'part':([0,],[4,]),'idx':([0,],[5,]),'insert':([0,],[6,]),'delete':([0,],[7,]),'query':([0,],[8,]),'search':([0,],[9,]),'reload_config':([0,],[10,]),'create_db':([0,],[11,]),'show_db':([0,],[12,]),'drop_db':([0,],[13,]),'use_db':([0,],[14,]),'show_coll':([0,],[15,]),'drop_coll':([0,],[16,]),'create_alias':([0,],[17,]),'drop_alias':([0,],[18,]),'show_alias':([0,],[19,]),'rename_coll':([0,],[20,]),'load_coll':([0,],[21,]),'release_coll':([0,],[22,]),'compact_coll':([0,],[23,]),'create_coll':([0,],[24,]),'create_part':([0,],[25,]),'show_part':([0,],[26,]),'drop_part':([0,],[27,]),'load_part':([0,],[28,]),'release_part':([0,],[29,]),'create_idx':([0,],[30,]),'show_idx':([0,],[31,]),'drop_idx':([0,],[32,]),'bulk_insert':([0,],[33,]),'insert_coll':([0,],[34,]),'insert_part':([0,],[35,]),'upsert_coll':([0,],[36,]),'upsert_part':([0,],[37,]),'delete_coll':([0,],[38,]),'delete_part':([0,],[39,]),'query_coll':([0,],[40,]),'query_part':([0,],[41,]),'search_coll':([0,],[42,]),'search_part':([0,],[43,]),'field_name_list':([57,146,148,156,299,301,],[94,174,176,218,366,368,]),'empty':([57,111,113,121,130,146,148,155,156,173,188,206,214,275,276,287,295,298,299,300,301,320,347,352,357,385,395,403,419,426,429,433,434,461,462,472,477,478,489,491,494,496,497,503,],[95,142,142,153,161,95,95,216,95,234,258,274,277,153,153,351,234,365,95,365,95,374,216,351,397,277,397,374,153,397,397,365,365,216,374,277,486,153,216,486,277,397,153,397,]),'field_name':([94,126,174,176,218,366,368,],[125,157,125,125,125,125,125,]),'part_list':([111,113,],[141,143,]),'where':([121,275,276,419,478,497,],[150,340,343,442,487,500,]),'field_list':([130,],[160,]),'conditions':([152,180,181,240,241,],[179,242,243,303,304,]),'compare':([152,180,181,240,241,],[182,182,182,182,182,]),'condition_function':([152,180,181,240,241,],[183,183,183,183,183,]),'comparable':([152,180,181,240,241,247,248,249,310,],[184,184,244,184,184,308,311,312,370,]),'identifier':([152,180,181,240,241,247,248,249,259,266,310,],[185,185,246,185,185,309,309,309,327,334,309,]),'value':([152,180,181,203,240,241,247,248,249,251,260,261,262,263,264,265,272,310,317,371,373,378,381,410,413,431,473,],[187,187,187,187,187,187,187,187,187,314,187,187,187,187,187,187,187,187,372,409,412,414,415,435,436,412,412,]),'condition_function_def':([152,180,181,240,241,],[190,190,190,190,190,]),'constant_expr':([152,180,181,203,240,241,247,248,249,260,261,262,263,264,265,272,310,],[191,191,245,271,191,191,191,191,191,328,329,330,331,332,333,335,245,]),'number_expr':([152,180,181,203,217,240,241,247,248,249,251,254,257,260,261,262,263,264,265,272,278,293,310,317,326,349,371,373,378,381,387,410,413,427,430,431,466,473,477,491,],[194,194,194,194,280,194,194,194,194,194,194,322,194,194,194,194,194,194,194,194,344,360,194,194,194,388,194,194,194,194,421,194,194,449,454,194,476,194,485,485,]),'unary_arith_op':([152,180,181,203,240,241,247,248,249,260,261,262,263,264,265,272,310,],[203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,]),'single_value':([152,180,181,203,240,241,247,248,249,251,257,260,261,262,263,264,265,272,310,317,326,371,373,378,381,410,413,431,473,],[204,204,204,204,204,204,204,204,204,204,325,204,204,204,204,204,204,204,204,204,377,204,204,204,204,204,204,204,204,]),'float_expr':([152,180,181,203,240,241,247,248,249,251,257,260,261,262,263,264,265,272,310,317,326,371,373,378,381,410,413,427,431,473,],[205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,205,450,205,205,]),'limit':([155,347,461,489,],[214,385,472,494,]),'part_name_list':([156,],[219,]),'field':([160,224,],[223,289,]),'file_list':([173,295,],[233,362,]),'like':([185,246,],[250,250,]),'in':([185,246,],[253,253,]),'multi_value':([188,],[257,]),'json_value':([206,],[273,]),'offset':([214,385,472,494,],[276,419,478,497,]),'type':([221,],[287,]),'kv_pair':([273,338,],[337,380,]),'attr_list':([287,352,],[350,389,]),'attr':([287,352,],[352,352,]),'values_list':([298,300,433,434,],[364,367,456,457,]),'value_list':([320,403,462,],[373,431,473,]),'coll_param_list':([357,395,426,429,496,503,],[394,425,447,453,499,499,]),'coll_param':([357,395,396,426,429,496,503,],[395,395,426,395,395,395,395,]),'value_tuple':([364,367,405,456,457,],[404,404,432,404,404,]),'idx_param_list':([429,],[452,]),'vec_list':([440,481,],[461,489,]),'row_slice':([477,],[483,]),'slice_bound':([477,491,],[484,495,]),'search_param_list':([496,503,],[498,504,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expression","S'",1,None,None,None),
+  ('expression -> db END','expression',2,'p_expression','grammar.py',33),
+  ('expression -> coll END','expression',2,'p_expression','grammar.py',34),
+  ('expression -> part END','expression',2,'p_expression','grammar.py',35),
+  ('expression -> idx END','expression',2,'p_expression','grammar.py',36),
+  ('expression -> insert END','expression',2,'p_expression','grammar.py',37),
+  ('expression -> delete END','expression',2,'p_expression','grammar.py',38),
+  ('expression -> query END','expression',2,'p_expression','grammar.py',39),
+  ('expression -> search END','expression',2,'p_expression','grammar.py',40),
+  ('expression -> reload_config END','expression',2,'p_expression','grammar.py',41),
+  ('db -> create_db','db',1,'p_db','grammar.py',50),
+  ('db -> show_db','db',1,'p_db','grammar.py',51),
+  ('db -> drop_db','db',1,'p_db','grammar.py',52),
+  ('db -> use_db','db',1,'p_db','grammar.py',53),
+  ('create_db -> CREATE DATABASE STRING','create_db',3,'p_create_db','grammar.py',58),
+  ('use_db -> USE STRING','use_db',2,'p_use_db','grammar.py',66),
+  ('show_db -> SHOW DATABASES','show_db',2,'p_show_db','grammar.py',74),
+  ('drop_db -> DROP DATABASE STRING','drop_db',3,'p_drop_db','grammar.py',81),
+  ('coll -> show_coll','coll',1,'p_coll','grammar.py',92),
+  ('coll -> drop_coll','coll',1,'p_coll','grammar.py',93),
+  ('coll -> create_alias','coll',1,'p_coll','grammar.py',94),
+  ('coll -> drop_alias','coll',1,'p_coll','grammar.py',95),
+  ('coll -> show_alias','coll',1,'p_coll','grammar.py',96),
+  ('coll -> rename_coll','coll',1,'p_coll','grammar.py',97),
+  ('coll -> load_coll','coll',1,'p_coll','grammar.py',98),
+  ('coll -> release_coll','coll',1,'p_coll','grammar.py',99),
+  ('coll -> compact_coll','coll',1,'p_coll','grammar.py',100),
+  ('coll -> create_coll','coll',1,'p_coll','grammar.py',101),
+  ('show_coll -> SHOW COLLECTIONS','show_coll',2,'p_show_coll','grammar.py',106),
+  ('drop_coll -> DROP COLLECTION STRING','drop_coll',3,'p_drop_coll','grammar.py',113),
+  ('create_alias -> CREATE ALIAS STRING FOR STRING','create_alias',5,'p_create_alias','grammar.py',121),
+  ('drop_alias -> DROP ALIAS STRING FOR STRING','drop_alias',5,'p_drop_alias','grammar.py',130),
+  ('show_alias -> SHOW ALIASES FOR STRING','show_alias',4,'p_show_alias','grammar.py',139),
+  ('rename_coll -> RENAME COLLECTION STRING TO STRING IN STRING','rename_coll',7,'p_rename_coll','grammar.py',147),
+  ('load_coll -> LOAD COLLECTION STRING','load_coll',3,'p_load_coll','grammar.py',157),
+  ('load_coll -> LOAD COLLECTION STRING WITH { QSTRING : number_expr }','load_coll',9,'p_load_coll','grammar.py',158),
+  ('release_coll -> RELEASE COLLECTION STRING','release_coll',3,'p_release_coll','grammar.py',168),
+  ('compact_coll -> COMPACT COLLECTION STRING','compact_coll',3,'p_compact_coll','grammar.py',176),
+  ('create_coll -> CREATE COLLECTION STRING ( field_list ) WITH { coll_param_list }','create_coll',10,'p_create_coll','grammar.py',184),
+  ('create_coll -> CREATE COLLECTION STRING ( field_list )','create_coll',6,'p_create_coll','grammar.py',185),
+  ('field_list -> field_list field','field_list',2,'p_field_list','grammar.py',204),
+  ('field_list -> field_list COMMA field','field_list',3,'p_field_list','grammar.py',205),
+  ('field_list -> empty','field_list',1,'p_field_list','grammar.py',206),
+  ('field -> STRING type attr_list','field',3,'p_field','grammar.py',215),
+  ('type -> STRING','type',1,'p_type','grammar.py',220),
+  ('type -> STRING ( number_expr )','type',4,'p_type','grammar.py',221),
+  ('type -> STRING STRING ( number_expr )','type',5,'p_type','grammar.py',222),
+  ('type -> STRING ( number_expr ) STRING ( number_expr )','type',8,'p_type','grammar.py',223),
+  ('attr_list -> empty','attr_list',1,'p_attr_list','grammar.py',246),
+  ('attr_list -> attr attr_list','attr_list',2,'p_attr_list','grammar.py',247),
+  ('attr -> PRIMARY KEY','attr',2,'p_attr','grammar.py',255),
+  ('attr -> PARTITION KEY','attr',2,'p_attr','grammar.py',256),
+  ('attr -> AUTO ID','attr',2,'p_attr','grammar.py',257),
+  ('attr -> DESCRIPTION ( QSTRING )','attr',4,'p_attr','grammar.py',258),
+  ('coll_param_list -> coll_param coll_param_list','coll_param_list',2,'p_coll_param_list','grammar.py',274),
+  ('coll_param_list -> COMMA coll_param coll_param_list','coll_param_list',3,'p_coll_param_list','grammar.py',275),
+  ('coll_param_list -> empty','coll_param_list',1,'p_coll_param_list','grammar.py',276),
+  ('coll_param -> QSTRING : QSTRING','coll_param',3,'p_coll_param','grammar.py',286),
+  ('coll_param -> QSTRING : number_expr','coll_param',3,'p_coll_param','grammar.py',287),
+  ('coll_param -> QSTRING : float_expr','coll_param',3,'p_coll_param','grammar.py',288),
+  ('part -> create_part','part',1,'p_part','grammar.py',298),
+  ('part -> show_part','part',1,'p_part','grammar.py',299),
+  ('part -> drop_part','part',1,'p_part','grammar.py',300),
+  ('part -> load_part','part',1,'p_part','grammar.py',301),
+  ('part -> release_part','part',1,'p_part','grammar.py',302),
+  ('create_part -> CREATE PARTITION STRING ON STRING','create_part',5,'p_create_part','grammar.py',307),
+  ('create_part -> CREATE PARTITION STRING ON STRING WITH { QSTRING : QSTRING }','create_part',11,'p_create_part','grammar.py',308),
+  ('show_part -> SHOW PARTITIONS ON STRING','show_part',4,'p_show_part','grammar.py',319),
+  ('drop_part -> DROP PARTITION STRING ON STRING','drop_part',5,'p_drop_part','grammar.py',327),
+  ('load_part -> LOAD PARTITION STRING part_list ON STRING','load_part',6,'p_load_part','grammar.py',336),
+  ('load_part -> LOAD PARTITION STRING part_list ON STRING WITH { QSTRING : number_expr }','load_part',12,'p_load_part','grammar.py',337),
+  ('release_part -> RELEASE PARTITION STRING part_list ON STRING','release_part',6,'p_release_part','grammar.py',348),
+  ('part_list -> empty','part_list',1,'p_part_list','grammar.py',357),
+  ('part_list -> part_list COMMA STRING','part_list',3,'p_part_list','grammar.py',358),
+  ('idx -> create_idx','idx',1,'p_idx','grammar.py',370),
+  ('idx -> show_idx','idx',1,'p_idx','grammar.py',371),
+  ('idx -> drop_idx','idx',1,'p_idx','grammar.py',372),
+  ('create_idx -> CREATE INDEX STRING ON STRING ( STRING )','create_idx',8,'p_create_idx','grammar.py',377),
+  ('create_idx -> CREATE INDEX STRING ON STRING ( STRING ) WITH { idx_param_list }','create_idx',12,'p_create_idx','grammar.py',378),
+  ('idx_param_list -> coll_param_list','idx_param_list',1,'p_idx_param_list','grammar.py',399),
+  ('show_idx -> SHOW INDEXES ON STRING','show_idx',4,'p_show_idx','grammar.py',404),
+  ('drop_idx -> DROP INDEX STRING ON STRING','drop_idx',5,'p_drop_idx','grammar.py',412),
+  ('insert -> bulk_insert','insert',1,'p_insert','grammar.py',424),
+  ('insert -> insert_coll','insert',1,'p_insert','grammar.py',425),
+  ('insert -> insert_part','insert',1,'p_insert','grammar.py',426),
+  ('insert -> upsert_coll','insert',1,'p_insert','grammar.py',427),
+  ('insert -> upsert_part','insert',1,'p_insert','grammar.py',428),
+  ('bulk_insert -> BULK INSERT PARTITION STRING ON STRING FROM file_list','bulk_insert',8,'p_bulk_insert','grammar.py',433),
+  ('bulk_insert -> BULK INSERT COLLECTION STRING FROM file_list','bulk_insert',6,'p_bulk_insert','grammar.py',434),
+  ('file_list -> file_list QSTRING','file_list',2,'p_file_list','grammar.py',451),
+  ('file_list -> file_list COMMA QSTRING','file_list',3,'p_file_list','grammar.py',452),
+  ('file_list -> empty','file_list',1,'p_file_list','grammar.py',453),
+  ('insert_coll -> INSERT INTO STRING ( field_name_list ) VALUES values_list','insert_coll',8,'p_insert_coll','grammar.py',462),
+  ('insert_part -> INSERT INTO PARTITION STRING ON STRING ( field_name_list ) VALUES values_list','insert_part',11,'p_insert_part','grammar.py',476),
+  ('upsert_coll -> UPSERT INTO STRING ( field_name_list ) VALUES values_list','upsert_coll',8,'p_upsert_coll','grammar.py',491),
+  ('upsert_part -> UPSERT INTO PARTITION STRING ON STRING ( field_name_list ) VALUES values_list','upsert_part',11,'p_upsert_part','grammar.py',505),
+  ('field_name_list -> field_name_list field_name','field_name_list',2,'p_field_name_list','grammar.py',520),
+  ('field_name_list -> field_name_list COMMA field_name','field_name_list',3,'p_field_name_list','grammar.py',521),
+  ('field_name_list -> empty','field_name_list',1,'p_field_name_list','grammar.py',522),
+  ('field_name -> STRING','field_name',1,'p_field_name','grammar.py',531),
+  ('field_name -> COUNT ( * )','field_name',4,'p_field_name','grammar.py',532),
+  ('field_name -> *','field_name',1,'p_field_name','grammar.py',533),
+  ('values_list -> values_list value_tuple','values_list',2,'p_values_list','grammar.py',541),
+  ('values_list -> values_list COMMA value_tuple','values_list',3,'p_values_list','grammar.py',542),
+  ('values_list -> empty','values_list',1,'p_values_list','grammar.py',543),
+  ('value_tuple -> ( value_list )','value_tuple',3,'p_value_tuple','grammar.py',552),
+  ('value_list -> value_list value','value_list',2,'p_value_list','grammar.py',557),
+  ('value_list -> value_list COMMA value','value_list',3,'p_value_list','grammar.py',558),
+  ('value_list -> empty','value_list',1,'p_value_list','grammar.py',559),
+  ('value -> single_value','value',1,'p_value','grammar.py',569),
+  ('json_value -> json_value kv_pair','json_value',2,'p_json_value','grammar.py',577),
+  ('json_value -> json_value COMMA kv_pair','json_value',3,'p_json_value','grammar.py',578),
+  ('json_value -> empty','json_value',1,'p_json_value','grammar.py',579),
+  ('kv_pair -> QSTRING : value','kv_pair',3,'p_kv_pair','grammar.py',588),
+  ('single_value -> number_expr','single_value',1,'p_single_value','grammar.py',593),
+  ('single_value -> float_expr','single_value',1,'p_single_value','grammar.py',594),
+  ('single_value -> QSTRING','single_value',1,'p_single_value','grammar.py',595),
+  ('single_value -> { json_value }','single_value',3,'p_single_value','grammar.py',596),
+  ('single_value -> [ multi_value ]','single_value',3,'p_single_value','grammar.py',597),
+  ('single_value -> BOOLEAN','single_value',1,'p_single_value','grammar.py',598),
+  ('single_value -> NULL','single_value',1,'p_single_value','grammar.py',599),
+  ('single_value -> PARAM','single_value',1,'p_single_value','grammar.py',600),
+  ('single_value -> BYTES','single_value',1,'p_single_value','grammar.py',601),
+  ('single_value -> FLOAT_VECTOR','single_value',1,'p_single_value','grammar.py',602),
+  ('multi_value -> multi_value single_value','multi_value',2,'p_multi_value','grammar.py',610),
+  ('multi_value -> multi_value COMMA single_value','multi_value',3,'p_multi_value','grammar.py',611),
+  ('multi_value -> empty','multi_value',1,'p_multi_value','grammar.py',612),
+  ('delete -> delete_coll','delete',1,'p_delete','grammar.py',624),
+  ('delete -> delete_part','delete',1,'p_delete','grammar.py',625),
+  ('delete_coll -> DELETE FROM STRING where','delete_coll',4,'p_delete_coll','grammar.py',630),
+  ('delete_coll -> DELETE FROM STRING WITH { QSTRING : QSTRING }','delete_coll',9,'p_delete_coll','grammar.py',631),
+  ('delete_part -> DELETE FROM PARTITION STRING ON STRING where','delete_part',7,'p_delete_part','grammar.py',642),
+  ('delete_part -> DELETE FROM PARTITION STRING ON STRING WITH { QSTRING : QSTRING }','delete_part',12,'p_delete_part','grammar.py',643),
+  ('query -> query_coll','query',1,'p_query','grammar.py',658),
+  ('query -> query_part','query',1,'p_query','grammar.py',659),
+  ('query_coll -> SELECT field_name_list FROM STRING limit offset WITH { QSTRING : QSTRING }','query_coll',12,'p_query_coll','grammar.py',664),
+  ('query_coll -> SELECT field_name_list FROM STRING limit offset where','query_coll',7,'p_query_coll','grammar.py',665),
+  ('query_part -> SELECT field_name_list FROM PARTITION part_name_list ON STRING limit offset WITH { QSTRING : QSTRING }','query_part',15,'p_query_part','grammar.py',680),
+  ('query_part -> SELECT field_name_list FROM PARTITION part_name_list ON STRING limit offset where','query_part',10,'p_query_part','grammar.py',681),
+  ('part_name_list -> field_name_list','part_name_list',1,'p_part_name_list','grammar.py',696),
+  ('search -> search_coll','search',1,'p_search','grammar.py',704),
+  ('search -> search_part','search',1,'p_search','grammar.py',705),
+  ('search_coll -> SELECT field_name_list FROM STRING ORDER BY STRING < - > vec_list limit offset where WITH { search_param_list }','search_coll',18,'p_search_coll','grammar.py',710),
+  ('search_part -> SELECT field_name_list FROM PARTITION part_name_list ON STRING ORDER BY STRING < - > vec_list limit offset where WITH { search_param_list }','search_part',21,'p_search_part','grammar.py',738),
+  ('vec_list -> [ value_list ]','vec_list',3,'p_vec_list','grammar.py',765),
+  ('vec_list -> PARAM','vec_list',1,'p_vec_list','grammar.py',766),
+  ('vec_list -> STRING QSTRING','vec_list',2,'p_vec_list','grammar.py',767),
+  ('vec_list -> STRING QSTRING [ row_slice ]','vec_list',5,'p_vec_list','grammar.py',768),
+  ('row_slice -> slice_bound : slice_bound','row_slice',3,'p_row_slice','grammar.py',791),
+  ('slice_bound -> number_expr','slice_bound',1,'p_slice_bound','grammar.py',796),
+  ('slice_bound -> empty','slice_bound',1,'p_slice_bound','grammar.py',797),
+  ('search_param_list -> coll_param_list','search_param_list',1,'p_search_param_list','grammar.py',802),
+  ('reload_config -> STRING STRING','reload_config',2,'p_reload_config','grammar.py',811),
+  ('where -> WHERE conditions','where',2,'p_where','grammar.py',824),
+  ('where -> empty','where',1,'p_where','grammar.py',825),
+  ('conditions -> NOT conditions','conditions',2,'p_conditions','grammar.py',848),
+  ('conditions -> conditions AND conditions','conditions',3,'p_conditions','grammar.py',849),
+  ('conditions -> conditions OR conditions','conditions',3,'p_conditions','grammar.py',850),
+  ('conditions -> ( conditions )','conditions',3,'p_conditions','grammar.py',851),
+  ('conditions -> compare','conditions',1,'p_conditions','grammar.py',852),
+  ('conditions -> condition_function','conditions',1,'p_conditions','grammar.py',853),
+  ('limit -> empty','limit',1,'p_limit','grammar.py',876),
+  ('limit -> LIMIT number_expr','limit',2,'p_limit','grammar.py',877),
+  ('limit -> LIMIT PARAM','limit',2,'p_limit','grammar.py',878),
+  ('offset -> empty','offset',1,'p_offset','grammar.py',886),
+  ('offset -> OFFSET number_expr','offset',2,'p_offset','grammar.py',887),
+  ('offset -> OFFSET PARAM','offset',2,'p_offset','grammar.py',888),
+  ('unary_arith_op -> +','unary_arith_op',1,'p_unary_arith_op','grammar.py',897),
+  ('unary_arith_op -> -','unary_arith_op',1,'p_unary_arith_op','grammar.py',898),
+  ('constant_expr -> value','constant_expr',1,'p_constant_expr','grammar.py',904),
+  ('constant_expr -> constant_expr + constant_expr','constant_expr',3,'p_constant_expr','grammar.py',905),
+  ('constant_expr -> constant_expr - constant_expr','constant_expr',3,'p_constant_expr','grammar.py',906),
+  ('constant_expr -> constant_expr * constant_expr','constant_expr',3,'p_constant_expr','grammar.py',907),
+  ('constant_expr -> constant_expr / constant_expr','constant_expr',3,'p_constant_expr','grammar.py',908),
+  ('constant_expr -> constant_expr % constant_expr','constant_expr',3,'p_constant_expr','grammar.py',909),
+  ('constant_expr -> constant_expr POW constant_expr','constant_expr',3,'p_constant_expr','grammar.py',910),
+  ('constant_expr -> unary_arith_op constant_expr','constant_expr',2,'p_constant_expr','grammar.py',911),
+  ('constant_expr -> ( constant_expr )','constant_expr',3,'p_constant_expr','grammar.py',912),
+  ('identifier -> STRING','identifier',1,'p_identifier','grammar.py',940),
+  ('identifier -> identifier [ number_expr ]','identifier',4,'p_identifier','grammar.py',941),
+  ('identifier -> identifier [ QSTRING ]','identifier',4,'p_identifier','grammar.py',942),
+  ('comparable -> identifier','comparable',1,'p_comparable','grammar.py',956),
+  ('comparable -> constant_expr','comparable',1,'p_comparable','grammar.py',957),
+  ('comparable -> ARRAY_LENGTH ( identifier )','comparable',4,'p_comparable','grammar.py',958),
+  ('comparable -> ( comparable )','comparable',3,'p_comparable','grammar.py',959),
+  ('compare -> comparable COMPARISON comparable','compare',3,'p_compare','grammar.py',973),
+  ('compare -> comparable > comparable','compare',3,'p_compare','grammar.py',974),
+  ('compare -> comparable < comparable','compare',3,'p_compare','grammar.py',975),
+  ('compare -> identifier like QSTRING','compare',3,'p_compare','grammar.py',976),
+  ('compare -> identifier BETWEEN value AND value','compare',5,'p_compare','grammar.py',977),
+  ('compare -> identifier NOT BETWEEN value AND value','compare',6,'p_compare','grammar.py',978),
+  ('compare -> identifier in [ value_list ]','compare',5,'p_compare','grammar.py',979),
+  ('compare -> identifier in PARAM','compare',3,'p_compare','grammar.py',980),
+  ('like -> LIKE','like',1,'p_like','grammar.py',1012),
+  ('like -> NOT LIKE','like',2,'p_like','grammar.py',1013),
+  ('in -> IN','in',1,'p_in','grammar.py',1022),
+  ('in -> NOT IN','in',2,'p_in','grammar.py',1023),
+  ('condition_function -> condition_function_def ( identifier COMMA value )','condition_function',6,'p_condition_function','grammar.py',1032),
+  ('condition_function_def -> JSON_CONTAINS','condition_function_def',1,'p_condition_function_def','grammar.py',1039),
+  ('condition_function_def -> JSON_CONTAINS_ALL','condition_function_def',1,'p_condition_function_def','grammar.py',1040),
+  ('condition_function_def -> JSON_CONTAINS_ANY','condition_function_def',1,'p_condition_function_def','grammar.py',1041),
+  ('condition_function_def -> ARRAY_CONTAINS','condition_function_def',1,'p_condition_function_def','grammar.py',1042),
+  ('condition_function_def -> ARRAY_CONTAINS_ALL','condition_function_def',1,'p_condition_function_def','grammar.py',1043),
+  ('condition_function_def -> ARRAY_CONTAINS_ANY','condition_function_def',1,'p_condition_function_def','grammar.py',1044),
+  ('number_expr -> + NUMBER','number_expr',2,'p_number_expr','grammar.py',1050),
+  ('number_expr -> - NUMBER','number_expr',2,'p_number_expr','grammar.py',1051),
+  ('number_expr -> NUMBER','number_expr',1,'p_number_expr','grammar.py',1052),
+  ('float_expr -> + FLOAT','float_expr',2,'p_float_expr','grammar.py',1064),
+  ('float_expr -> - FLOAT','float_expr',2,'p_float_expr','grammar.py',1065),
+  ('float_expr -> FLOAT','float_expr',1,'p_float_expr','grammar.py',1066),
+  ('empty -> <empty>','empty',0,'p_empty','grammar.py',1079),
+]
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import json
+from collections.abc import Mapping
+
+from .grammar import parse_handle
+from .param import Param, MARKER
+from .nodes import Node
+from .simplify import simplify
+from .vectors import pack_vectors
+from .exceptions import ParameterException
+
+
+def _collect(node, keys):
+    if isinstance(node, Param):
+        keys.add(node.key)
+    elif isinstance(node, dict):
+        for value in node.values():
+            _collect(value, keys)
+    elif isinstance(node, list):
+        for value in node:
+            _collect(value, keys)
+    elif isinstance(node, str) and '\x00' in node:
+        for key in MARKER.findall(node):
+            keys.add(int(key) if key.isdigit() else key)
+
+
+def _render(value):
+    if isinstance(value, tuple):
+        value = list(value)
+    try:
+        return json.dumps(value)
+    except TypeError:
+        raise ParameterException(f'cannot use {type(value).__name__} in a condition')
+
+
+def _substitute(values):
+    def replace(match):
+        key = match.group(1)
+        return _render(values[int(key) if key.isdigit() else key])
+    return replace
+
+
+def _bind(node, values):
+    if isinstance(node, Param):
+        return values[node.key]
+    if isinstance(node, dict):
+        return {k: _bind(v, values) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_bind(v, values) for v in node]
+    if isinstance(node, Node):
+        # 表达式树的节点按 __slots__ 的顺序重新构造
+        return type(node)(*[_bind(getattr(node, name), values) for name in node.__slots__])
+    if isinstance(node, str) and '\x00' in node:
+        return MARKER.sub(_substitute(values), node)
+    return node
+
+
+class PreparedStatement:
+    """
+    A statement parsed once, executed many times with different values.
+
+    `?` parameters are bound from a sequence, `:name` parameters from a
+    mapping. bind() returns a fresh query dict for caller.func_map.
+    """
+
+    def __init__(self, sql, template):
+        self.sql = sql
+        self.template = template
+        keys = set()
+        _collect(template, keys)
+        self.param_count = len([key for key in keys if isinstance(key, int)])
+        self.param_names = frozenset(key for key in keys if isinstance(key, str))
+        if self.param_count and self.param_names:
+            raise ParameterException('cannot mix positional and named parameters')
+
+    def bind(self, params=None):
+        if self.param_names:
+            if not isinstance(params, Mapping):
+                raise ParameterException('named parameters need a mapping')
+            missing = self.param_names - params.keys()
+            if missing:
+                raise ParameterException('missing parameters: ' + ', '.join(sorted(missing)))
+            values = params
+        elif self.param_count:
+            if params is None or isinstance(params, (str, Mapping)) or len(params) != self.param_count:
+                raise ParameterException(f'need {self.param_count} positional parameters')
+            values = list(params)
+        else:
+            if params:
+                raise ParameterException('statement has no parameters')
+            values = ()
+            return _bind(self.template, values)
+        query = _bind(self.template, values)
+        if query.get('type') == 'search' and isinstance(query['data'], list):
+            # 绑定的查询向量和字面量一样打包，<-> ? 和 [?, ...] 的行在这里才有值
+            try:
+                query['data'] = pack_vectors(query['data'])
+            except ValueError as e:
+                raise ParameterException(str(e))
+        # 代入参数后条件可能恒为假，如 a in ? and a > 10 绑定 [[1, 2]]
+        if query.get('where') is not None and simplify(query['where']) is False:
+            query['always_false'] = True
+        return query
+
+    def __repr__(self):
+        return f'PreparedStatement({self.sql!r})'
+
+
+def prepare(sql):
+    return PreparedStatement(sql, parse_handle(sql, tree=True))
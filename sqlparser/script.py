@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Split a SQL script into statements without reading it into memory at once.
+"""
+import re
+
+_SPECIAL = re.compile(r"""[;'"`]""")
+
+
+def _chunks(stream, chunk_size):
+    if isinstance(stream, str):
+        return (stream,)
+    if hasattr(stream, 'read'):
+        return iter(lambda: stream.read(chunk_size), '')
+    # 其他可迭代对象，例如按行迭代的文件或字符串列表
+    return stream
+
+
+def split_statements(stream, chunk_size=65536):
+    """
+    Yield the statements of a script one by one, each ending with `;`.
+
+    stream is a string, a text file object or any iterable of strings, it is
+    consumed incrementally. A `;` inside '...', "..." or `...` does not end a
+    statement, statements may span several lines, empty statements are
+    skipped and a last statement without `;` gets one appended.
+    """
+    pieces = []
+    quote = None
+    for chunk in _chunks(stream, chunk_size):
+        pos = 0
+        while True:
+            if quote is None:
+                match = _SPECIAL.search(chunk, pos)
+                if match is None:
+                    break
+                end = match.end()
+                pieces.append(chunk[pos:end])
+                pos = end
+                if match.group() != ';':
+                    quote = match.group()
+                    continue
+                sql = ''.join(pieces).strip()
+                pieces = []
+                if sql != ';':
+                    yield sql
+            else:
+                # 引号内的字符串和 QSTRING 一样不支持转义，找到下一个相同的引号即结束
+                end = chunk.find(quote, pos)
+                if end < 0:
+                    break
+                pieces.append(chunk[pos:end + 1])
+                pos = end + 1
+                quote = None
+        if pos < len(chunk):
+            pieces.append(chunk[pos:])
+
+    sql = ''.join(pieces).strip()
+    if sql:
+        yield sql + ';'
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+Simplification of WHERE trees before they are sent to Milvus.
+
+- constant comparisons (1 == 1, 2 > 3) become true or false and are removed
+  from and/or, or decide the whole and/or
+- IN lists of plain numbers or strings are deduplicated and sorted, an empty
+  IN list is false
+- within an and, the comparisons, BETWEEN, IN and != on the same field with
+  integer or string constants are merged into the tightest equivalent terms,
+  or found to be a contradiction
+
+simplify() returns the simplified tree, or True / False when the whole
+predicate turned out to be constant. Terms are only merged when their
+conjunction is equivalent, so a field that is null or a missing JSON key
+still gives the same result as the original predicate. Float constants are
+left as written: Milvus compares FLOAT fields with the constant cast to
+float32, so two bounds that differ as Python floats may be the same value
+there (a >= 0.1 + 0.2 and a <= 0.3 matches 0.3f).
+"""
+from .nodes import Literal, Identifier, Paren, Call, Compare, Between, In, Not, BoolOp
+
+_FLIP = {'<': '>', '>': '<', '<=': '>=', '>=': '<=', '==': '==', '!=': '!='}
+
+
+def _kind(value):
+    # 只处理数字和字符串，布尔值、列表、参数等保持原样
+    if type(value) in (int, float):
+        return 'number'
+    if type(value) is str:
+        return 'string'
+    return None
+
+
+def _exact(value):
+    # float 常量在 Milvus 中可能按 float32 比较，不能按 Python 的 float 合并或判断矛盾
+    return type(value) is not float
+
+
+def _constant(node):
+    while isinstance(node, Paren):
+        node = node.expr
+    if isinstance(node, Literal) and _kind(node.value) is not None:
+        return node
+    return None
+
+
+def _compare_values(op, a, b):
+    if op == '==':
+        return a == b
+    if op == '!=':
+        return a != b
+    if op == '<':
+        return a < b
+    if op == '>':
+        return a > b
+    if op == '<=':
+        return a <= b
+    return a >= b
+
+
+def simple_kind(values):
+    """
+    Return the common kind of an IN list whose values are all numbers or
+    all strings, or None otherwise.
+    """
+    if not isinstance(values, list):
+        return None
+    kinds = set(_kind(value) for value in values)
+    if len(kinds) != 1 or None in kinds:
+        return None
+    return kinds.pop()
+
+
+def _unique_sorted(values):
+    return sorted(set(values))
+
+
+def _simplify_atom(node):
+    if isinstance(node, Compare):
+        left, right = _constant(node.left), _constant(node.right)
+        if left is not None and right is not None and _kind(left.value) == _kind(right.value):
+            return _compare_values(node.op, left.value, right.value)
+        return node
+
+    if isinstance(node, Between):
+        kinds = (_kind(node.low), _kind(node.high))
+        if (kinds[0] is not None and kinds[0] == kinds[1] and _exact(node.low) and _exact(node.high)
+                and node.low > node.high):
+            return node.negated
+        return node
+
+    if isinstance(node, In):
+        if isinstance(node.values, list) and not node.values:
+            return node.negated
+        if simple_kind(node.values) is not None:
+            values = _unique_sorted(node.values)
+            if values != node.values:
+                return In(node.target, values, node.negated)
+        return node
+
+    return node
+
+
+def _constraint(node):
+    """
+    Describe an atom as (field, kind, op, value) when it limits one field to
+    numbers or strings, op is one of < <= > >= == != in, not in.
+    """
+    # (a > 1) 和 a > 1 是同一个条件
+    while isinstance(node, Paren):
+        node = node.expr
+    if isinstance(node, Compare):
+        left, right, op = node.left, node.right, node.op
+        if isinstance(right, Identifier):
+            left, right, op = right, left, _FLIP[op]
+        right = _constant(right)
+        if isinstance(left, Identifier) and right is not None and _exact(right.value):
+            return left.name, _kind(right.value), op, right.value
+        return None
+
+    if isinstance(node, Between) and not node.negated and isinstance(node.target, Identifier):
+        kind = _kind(node.low)
+        if kind is not None and kind == _kind(node.high) and _exact(node.low) and _exact(node.high):
+            return node.target.name, kind, 'between', (node.low, node.high)
+        return None
+
+    if isinstance(node, In) and isinstance(node.target, Identifier):
+        kind = simple_kind(node.values)
+        if kind is not None and all(_exact(value) for value in node.values):
+            return node.target.name, kind, 'not in' if node.negated else 'in', node.values
+    return None
+
+
+def _merge_field(name, kind, constraints):
+    """
+    Merge the constraints of one field, return the replacement atoms or
+    False when no value satisfies all of them.
+    """
+    field = Identifier(name)
+    low = high = None   # (value, inclusive)
+    equal = None
+    excluded = set()
+
+    def tighten_low(value, inclusive):
+        nonlocal low
+        if low is None or value > low[0] or (value == low[0] and not inclusive):
+            low = (value, inclusive)
+
+    def tighten_high(value, inclusive):
+        nonlocal high
+        if high is None or value < high[0] or (value == high[0] and not inclusive):
+            high = (value, inclusive)
+
+    for op, value in constraints:
+        if op == '>':
+            tighten_low(value, False)
+        elif op == '>=':
+            tighten_low(value, True)
+        elif op == '<':
+            tighten_high(value, False)
+        elif op == '<=':
+            tighten_high(value, True)
+        elif op == 'between':
+            tighten_low(value[0], True)
+            tighten_high(value[1], True)
+        elif op == '==':
+            equal = {value} if equal is None else equal & {value}
+        elif op == 'in':
+            equal = set(value) if equal is None else equal & set(value)
+        elif op == '!=':
+            excluded.add(value)
+        else:
+            excluded.update(value)
+
+    def in_range(value):
+        if low is not None and (value < low[0] or (value == low[0] and not low[1])):
+            return False
+        if high is not None and (value > high[0] or (value == high[0] and not high[1])):
+            return False
+        return True
+
+    if equal is not None:
+        values = sorted(value for value in equal if in_range(value) and value not in excluded)
+        if not values:
+            return False
+        if len(values) == 1:
+            return [Compare('==', field, Literal(values[0]))]
+        return [In(field, values)]
+
+    if low is not None and high is not None:
+        if low[0] > high[0] or (low[0] == high[0] and not (low[1] and high[1])):
+            return False
+        if low[0] == high[0]:
+            if low[0] in excluded:
+                return False
+            return [Compare('==', field, Literal(low[0]))]
+
+    atoms = []
+    if low is not None and high is not None and low[1] and high[1] and kind == 'number':
+        atoms.append(Between(field, low[0], high[0]))
+    else:
+        if low is not None:
+            atoms.append(Compare('>=' if low[1] else '>', field, Literal(low[0])))
+        if high is not None:
+            atoms.append(Compare('<=' if high[1] else '<', field, Literal(high[0])))
+    # 范围之外的排除值已经隐含在范围条件中
+    excluded = sorted(value for value in excluded if in_range(value))
+    if len(excluded) == 1:
+        atoms.append(Compare('!=', field, Literal(excluded[0])))
+    elif excluded:
+        atoms.append(In(field, excluded, negated=True))
+    return atoms
+
+
+def _merge_and(children):
+    """
+    Merge the constraints on the same field among the children of an and.
+    Return (children, changed), or (False, True) for a contradiction.
+    """
+    groups = dict()
+    for index, child in enumerate(children):
+        constraint = _constraint(child)
+        if constraint is not None:
+            name, kind, op, value = constraint
+            groups.setdefault(name, []).append((index, kind, op, value))
+
+    replaced = dict()
+    for name, group in groups.items():
+        # 同一个field只有一个条件，或者数字和字符串混用时不合并
+        if len(group) < 2 or len(set(kind for _, kind, _, _ in group)) != 1:
+            continue
+        atoms = _merge_field(name, group[0][1], [(op, value) for _, _, op, value in group])
+        if atoms is False:
+            return False, True
+        replaced[group[0][0]] = atoms
+        for index, _, _, _ in group[1:]:
+            replaced[index] = []
+
+    if not replaced:
+        return children, False
+    merged = []
+    for index, child in enumerate(children):
+        merged.extend(replaced.get(index, [child]))
+    return merged, True
+
+
+def _wrap(child, op):
+    # and 中的 or 要加上括号，保证渲染后的优先级不变
+    if op == 'and' and isinstance(child, BoolOp) and child.op == 'or':
+        return Paren(child)
+    return child
+
+
+def _simplify_bool_op(node, results):
+    # results 为各个子条件化简后的结果，与 node.values 一一对应
+    op = node.op
+    children = []
+    changed = False
+    for value, result in zip(node.values, results):
+        if result is not value:
+            changed = True
+        if isinstance(result, bool):
+            # and 中的 true、or 中的 false 直接去掉
+            if result == (op == 'and'):
+                continue
+            return result
+        # 展开同种 BoolOp 以便合并其中的条件；只有展开而没有其他变化时仍返回原来的节点
+        inner = result.expr if isinstance(result, Paren) else result
+        if isinstance(inner, BoolOp) and inner.op == op:
+            children.extend(inner.values)
+        else:
+            children.append(result)
+
+    if op == 'and':
+        children, merged = _merge_and(children)
+        if children is False:
+            return False
+        changed = changed or merged
+
+    if not children:
+        return op == 'and'
+    if len(children) == 1:
+        return children[0]
+    if not changed:
+        return node
+    return BoolOp(op, [_wrap(child, op) for child in children])
+
+
+def _children(node):
+    if isinstance(node, BoolOp):
+        return node.values
+    if isinstance(node, Not):
+        return [node.operand]
+    # 函数条件本身带括号，整体作为一个条件
+    if isinstance(node, Paren) and not isinstance(node.expr, Call):
+        return [node.expr]
+    return ()
+
+
+def _combine(node, results):
+    # 由子条件化简后的结果得到 node 化简后的结果
+    if isinstance(node, BoolOp):
+        return _simplify_bool_op(node, results)
+    if isinstance(node, Not):
+        result = results[0]
+        if isinstance(result, bool):
+            return not result
+        if result is node.operand:
+            return node
+        return Not(Paren(result) if isinstance(result, BoolOp) else result)
+    if isinstance(node, Paren) and results:
+        result = results[0]
+        if result is node.expr:
+            return node
+        return Paren(result) if isinstance(result, BoolOp) else result
+    return _simplify_atom(node)
+
+
+def _simplify(node):
+    # 和 nodes.to_expr 一样用显式的栈代替递归，括号或 not 嵌套很深的条件也不会超出递归深度；
+    # 子条件先化简，结果依次放入 results，父节点再取出自己的那几个
+    results = []
+    stack = [(node, False)]
+    while stack:
+        item, visited = stack.pop()
+        children = _children(item)
+        if children and not visited:
+            stack.append((item, True))
+            stack.extend((child, False) for child in reversed(children))
+            continue
+        if children:
+            start = len(results) - len(children)
+            values = results[start:]
+            del results[start:]
+        else:
+            values = ()
+        results.append(_combine(item, values))
+    return results[0]
+
+
+def simplify(node):
+    """
+    Simplify a WHERE tree. Return the new tree (the same object when nothing
+    changed), or True / False when the predicate is always true / false.
+    """
+    return _simplify(node)
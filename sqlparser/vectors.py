@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+
+class FloatVectors:
+    """
+    Float vectors of the same dimension packed into one contiguous
+    array('f') buffer, row i is buffer[i * dim:(i + 1) * dim].
+    """
+
+    __slots__ = ('buffer', 'dim')
+
+    def __init__(self, buffer, dim):
+        self.buffer = buffer
+        self.dim = dim
+
+    def __eq__(self, other):
+        return isinstance(other, FloatVectors) and other.dim == self.dim and other.buffer == self.buffer
+
+    def __repr__(self):
+        return f'FloatVectors(n={len(self.buffer) // self.dim if self.dim else 0}, dim={self.dim})'
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def pack_vector(vector):
+    """
+    Pack a vector literal: float vectors become array('f'), vectors of
+    integers become bytes (binary vectors, 8 bits per element). Anything
+    else, e.g. a vector containing bind parameters, is returned unchanged.
+    """
+    if not isinstance(vector, list) or not vector:
+        return vector
+    all_int = True
+    for item in vector:
+        if not _is_number(item):
+            return vector
+        if all_int and isinstance(item, float):
+            all_int = False
+    if all_int:
+        # 超出 [0, 255] 时抛出 ValueError
+        return bytes(vector)
+    return array('f', vector)
+
+
+def pack_vectors(vectors):
+    """
+    Pack the query vectors of one search with pack_vector(). Raises
+    ValueError when a binary element is out of range or when binary and
+    float vectors are mixed.
+    """
+    try:
+        packed = [pack_vector(vector) for vector in vectors]
+    except ValueError:
+        raise ValueError('Binary vector elements must be in [0, 255]')
+    # 一次搜索的向量类型必须相同，caller 据此决定按 binary 还是 float vector 传给 pymilvus
+    if len(set(type(vector) for vector in packed if isinstance(vector, (bytes, array)))) > 1:
+        raise ValueError('Cannot mix binary and float vectors in one search')
+    return packed
+
+
+def pack_float_vectors(column):
+    """
+    Pack the column of a FLOAT_VECTOR field into FloatVectors when every
+    value is an array('f') or a number list of the same length, otherwise
+    return None. Integers are packed as floats: [1, 2, 3] is a valid float
+    vector.
+    """
+    if not column or not isinstance(column[0], (list, array)) or not column[0]:
+        return None
+    dim = len(column[0])
+    for vector in column:
+        if isinstance(vector, array):
+            # F32'...' 字面量在词法分析时已经是 array('f')
+            if vector.typecode != 'f' or len(vector) != dim:
+                return None
+            continue
+        if not isinstance(vector, list) or len(vector) != dim:
+            return None
+        for item in vector:
+            if not _is_number(item):
+                return None
+    buffer = array('f')
+    for vector in column:
+        buffer.extend(vector)
+    return FloatVectors(buffer, dim)
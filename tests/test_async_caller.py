@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from caller import async_caller
+from caller.caller import func_map
+from sqlparser import parse, prepare
+
+
+class Recorder:
+    # 代替 func_map 中的函数，记录同时执行的语句数
+    def __init__(self, seconds=0.05):
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.threads = set()
+
+    def __call__(self, query):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.threads.add(threading.get_ident())
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running -= 1
+        return query['coll_name']
+
+
+class TestAsyncCaller(unittest.TestCase):
+    def setUp(self):
+        async_caller.shutdown()
+
+    def tearDown(self):
+        async_caller.shutdown()
+
+    def run_all(self, queries):
+        async def main():
+            return await asyncio.gather(*(async_caller.execute(query) for query in queries))
+        return asyncio.run(main())
+
+    def test_results_in_order(self):
+        recorder = Recorder(seconds=0.0)
+        queries = [parse(f'select a from book_{i} where a > {i};') for i in range(20)]
+        with mock.patch.dict(func_map, {'query': recorder}):
+            self.assertEqual(self.run_all(queries), [f'book_{i}' for i in range(20)])
+
+    def test_concurrent(self):
+        recorder = Recorder()
+        queries = [parse('select a from book where a > 1;')] * 20
+        start = time.perf_counter()
+        with mock.patch.dict(func_map, {'query': recorder}):
+            self.run_all(queries)
+        # 20 条语句同时执行，总耗时接近一条语句
+        self.assertEqual(recorder.peak, 20)
+        self.assertLess(time.perf_counter() - start, 20 * recorder.seconds / 2)
+        self.assertNotIn(threading.get_ident(), recorder.threads)
+
+    def test_bounded(self):
+        recorder = Recorder(seconds=0.01)
+        queries = [parse('select a from book where a > 1;')] * 30
+        settings = mock.Mock()
+        settings.executor.max_concurrency = 4
+        with mock.patch.dict(func_map, {'query': recorder}), \
+                mock.patch.object(async_caller, 'get_settings', return_value=settings):
+            self.run_all(queries)
+        self.assertEqual(recorder.peak, 4)
+
+    def test_prepared(self):
+        recorder = Recorder(seconds=0.0)
+        statement = prepare('select a from book where a > ?;')
+
+        async def main():
+            return await async_caller.execute(statement, [3])
+        with mock.patch.dict(func_map, {'query': recorder}):
+            self.assertEqual(asyncio.run(main()), 'book')
+
+    def test_error(self):
+        def fail(query):
+            raise ValueError(query['type'])
+
+        async def main():
+            return await async_caller.execute(parse('delete from book where a > 1;'))
+        with mock.patch.dict(func_map, {'delete': fail}):
+            with self.assertRaises(ValueError):
+                asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
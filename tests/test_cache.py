@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse, parse_handle
+from sqlparser.cache import ParseCache, normalize
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+
+    def counting_parse(self, sql):
+        self.calls += 1
+        return parse_handle(sql)
+
+    def test_normalize(self):
+        self.assertEqual(normalize("SELECT  a\n FROM Book WHERE a = 'X  Y';"),
+                         "select a from Book where a = 'X  Y';")
+        # 非关键字的大小写不能改变
+        self.assertNotEqual(normalize('select a from Book;'), normalize('select a from book;'))
+        # 参数名区分大小写，即使与关键字同名
+        self.assertNotEqual(normalize('delete from book where a = :Limit;'),
+                            normalize('delete from book where a = :limit;'))
+
+    def test_hit_and_miss(self):
+        cache = ParseCache(maxsize=8)
+        first = cache.get('select a from book where a > 1;', self.counting_parse)
+        second = cache.get('SELECT a  FROM book WHERE a > 1;', self.counting_parse)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_copy_on_return(self):
+        cache = ParseCache(maxsize=8)
+        sql = 'create collection book (book_id int64 primary key);'
+        first = cache.get(sql, self.counting_parse)
+        first['fields'][0]['type'] = 'changed'
+        second = cache.get(sql, self.counting_parse)
+        self.assertEqual(second['fields'][0]['type'], 'INT64')
+
+    def test_eviction(self):
+        cache = ParseCache(maxsize=2)
+        for name in ['a', 'b', 'c']:
+            cache.get(f'drop collection {name};', self.counting_parse)
+        info = cache.info()
+        self.assertEqual((info.evictions, info.currsize), (1, 2))
+        cache.get('drop collection a;', self.counting_parse)
+        self.assertEqual(self.calls, 4)
+
+    def test_long_statement_not_cached(self):
+        cache = ParseCache(maxsize=8, max_sql_length=16)
+        cache.get('drop collection a_long_name;', self.counting_parse)
+        cache.get('drop collection a_long_name;', self.counting_parse)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.info().currsize, 0)
+        cache.resize(8, max_sql_length=64)
+        cache.get('drop collection a_long_name;', self.counting_parse)
+        cache.get('drop collection a_long_name;', self.counting_parse)
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(cache.info().maxsize, 8)
+
+    def test_parse(self):
+        self.assertEqual(parse('show collections;'), {'type': 'show_coll'})
+
+
+if __name__ == '__main__':
+    unittest.main()
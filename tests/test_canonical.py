@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse, prepare, canonical
+
+
+def key(sql):
+    return canonical(parse(sql, tree=True))
+
+
+class TestCanonical(unittest.TestCase):
+    def assertSame(self, *sqls):
+        keys = [key(sql) for sql in sqls]
+        for sql, result in zip(sqls[1:], keys[1:]):
+            with self.subTest(sql=sql):
+                self.assertEqual(result, keys[0])
+
+    def test_equivalent_conditions(self):
+        self.assertSame('select a from book where a = 1 and b = 2;',
+                        'SELECT a FROM book WHERE b = 2   AND a = 1;',
+                        'select a from book where (b = 2) and (1 = a);',
+                        'select a from book where b = 2 and a = 1 and a = 1;')
+        self.assertSame('select a from book where x in [3, 1, 2] or 3 < y;',
+                        'select a from book where y > 3 or x in [1, 2, 3, 3];')
+        self.assertSame('select a from book where not not (a = 1 or b = 2) and c = 1;',
+                        'select a from book where c = 1 and (b = 2 or a = 1);')
+        self.assertSame('select a from book where a < b;', 'select a from book where b > a;')
+
+    def test_without_tree(self):
+        # 没有表达式树时按 WITH 中的表达式处理，能用条件的语法解析时结果相同
+        for sql in ['select a from book where b = 2 and 1 = a;',
+                    'delete from book where x in [3, 1, 2] or not (y > 1 and y != 5);',
+                    'select a from book where a like "x%" and json_contains(b, 1);']:
+            with self.subTest(sql=sql):
+                self.assertEqual(canonical(parse(sql)), key(sql))
+
+    def test_expr(self):
+        self.assertEqual(key('select a from book where c = 1 and (b = 2 or a > 3) and a in [2, 1];')[0],
+                         '((a > 3) or (b == 2)) and (a in [1, 2]) and (c == 1)')
+        self.assertEqual(key('delete from book;')[0], '')
+
+    def test_with_expr(self):
+        self.assertSame('select a from book where a = 1 and b = "x y";',
+                        'select a from book with {"expr": "b == \'x y\' and a == 1"};')
+        # 语法无法解析的表达式只压缩空白
+        self.assertEqual(key('select a from book with {"expr": "1 <= x   <= 5"};')[0], '1 <= x <= 5')
+        # field 名区分大小写，与关键字同名的也不改写
+        self.assertEqual(key('select a from book with {"expr": "1 <= Index  <= 5 and Description == \'A  B\'"};')[0],
+                         "1 <= Index <= 5 and Description == 'A  B'")
+        self.assertNotEqual(key('select a from book with {"expr": "1 <= Index <= 5"};')[1],
+                            key('select a from book with {"expr": "1 <= index <= 5"};')[1])
+
+    def test_with_expr_sql_syntax(self):
+        # 只有 SQL 才有的写法原样交给 milvus，不能与合法的表达式得到同一个指纹
+        for sql_only, milvus in [('a <> 1', 'a != 1'), ('a = 1', 'a == 1'), ('a > 1 AND b < 2', 'a > 1 and b < 2')]:
+            with self.subTest(expr=sql_only):
+                self.assertNotEqual(key('select a from book with {"expr": "%s"};' % sql_only)[1],
+                                    key('select a from book with {"expr": "%s"};' % milvus)[1])
+                self.assertEqual(key('select a from book with {"expr": "%s"};' % sql_only)[0], sql_only)
+        self.assertSame('select a from book where a != 1;', 'select a from book with {"expr": "(a != 1)"};')
+
+    def test_with_expr_reordered(self):
+        # 化简会改变顺序的表达式，等价时指纹相同
+        self.assertSame('select a from book with {"expr": "a in [2, 1]"};',
+                        'select a from book with {"expr": "a in [1, 2]"};',
+                        'select a from book with {"expr": "a in [1, 2, 2]"};',
+                        'select a from book where a in [1, 2];')
+        self.assertSame('select a from book with {"expr": "b == 2 and a > 1 and a > 3"};',
+                        'select a from book with {"expr": "(a > 3) and (b == 2)"};')
+
+    def test_different_statements(self):
+        base = key('select a from book where a = 1;')[1]
+        for sql in ['select a from book where a = 2;', 'select b from book where a = 1;',
+                    'select a from other where a = 1;', 'select a from book limit 1 where a = 1;',
+                    'delete from book where a = 1;', 'select a from book where a != 1;',
+                    'select a from book where a = 1.5;', 'select a from book where a = "1";']:
+            with self.subTest(sql=sql):
+                self.assertNotEqual(key(sql)[1], base)
+        self.assertSame('select a, b from book;', 'select b, a from book;')
+
+    def test_search_vectors(self):
+        sql = 'select a from book order by v <-> [[%s]] limit 3 where a > 1 with {"metric_type": "L2"};'
+        self.assertEqual(key(sql % '1.0, 2.0'), key(sql % '1.0,2.0'))
+        self.assertNotEqual(key(sql % '1.0, 2.0')[1], key(sql % '1.0, 2.5')[1])
+
+    def test_prepared(self):
+        statement = prepare('select a from book where b = ? and a = ?;')
+        self.assertEqual(canonical(statement.bind([2, 1])), key('select a from book where a = 1 and b = 2;'))
+
+
+if __name__ == '__main__':
+    unittest.main()
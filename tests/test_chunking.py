@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse, prepare
+from sqlparser.chunking import chunk_expr
+
+
+def where(condition):
+    return parse(f'select a from book where {condition};', tree=True)['where']
+
+
+class TestChunking(unittest.TestCase):
+    def test_in_list_sorted_and_deduplicated(self):
+        query = parse('delete from book where book_id in [5, 3, 5, 1, 3];', tree=True)
+        self.assertEqual(query['expr'], '(book_id in [1, 3, 5])')
+
+    def test_single_in(self):
+        self.assertEqual(chunk_expr(where('book_id in [5, 4, 3, 2, 1]'), 2),
+                         ['(book_id in [1, 2])', '(book_id in [3, 4])', '(book_id in [5])'])
+
+    def test_other_terms_kept(self):
+        self.assertEqual(chunk_expr(where('a > 1 and book_id in [1, 2, 3] and (b = 1 or c = 2)'), 2),
+                         ['(a > 1) and (book_id in [1, 2]) and ((b == 1) or (c == 2))',
+                          '(a > 1) and (book_id in [3]) and ((b == 1) or (c == 2))'])
+
+    def test_longest_list_split(self):
+        self.assertEqual(chunk_expr(where('a in [1, 2, 3] and b in [1, 2, 3, 4]'), 2),
+                         ['(a in [1, 2, 3]) and (b in [1, 2])', '(a in [1, 2, 3]) and (b in [3, 4])'])
+
+    def test_not_split(self):
+        for condition in ['book_id in [1, 2]', 'book_id not in [1, 2, 3]', 'a = 1 or book_id in [1, 2, 3]',
+                          'not book_id in [1, 2, 3]', 'book_id in [[1], [2], [3]]', 'a > 1']:
+            with self.subTest(condition=condition):
+                self.assertIsNone(chunk_expr(where(condition), 2))
+        self.assertIsNone(chunk_expr(None, 2))
+        self.assertIsNone(chunk_expr(where('book_id in [1, 2, 3]'), 0))
+
+    def test_prepared_list_deduplicated(self):
+        query = prepare('delete from book where book_id in ?;').bind([[3, 1, 3, 2]])
+        self.assertEqual(chunk_expr(query['where'], 2), ['(book_id in [1, 2])', '(book_id in [3])'])
+
+    def test_large_list(self):
+        values = list(range(100000))
+        chunks = chunk_expr(where('book_id in [%s]' % ', '.join(map(str, reversed(values)))), 10000)
+        self.assertEqual(len(chunks), 10)
+        self.assertEqual(chunks[0], '(book_id in %s)' % values[:10000])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from array import array
+from unittest import mock
+
+from pymilvus import DataType, FieldSchema
+
+from sqlparser import parse
+from sqlparser.columnar import to_rows
+from sqlparser.vectors import FloatVectors, pack_float_vectors
+from caller.call_insert import _column_data
+
+
+class TestColumnar(unittest.TestCase):
+    def test_fast_path(self):
+        query = parse('insert into book (book_id, book_intro, book_name) '
+                      'values (1, [1.0, 2], "a"), (2, [3, 4.5], "b");', columnar=True)
+        self.assertNotIn('data', query)
+        self.assertEqual(query['num_rows'], 2)
+        self.assertEqual(query['columns']['book_id'], [1, 2])
+        self.assertEqual(query['columns']['book_name'], ['a', 'b'])
+        self.assertEqual(query['columns']['book_intro'], [[1.0, 2], [3, 4.5]])
+        # caller 按 schema 只把 float vector 列打包
+        vectors = pack_float_vectors(query['columns']['book_intro'])
+        self.assertIsInstance(vectors, FloatVectors)
+        self.assertEqual(vectors.dim, 2)
+        self.assertEqual(vectors.buffer, array('f', [1.0, 2.0, 3.0, 4.5]))
+        # 整数写成的 float vector 同样打包
+        self.assertEqual(pack_float_vectors([[1, 2, 3], [4, 5, 6]]), FloatVectors(array('f', [1, 2, 3, 4, 5, 6]), 3))
+        self.assertIsNone(pack_float_vectors([[1, 2], [3]]))
+
+    def test_grammar_path(self):
+        # 缺少逗号，只能走完整的语法分析
+        query = parse('upsert into partition part1 on book (book_id book_intro) values (1 [1.0, 2.0]) (2 [3.0, 4.0]);',
+                      columnar=True)
+        self.assertEqual(query['type'], 'upsert')
+        self.assertEqual(query['part_name'], 'part1')
+        self.assertEqual(query['columns']['book_id'], [1, 2])
+        self.assertEqual(query['columns']['book_intro'], [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_not_packed(self):
+        query = parse('insert into book (tags, info) values ([1, 2], {"a": 1}), ([3], {"a": 2});', columnar=True)
+        self.assertEqual(query['columns']['tags'], [[1, 2], [3]])
+        self.assertEqual(query['columns']['info'], [{'a': 1}, {'a': 2}])
+
+    def test_values_not_rounded(self):
+        # JSON 和动态 field 中的数字列表不能按 float32 保存
+        query = parse('insert into book (book_id, scores) values (1, [0.1, 0.2]), (2, [0.3, 0.4]);', columnar=True)
+        self.assertEqual(query['columns']['scores'], [[0.1, 0.2], [0.3, 0.4]])
+        self.assertEqual(to_rows(query['columns'], query['num_rows']),
+                         [{'book_id': 1, 'scores': [0.1, 0.2]}, {'book_id': 2, 'scores': [0.3, 0.4]}])
+
+    def test_row_mode_unchanged(self):
+        sql = 'insert into book (book_id, book_intro) values (1, [1.0, 2.0]);'
+        parse(sql, columnar=True)
+        self.assertEqual(parse(sql)['data'], [{'book_id': 1, 'book_intro': [1.0, 2.0]}])
+
+    def test_caller_columns(self):
+        # caller 交给 pymilvus 的列都是列表，F32'...' 字面量转换回列表
+        query = parse("insert into book (book_id, book_intro, tags) "
+                      "values (1, [1, 2], [0.5]), (2, F32'AABAQAAAgEA=', [1.5]);", columnar=True)
+        fields = [FieldSchema('book_id', DataType.INT64, is_primary=True),
+                  FieldSchema('book_intro', DataType.FLOAT_VECTOR, dim=2),
+                  FieldSchema('tags', DataType.ARRAY, element_type=DataType.DOUBLE, max_capacity=4)]
+        collection = mock.Mock()
+        collection.schema.fields = fields
+        data = _column_data(collection, query)
+        self.assertEqual(data, [[1, 2], [[1, 2], [3.0, 4.0]], [[0.5], [1.5]]])
+        self.assertIs(type(data[1][1]), list)
+
+    def test_to_rows(self):
+        query = parse('insert into book (book_id, book_intro) values (1, [1.0, 2.0]), (2, [3.0, 4.0]);', columnar=True)
+        self.assertEqual(to_rows(query['columns'], query['num_rows']),
+                         [{'book_id': 1, 'book_intro': [1.0, 2.0]}, {'book_id': 2, 'book_intro': [3.0, 4.0]}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse
+from sqlparser.fastpath import parse_insert
+from sqlparser.grammar import parse_handle
+from sqlparser.exceptions import GrammarException
+
+
+class TestInsertFastPath(unittest.TestCase):
+    def assertSameAsGrammar(self, sql):
+        query = parse_insert(sql)
+        self.assertIsNotNone(query, sql)
+        self.assertEqual(query, parse_handle(sql))
+
+    def test_insert(self):
+        self.assertSameAsGrammar('insert into book (book_id, book_intro) values (1, [1.0, 2.0]), (2, [3.0, -2e3]);')
+        self.assertSameAsGrammar('INSERT INTO PARTITION part1 ON book (book_id, flag) VALUES (1, true), (2, null);')
+
+    def test_upsert(self):
+        self.assertSameAsGrammar("upsert into book(book_id, info) values (+1, {'a': [1, 'b'], \"c\": {\"d\": false}});")
+        self.assertSameAsGrammar('upsert into partition part1 on book (book_id) values (1), (2);')
+
+    def test_strings(self):
+        self.assertSameAsGrammar("insert into book (a, b, c) values ('it\"s', \"back\\\\slash\", `tick`);")
+
+    def test_fallback(self):
+        sqls = [
+            'insert into book (book_id book_intro) values (1 [1.0, 2.0]);',  # 缺少逗号
+            'insert into book (book_id) values (1 - 2);',
+            'insert into book (book_id) values ();',
+            'insert into book (id) values (1);',  # 关键字作为field名
+            'insert into book (book_id) values (?);',
+            'select book_id from book;',
+        ]
+        for sql in sqls:
+            self.assertIsNone(parse_insert(sql), sql)
+
+    def test_literal_prefixed_names(self):
+        # 以小写 true/false/null 开头的名字在语法分析中不是 STRING，快速路径同样不接受
+        for sql in ['insert into book (nullable) values (1);',
+                    'insert into trueset (book_id) values (1);',
+                    'insert into partition falsey on book (book_id) values (1);']:
+            self.assertIsNone(parse_insert(sql), sql)
+            with self.assertRaises(GrammarException):
+                parse_handle(sql)
+        self.assertSameAsGrammar('insert into book (Nullable, TRUESET) values (1, 2);')
+
+    def test_parse_uses_grammar_on_fallback(self):
+        self.assertEqual(parse('insert into book (book_id book_intro) values (1 [1.0, 2.0]);')['data'],
+                         [{'book_id': 1, 'book_intro': [1.0, 2.0]}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse
+
+
+def expr(constant):
+    return parse(f'delete from book where book_id = {constant};')['expr']
+
+
+class TestConstantFolding(unittest.TestCase):
+    def check(self, cases):
+        for constant, expected in cases:
+            with self.subTest(constant=constant):
+                self.assertEqual(expr(constant), f'(book_id == {expected})')
+
+    def test_integer(self):
+        self.check([('10 * 60 * 60', '36000'), ('-(3)', '-3'), ('- -3', '3'), ('(3)', '3'),
+                    ('2 * (3 + 4) - 1', '13'), ('7 / 2', '3'), ('-7 / 2', '-3'),
+                    ('7 % -3', '1'), ('-7 % 3', '-1')])
+
+    def test_float(self):
+        self.check([('7.0 / 2', '3.5'), ('0.5 + 1', '1.5'), ('2 ** 3', '8.0'), ('1 + 2 * 3 ** 2', '19.0')])
+
+    def test_power_and_negative_numbers(self):
+        # milvus 中 -2 ** 2 为 -(2 ** 2)，** 为左结合
+        self.check([('-2 ** 2', '-4.0'), ('-2 ** 2 ** 3', '-64.0'), ('(-2) ** 3 ** 2', '64.0'),
+                    ('((-3))', '(-3)'), ('(1 - 3) ** 0.5', '(-2) ** 0.5')])
+
+    def test_not_folded(self):
+        # milvus 会报错或者结果不同的运算保留原样
+        self.check([('1 / 0', '1 / 0'), ('5 % 0', '5 % 0'), ('7.5 % 2', '7.5 % 2'),
+                    ('9223372036854775807 + 1', '9223372036854775807 + 1'),
+                    ('-(-9223372036854775807 - 1)', '-(-9223372036854775808)'),
+                    ('1e308 * 10', '1e+308 * 10'), ('true + 1', 'true + 1'), ('"a" + "b"', '"a" + "b"')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+
+from caller.handles import HandleCache
+
+
+class Factory:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, name, using):
+        self.calls.append((using, name))
+        return object()
+
+
+class TestHandleCache(unittest.TestCase):
+    def setUp(self):
+        self.factory = Factory()
+        self.cache = HandleCache(self.factory)
+
+    def test_reused(self):
+        first = self.cache.get('book', 'default')
+        self.assertIs(self.cache.get('book', 'default'), first)
+        self.assertEqual(self.factory.calls, [('default', 'book')])
+
+    def test_per_connection(self):
+        self.assertIsNot(self.cache.get('book', 'default'), self.cache.get('book', 'other'))
+        self.assertIsNot(self.cache.get('book', 'default'), self.cache.get('novel', 'default'))
+        self.assertEqual(len(self.factory.calls), 3)
+
+    def test_invalidate_name(self):
+        book = self.cache.get('book', 'default')
+        novel = self.cache.get('novel', 'default')
+        self.cache.invalidate('default', 'book')
+        self.assertIsNot(self.cache.get('book', 'default'), book)
+        self.assertIs(self.cache.get('novel', 'default'), novel)
+
+    def test_invalidate_connection(self):
+        book = self.cache.get('book', 'default')
+        other = self.cache.get('book', 'other')
+        self.cache.invalidate('default')
+        self.assertIsNot(self.cache.get('book', 'default'), book)
+        self.assertIs(self.cache.get('book', 'other'), other)
+
+    def test_put(self):
+        created = object()
+        self.cache.put('book', 'default', created)
+        self.assertIs(self.cache.get('book', 'default'), created)
+        self.assertEqual(self.factory.calls, [])
+
+    def test_ttl(self):
+        first = self.cache.get('book', 'default', ttl=3600)
+        self.assertIs(self.cache.get('book', 'default', ttl=3600), first)
+        self.assertIsNot(self.cache.get('book', 'default', ttl=1e-9), first)
+
+    def test_disabled(self):
+        first = self.cache.get('book', 'default', ttl=0)
+        self.assertIsNot(self.cache.get('book', 'default', ttl=0), first)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidated_while_opening(self):
+        # 创建对象期间发生的 DDL 使结果不被缓存
+        started, finish = threading.Event(), threading.Event()
+
+        def slow(name, using):
+            started.set()
+            finish.wait()
+            return object()
+
+        cache = HandleCache(slow)
+        thread = threading.Thread(target=cache.get, args=('book', 'default'))
+        thread.start()
+        started.wait()
+        cache.invalidate('default')
+        finish.set()
+        thread.join()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
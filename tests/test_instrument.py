@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+
+from sqlparser import instrument, parse, cache_info, set_cache_size
+from sqlparser.exceptions import GrammarException
+from sqlparser.grammar import parse_handle
+
+
+class TestInstrument(unittest.TestCase):
+    def setUp(self):
+        self.stats = []
+        instrument.add_hook(self.stats.append)
+
+    def tearDown(self):
+        instrument.remove_hook(self.stats.append)
+
+    def test_phases(self):
+        sql = 'select a from book where a > 1 and b in [1, 2, 3];'
+        query = parse_handle(sql)
+        self.assertEqual(len(self.stats), 1)
+        stats = self.stats[0]
+        self.assertEqual(stats.statement_type, 'query')
+        self.assertEqual(stats.sql_length, len(sql))
+        self.assertEqual(stats.tokens, 19)
+        self.assertIsNone(stats.error)
+        self.assertGreater(stats.output_bytes, len(query['expr']))
+        for seconds in (stats.lex_seconds, stats.action_seconds, stats.parse_seconds):
+            self.assertGreater(seconds, 0)
+        self.assertAlmostEqual(stats.lex_seconds + stats.action_seconds + stats.parse_seconds,
+                               stats.total_seconds)
+
+    def test_same_result(self):
+        sql = 'select a from book order by v <-> [[1.0, 2.0]] limit 3 where a = ? with {"metric_type": "L2"};'
+        instrumented = parse_handle(sql)
+        instrument.remove_hook(self.stats.append)
+        try:
+            self.assertEqual(parse_handle(sql), instrumented)
+        finally:
+            instrument.add_hook(self.stats.append)
+
+    def test_error(self):
+        with self.assertRaises(GrammarException):
+            parse_handle('select from;')
+        self.assertIsNone(self.stats[0].statement_type)
+        self.assertIsInstance(self.stats[0].error, GrammarException)
+        self.assertEqual(self.stats[0].output_bytes, 0)
+
+    def test_disabled(self):
+        instrument.remove_hook(self.stats.append)
+        try:
+            self.assertFalse(instrument.enabled())
+            parse_handle('show collections;')
+            self.assertEqual(self.stats, [])
+        finally:
+            instrument.add_hook(self.stats.append)
+
+    def test_fast_path_insert(self):
+        # 走快速路径的 INSERT/UPSERT 不经过 parse_handle，同样被统计
+        maxsize = cache_info().maxsize
+        set_cache_size(0)
+        try:
+            sql = 'insert into book (book_id, book_intro) values (1, [1.0, 2.0]), (2, [3.0, 4.0]);'
+            query = parse(sql)
+            parse('upsert into book (book_id) values (1);', columnar=True)
+        finally:
+            set_cache_size(maxsize)
+        self.assertEqual([stats.statement_type for stats in self.stats], ['insert', 'upsert'])
+        stats = self.stats[0]
+        self.assertEqual(stats.sql_length, len(sql))
+        self.assertEqual((stats.tokens, stats.parse_seconds), (0, 0.0))
+        self.assertGreater(stats.lex_seconds, 0)
+        self.assertGreater(stats.output_bytes, 0)
+        self.assertAlmostEqual(stats.lex_seconds + stats.action_seconds, stats.total_seconds)
+        instrument.remove_hook(self.stats.append)
+        try:
+            self.assertEqual(instrument.parse_insert(sql), query)
+        finally:
+            instrument.add_hook(self.stats.append)
+
+    def test_grammar_insert_reported_once(self):
+        # 快速路径不认识的写法只由 parse_handle 统计一次
+        maxsize = cache_info().maxsize
+        set_cache_size(0)
+        try:
+            parse('insert into book (book_id book_intro) values (1 [1.0, 2.0]);')
+        finally:
+            set_cache_size(maxsize)
+        self.assertEqual(len(self.stats), 1)
+        self.assertGreater(self.stats[0].tokens, 0)
+
+    def test_registry(self):
+        registry = instrument.MetricsRegistry()
+        instrument.add_hook(registry.record)
+        try:
+            def work():
+                for _ in range(50):
+                    parse_handle('delete from book where a = 1;')
+            threads = [threading.Thread(target=work) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with self.assertRaises(GrammarException):
+                parse_handle('delete book;')
+        finally:
+            instrument.remove_hook(registry.record)
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot['delete']['count'], 200)
+        self.assertEqual(snapshot['delete']['tokens'], 200 * 8)
+        self.assertEqual(snapshot['error']['errors'], 1)
+        self.assertGreaterEqual(snapshot['delete']['total_seconds'], snapshot['delete']['max_total_seconds'])
+        registry.reset()
+        self.assertEqual(registry.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse
+from sqlparser.param import Param
+from sqlparser.nodes import (Literal, Identifier, UnaryOp, BinaryOp, Paren, Call, Compare,
+                             Between, Like, In, Not, BoolOp, to_expr)
+
+
+def where(conditions):
+    return parse(f'delete from book where {conditions};', tree=True)['where']
+
+
+class TestWhereTree(unittest.TestCase):
+    def test_precedence(self):
+        a = Compare('>', Identifier('a'), Literal(1))
+        b = Compare('<', Identifier('b'), Literal(2))
+        c = Compare('==', Identifier('c'), Literal(3))
+        self.assertEqual(where('not a > 1 and b < 2 or c = 3'), BoolOp('or', [BoolOp('and', [Not(a), b]), c]))
+        self.assertEqual(where('a > 1 and (b < 2 or c = 3)'), BoolOp('and', [a, Paren(BoolOp('or', [b, c]))]))
+
+    def test_arithmetic(self):
+        # 常量运算会被折叠，这里用参数占位保留运算的结构
+        tree = where('a > 1 + 2 * -?')
+        self.assertEqual(tree.right, BinaryOp('+', Literal(1), BinaryOp('*', Literal(2), UnaryOp('-', Literal(Param(0))))))
+        # 与 milvus 相同，负号的优先级低于 **
+        tree = where('a > -2 ** ?')
+        self.assertEqual(tree.right, UnaryOp('-', BinaryOp('**', Literal(2), Literal(Param(0)))))
+        self.assertEqual(to_expr(tree), '(a > -2 ** %s)' % Param(0).marker)
+
+    def test_predicates(self):
+        self.assertEqual(where('x["k"][0] between 1 and 5'), Between(Identifier('x["k"][0]'), 1, 5))
+        self.assertEqual(where('a not like "p%"'), Like(Identifier('a'), 'p%', True))
+        self.assertEqual(where('a not in [1, 2]'), In(Identifier('a'), [1, 2], True))
+        self.assertEqual(where('array_length(a) = 2'),
+                         Compare('==', Call('ARRAY_LENGTH', [Identifier('a')]), Literal(2)))
+        self.assertEqual(where('json_contains(a, [1])'), Paren(Call('json_contains', [Identifier('a'), Literal([1])])))
+
+    def test_expr_rendered_from_tree(self):
+        query = parse('select a from book where not a > 1 and (b <> "x" or c in [1, 2]) '
+                      'and d between 1 and 2.5 and e = ?;', tree=True)
+        self.assertEqual(query['expr'], 'not (a > 1) and ((b != "x") or (c in [1, 2])) '
+                                        'and (1 <= d <= 2.5) and (e == %s)' % Param(0).marker)
+        self.assertEqual(to_expr(query['where']), query['expr'])
+
+    def test_flatten(self):
+        a, b, c, d = (Compare('==', Identifier(name), Literal(1)) for name in 'abcd')
+        self.assertEqual(where('a = 1 or b = 1 or c = 1 and d = 1'), BoolOp('or', [a, b, BoolOp('and', [c, d])]))
+        self.assertEqual(where('(a = 1 or b = 1) or c = 1'), BoolOp('or', [Paren(BoolOp('or', [a, b])), c]))
+
+    def test_many_terms(self):
+        query = parse('delete from book where ' + ' or '.join(f'book_id = {i}' for i in range(5000)) + ';', tree=True)
+        self.assertEqual(len(query['where'].values), 5000)
+        self.assertEqual(query['expr'], ' or '.join(f'(book_id == {i})' for i in range(5000)))
+
+    def test_no_where(self):
+        self.assertIsNone(parse('select a from book;', tree=True)['where'])
+        query = parse('select a from book order by v <-> [[1.0]] limit 1 where a > 1 with {"metric_type": "L2", "expr": "b > 2"};',
+                      tree=True)
+        self.assertEqual(query['expr'], 'b > 2')
+        self.assertIsNone(query['where'])
+
+    def test_tree_only_when_asked(self):
+        # 默认只保留渲染后的字符串，两种结果分别缓存
+        query = parse('delete from book where a > 1;')
+        self.assertEqual(query['expr'], '(a > 1)')
+        self.assertIsNone(query['where'])
+        self.assertEqual(parse('delete from book where a > 1;', tree=True)['where'],
+                         Compare('>', Identifier('a'), Literal(1)))
+        self.assertIsNone(parse('delete from book where a > 1;')['where'])
+
+
+if __name__ == '__main__':
+    unittest.main()
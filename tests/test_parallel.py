@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+from caller.parallel import run_statements
+
+
+class FakeCaller:
+    # 代替 func_map：查询打印 collection 名，写入记录执行顺序
+    def __init__(self, seconds=0.02):
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.events = []
+
+    def read(self, query):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.events.append(('start', query['coll_name']))
+        # 后面的语句先完成，检查输出顺序
+        time.sleep(self.seconds / (1 + len(self.events) % 3))
+        with self.lock:
+            self.running -= 1
+            self.events.append(('end', query['coll_name']))
+        if query['coll_name'] == 'missing':
+            raise ValueError('collection not found')
+        print(query['coll_name'])
+
+    def write(self, query):
+        with self.lock:
+            self.events.append(('write', self.running))
+        print('write ' + query['coll_name'])
+
+    def func_map(self):
+        return {'query': self.read, 'delete': self.write}
+
+
+def run(statements, parallel, caller):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        run_statements(statements, caller.func_map(), parallel)
+    return output.getvalue()
+
+
+SCRIPT = [
+    'select a from c1 where a > 1;',
+    'select a from c2 where a > 1;',
+    'select a from missing where a > 1;',
+    'select a from c3 where a > 1;',
+    'delete from c4 where a > 1;',
+    'select from;',
+    'select a from c5 where a > 1;',
+    'select a from c6 where a > 1;',
+]
+
+
+class TestRunStatements(unittest.TestCase):
+    def test_same_output_as_serial(self):
+        serial = run(SCRIPT, 1, FakeCaller())
+        self.assertEqual(serial.splitlines(), ['c1', 'c2', 'collection not found', 'c3', 'write c4',
+                                               'Syntax error in input!', 'c5', 'c6'])
+        for parallel in (2, 4, 8):
+            with self.subTest(parallel=parallel):
+                self.assertEqual(run(SCRIPT, parallel, FakeCaller()), serial)
+
+    def test_reads_concurrent(self):
+        caller = FakeCaller()
+        run(['select a from c%d where a > 1;' % i for i in range(8)], 4, caller)
+        self.assertEqual(caller.peak, 4)
+
+    def test_write_is_barrier(self):
+        caller = FakeCaller()
+        run(SCRIPT, 8, caller)
+        write = caller.events.index(('write', 0))
+        # 写入之前的查询都已结束，之后的查询都还没有开始
+        before = [name for event, name in caller.events[:write] if event == 'end']
+        after = [name for event, name in caller.events[write + 1:] if event == 'start']
+        self.assertEqual(sorted(before), ['c1', 'c2', 'c3', 'missing'])
+        self.assertEqual(sorted(after), ['c5', 'c6'])
+
+    def test_long_script(self):
+        statements = ['select a from c%d where a > 1;' % i for i in range(200)]
+        output = run(statements, 3, FakeCaller(seconds=0.001))
+        self.assertEqual(output.splitlines(), ['c%d' % i for i in range(200)])
+
+
+if __name__ == '__main__':
+    unittest.main()
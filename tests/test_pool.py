@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+from types import SimpleNamespace
+
+from caller.pool import MIN_SAMPLES, Member, Pool, build_pool, endpoints
+
+
+class Unavailable(Exception):
+    pass
+
+
+def make_pool(count=3, check=lambda member: True, **kwargs):
+    members = [Member('default' if i == 0 else f'default-{i}', f'10.0.0.{i}', '19530') for i in range(count)]
+    return Pool(members, check=check, unavailable=lambda error: isinstance(error, Unavailable), **kwargs)
+
+
+def connection(**options):
+    values = dict(alias='default', host='localhost', port='19530', endpoints='', pool_size=1,
+                  eject_seconds=30.0, slow_factor=3.0)
+    values.update(options)
+    return SimpleNamespace(connection=SimpleNamespace(**values))
+
+
+class TestPool(unittest.TestCase):
+    def test_endpoints(self):
+        self.assertEqual(endpoints(connection()), [('localhost', '19530')])
+        self.assertEqual(endpoints(connection(endpoints='a:1, b:2,c')), [('a', '1'), ('b', '2'), ('c', '19530')])
+
+    def test_build_pool(self):
+        pool = build_pool(connection(endpoints='a:1, b:2', pool_size=2))
+        self.assertEqual(pool.aliases, ['default', 'default-1', 'default-2', 'default-3'])
+        self.assertEqual([(m.host, m.port) for m in pool.members], [('a', '1'), ('a', '1'), ('b', '2'), ('b', '2')])
+        self.assertEqual(pool.primary, 'default')
+        self.assertEqual(build_pool(connection()).aliases, ['default'])
+
+    def test_least_outstanding(self):
+        pool = make_pool()
+        held = [pool.acquire() for _ in range(3)]
+        self.assertEqual(sorted(member.alias for member in held), sorted(pool.aliases))
+        pool.release(held[1], 0.01)
+        self.assertIs(pool.acquire(), held[1])
+
+    def test_using(self):
+        pool = make_pool(count=1)
+        with pool.using() as alias:
+            self.assertEqual(alias, 'default')
+            self.assertEqual(pool.members[0].outstanding, 1)
+        self.assertEqual(pool.members[0].outstanding, 0)
+        self.assertEqual(pool.members[0].samples, 1)
+
+    def test_unavailable_ejected(self):
+        pool = make_pool(count=2)
+        with self.assertRaises(Unavailable):
+            with pool.using() as alias:
+                raise Unavailable()
+        ejected = pool.members[pool.aliases.index(alias)]
+        self.assertIsNotNone(ejected.ejected_until)
+        for _ in range(5):
+            with pool.using() as other:
+                self.assertNotEqual(other, alias)
+
+    def test_other_errors_not_ejected(self):
+        pool = make_pool(count=2)
+        with self.assertRaises(ValueError):
+            with pool.using():
+                raise ValueError()
+        self.assertTrue(all(member.ejected_until is None for member in pool.members))
+        self.assertTrue(all(member.outstanding == 0 for member in pool.members))
+
+    def test_slow_ejected(self):
+        pool = make_pool(count=2, slow_factor=3.0)
+        fast, slow = pool.members
+        for _ in range(MIN_SAMPLES):
+            pool.acquire(), pool.acquire()
+            pool.release(fast, 0.01)
+            pool.release(slow, 0.02)
+        self.assertIsNone(slow.ejected_until)
+        for _ in range(MIN_SAMPLES):
+            pool.acquire()
+            pool.release(slow, 1.0)
+        self.assertIsNotNone(slow.ejected_until)
+        self.assertIsNone(fast.ejected_until)
+
+    def test_last_member_kept(self):
+        pool = make_pool(count=2)
+        pool._eject(pool.members[0])
+        pool._eject(pool.members[1])
+        self.assertIsNotNone(pool.members[0].ejected_until)
+        self.assertIsNone(pool.members[1].ejected_until)
+
+    def test_health_check(self):
+        healthy = {'default': True, 'default-1': False}
+        pool = make_pool(count=2, check=lambda member: healthy[member.alias], eject_seconds=0.0)
+        for member in pool.members:
+            member.ejected_until = 0.0
+        member = pool.acquire()
+        self.assertEqual(member.alias, 'default')
+        self.assertIsNone(pool.members[0].ejected_until)
+        self.assertIsNotNone(pool.members[1].ejected_until)
+
+    def test_all_ejected(self):
+        pool = make_pool(count=2, check=lambda member: False)
+        pool.members[0].ejected_until = 10 ** 9 + 2
+        pool.members[1].ejected_until = 10 ** 9 + 1
+        self.assertEqual(pool.acquire().alias, 'default-1')
+
+    def test_threads(self):
+        # 延迟的波动不应导致剔除，否则重新加入时计数会清零
+        pool = make_pool(count=4, slow_factor=float('inf'))
+
+        def work():
+            for _ in range(200):
+                with pool.using():
+                    pass
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(member.outstanding == 0 for member in pool.members))
+        self.assertEqual(sum(member.samples for member in pool.members), 1600)
+
+
+if __name__ == '__main__':
+    unittest.main()
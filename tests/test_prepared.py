@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from array import array
+from unittest import mock
+
+from sqlparser import prepare, parse
+from sqlparser.exceptions import ParameterException
+from sqlparser.nodes import Compare, Identifier, Literal
+from caller import call_search
+
+
+class TestPrepared(unittest.TestCase):
+    def test_positional(self):
+        stmt = prepare('select book_id from book limit ? offset ? where book_id > ? and word_count in ?;')
+        self.assertEqual(stmt.param_count, 4)
+        query = stmt.bind([10, 2, 5, [1, 2]])
+        self.assertEqual(query['limit'], 10)
+        self.assertEqual(query['offset'], 2)
+        self.assertEqual(query['expr'], '(book_id > 5) and (word_count in [1, 2])')
+
+    def test_named(self):
+        stmt = prepare('select book_id from book order by book_intro <-> :vectors limit :k '
+                       'where book_name like "a%" and book_id between :low and :high with {"metric_type":"L2"};')
+        self.assertEqual(stmt.param_names, {'vectors', 'k', 'low', 'high'})
+        query = stmt.bind({'vectors': [[1.0, 2.0]], 'k': 3, 'low': 1, 'high': 9})
+        self.assertEqual(query['data'], [array('f', [1.0, 2.0])])
+        self.assertEqual(query['limit'], 3)
+        self.assertEqual(query['expr'], '(book_name LIKE "a%") and (1 <= book_id <= 9)')
+
+    def test_bound_vectors(self):
+        # 绑定的向量和字面量一样打包，全是整数的行为 binary vector
+        stmt = prepare('select book_id from book order by book_intro <-> ? limit ? with {"metric_type":"HAMMING"};')
+        query = stmt.bind([[[1, 255]], 3])
+        self.assertEqual(query['data'], [b'\x01\xff'])
+        collection = mock.Mock()
+        collection.search.return_value = []
+        with mock.patch.object(call_search, 'get_collection', return_value=collection):
+            call_search.search(query)
+        self.assertEqual(collection.search.call_args.kwargs['data'], [b'\x01\xff'])
+        stmt = prepare('select book_id from book order by book_intro <-> [?, [1.5, 2]] limit 3 with {"metric_type":"L2"};')
+        query = stmt.bind([[0.5, 1]])
+        self.assertEqual(query['data'], [array('f', [0.5, 1.0]), array('f', [1.5, 2.0])])
+        # pymilvus 得到的是 Python 的列表
+        with mock.patch.object(call_search, 'get_collection', return_value=collection):
+            call_search.search(query)
+        self.assertEqual(collection.search.call_args.kwargs['data'], [[0.5, 1.0], [1.5, 2.0]])
+        self.assertIs(type(collection.search.call_args.kwargs['data'][0]), list)
+        with self.assertRaises(ParameterException):
+            stmt.bind([[1, 2]])
+        with self.assertRaises(ParameterException):
+            prepare('select book_id from book order by book_intro <-> ? limit 3 with {"metric_type":"L2"};').bind([[[256]]])
+
+    def test_insert_values(self):
+        stmt = prepare('insert into book (book_id, book_intro, info) values (?, ?, {"k":true}), (?, [?, 2.0], {"k": ?});')
+        query = stmt.bind([1, [1.0, 2.0], 2, 1.5, 'v'])
+        self.assertEqual(query['data'], [{'book_id': 1, 'book_intro': [1.0, 2.0], 'info': {'k': True}},
+                                         {'book_id': 2, 'book_intro': [1.5, 2.0], 'info': {'k': 'v'}}])
+
+    def test_string_value(self):
+        stmt = prepare('delete from book where book_name = ? or json_contains(info, ?);')
+        query = stmt.bind(['a "quoted" name', [1, 'x']])
+        self.assertEqual(query['expr'], '(book_name == "a \\"quoted\\" name") or (json_contains(info, [1, "x"]))')
+
+    def test_template_not_modified(self):
+        stmt = prepare('select book_id from book where book_id = ?;')
+        self.assertEqual(stmt.bind([1])['expr'], '(book_id == 1)')
+        self.assertEqual(stmt.bind([2])['expr'], '(book_id == 2)')
+        self.assertEqual(stmt.bind([3])['where'], Compare('==', Identifier('book_id'), Literal(3)))
+
+    def test_bind_errors(self):
+        stmt = prepare('select book_id from book where book_id = ?;')
+        with self.assertRaises(ParameterException):
+            stmt.bind([])
+        with self.assertRaises(ParameterException):
+            stmt.bind({'id': 1})
+        stmt = prepare('select book_id from book where book_id = :id;')
+        with self.assertRaises(ParameterException):
+            stmt.bind({})
+        with self.assertRaises(ParameterException):
+            prepare('select book_id from book where book_id = :id or book_id = ?;')
+
+    def test_json_colon_is_not_param(self):
+        query = parse('insert into book (info) values ({"key":true}, {\'key\' :null});')
+        self.assertEqual(query['data'], [{'info': {'key': True}}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import io
+import unittest
+
+from sqlparser import parse, parse_many, split_statements
+
+
+class TestSplitStatements(unittest.TestCase):
+    def test_split(self):
+        script = "show collections;\n\ninsert into c (a, b)\nvalues (1, 'x;y'), (2, \"`;\");;\n  drop collection c"
+        self.assertEqual(list(split_statements(script)), [
+            'show collections;',
+            "insert into c (a, b)\nvalues (1, 'x;y'), (2, \"`;\");",
+            'drop collection c;',
+        ])
+
+    def test_chunk_boundaries(self):
+        script = "select a from c limit 1 with {'expr': 'b == \"x;y\"'};show collections;"
+        expected = list(split_statements(script))
+        # 分块读取时语句和引号可能被截断在任意位置
+        for size in range(1, 12):
+            self.assertEqual(list(split_statements(io.StringIO(script), chunk_size=size)), expected)
+        self.assertEqual(list(split_statements(iter(script))), expected)
+
+    def test_blank_script(self):
+        self.assertEqual(list(split_statements(' ;\n; ')), [])
+
+
+class TestParseMany(unittest.TestCase):
+    def test_parse_many(self):
+        lines = ['create database db1;\n', 'use db1;\n', "insert into c (a, b)\n", "values (1, 'x;y');\n"]
+        queries = parse_many(iter(lines))
+        self.assertEqual(next(queries), parse('create database db1;'))
+        self.assertEqual(next(queries), parse('use db1;'))
+        self.assertEqual(next(queries)['data'], [{'a': 1, 'b': 'x;y'}])
+        self.assertEqual(list(queries), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+
+from caller import settings as settings_module
+from caller.settings import Settings, get_settings, reload_settings
+import sqlparser
+from sqlparser import parse, cache_info, set_cache_size
+from sqlparser.exceptions import GrammarException
+
+
+class TestSettings(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'config.ini')
+        self.interval = settings_module.CHECK_INTERVAL
+        settings_module.CHECK_INTERVAL = 0.0
+        settings_module._settings = None
+        settings_module._checked_at = 0.0
+
+    def tearDown(self):
+        settings_module.CHECK_INTERVAL = self.interval
+        settings_module._settings = None
+        self.dir.cleanup()
+
+    def write(self, text, mtime=None):
+        with open(self.path, 'w') as file:
+            file.write(text)
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def test_defaults(self):
+        self.write('[Connection]\nalias = default\nhost = localhost\nport = 19530\n')
+        settings = Settings(self.path)
+        self.assertEqual(settings.connection.alias, 'default')
+        self.assertIsNone(settings.connection.user)
+        self.assertIsNone(settings.query.timeout)
+        self.assertEqual(settings.query.consistency_level, 'Bounded')
+        self.assertEqual(settings.delete.in_chunk_size, 10000)
+        self.assertIs(settings.collection._async, False)
+        self.assertEqual(settings.search.round_decimal, -1)
+
+    def test_typed_values(self):
+        self.write('[Connection]\nalias = other\nuser = root\n'
+                   '[Query]\ntimeout = 10\nconsistency_level = Strong\nmax_workers = 8\n'
+                   '[Partition]\n_refresh = true\n[Search]\nbatch_size = 50\nextra = 1\n')
+        settings = Settings(self.path)
+        self.assertEqual(settings.connection.alias, 'other')
+        self.assertEqual(settings.connection.user, 'root')
+        self.assertEqual(settings.query.timeout, 10.0)
+        self.assertIsInstance(settings.query.timeout, float)
+        self.assertEqual(settings.query.consistency_level, 'Strong')
+        self.assertEqual(settings.query.max_workers, 8)
+        self.assertIs(settings.partition._refresh, True)
+        self.assertEqual(settings.search.batch_size, 50)
+        self.assertEqual(settings.search.extra, '1')
+
+    def test_loaded_once(self):
+        self.write('[Insert]\ntimeout = 1\n', mtime=1000)
+        first = get_settings(self.path)
+        self.assertIs(get_settings(self.path), first)
+
+    def test_reload_on_change(self):
+        self.write('[Insert]\ntimeout = 1\n', mtime=1000)
+        self.assertEqual(get_settings(self.path).insert.timeout, 1.0)
+        self.write('[Insert]\ntimeout = 2\n', mtime=2000)
+        self.assertEqual(get_settings(self.path).insert.timeout, 2.0)
+
+    def test_check_interval(self):
+        settings_module.CHECK_INTERVAL = 3600.0
+        self.write('[Insert]\ntimeout = 1\n', mtime=1000)
+        self.assertEqual(get_settings(self.path).insert.timeout, 1.0)
+        self.write('[Insert]\ntimeout = 2\n', mtime=2000)
+        self.assertEqual(get_settings(self.path).insert.timeout, 1.0)
+        # 显式重新读取不受检查间隔限制
+        self.assertEqual(reload_settings(self.path).insert.timeout, 2.0)
+        self.assertEqual(get_settings(self.path).insert.timeout, 2.0)
+
+    def test_other_path(self):
+        # 换了配置文件时不等检查间隔
+        settings_module.CHECK_INTERVAL = 3600.0
+        self.write('[Insert]\ntimeout = 1\n')
+        self.assertEqual(get_settings(self.path).insert.timeout, 1.0)
+        other = os.path.join(self.dir.name, 'other.ini')
+        with open(other, 'w') as file:
+            file.write('[Insert]\ntimeout = 2\n')
+        self.assertEqual(get_settings(other).insert.timeout, 2.0)
+
+    def test_missing_file(self):
+        settings = get_settings(self.path)
+        self.assertEqual(settings.connection.host, 'localhost')
+        self.assertIsNone(settings.mtime)
+
+    def test_parse_cache(self):
+        self.write('[Parser]\ncache_size = 64\nmax_sql_length = 32768\n')
+        try:
+            reload_settings(self.path)
+            info = cache_info()
+            self.assertEqual(info.maxsize, 64)
+            self.assertEqual(sqlparser._cache.max_sql_length, 32768)
+        finally:
+            set_cache_size(512, 16384)
+
+    def test_reload_config_statement(self):
+        self.assertEqual(parse('reload config;'), {'type': 'reload_config'})
+        self.assertEqual(parse('RELOAD CONFIG;'), {'type': 'reload_config'})
+        for sql in ['reload;', 'reload configs;', 'config reload;', 'reload config book;']:
+            with self.subTest(sql=sql):
+                with self.assertRaises(GrammarException):
+                    parse(sql)
+
+
+if __name__ == '__main__':
+    unittest.main()
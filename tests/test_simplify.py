@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from sqlparser import parse, prepare
+from sqlparser.nodes import Identifier, Compare, Literal, BoolOp
+from sqlparser.simplify import simplify, simple_kind
+
+
+def query(condition):
+    return parse(f'select a from book where {condition};')
+
+
+class TestSimplify(unittest.TestCase):
+    def check(self, cases):
+        for condition, expected in cases:
+            with self.subTest(condition=condition):
+                result = query(condition)
+                self.assertEqual(result['expr'], expected)
+                self.assertNotIn('always_false', result)
+
+    def check_false(self, conditions):
+        for condition in conditions:
+            with self.subTest(condition=condition):
+                self.assertTrue(query(condition)['always_false'])
+
+    def test_merge_ranges(self):
+        self.check([('a > 5 and a > 10', '(a > 10)'),
+                    ('a > 5 and a >= 5', '(a > 5)'),
+                    ('x between 1 and 5 and x > 3', '(x > 3) and (x <= 5)'),
+                    ('x >= 1 and 5 >= x and b = 1', '(1 <= x <= 5) and (b == 1)'),
+                    ('a >= 3 and a <= 3', '(a == 3)'),
+                    ('a > 1 and a != 0 and a != 5', '(a > 1) and (a != 5)'),
+                    ('s > "a" and s <= "c"', '(s > "a") and (s <= "c")'),
+                    ('a in [1, 2, 3] and a not in [2]', '(a in [1, 3])'),
+                    ('a in [1, 2, 3] and a < 3', '(a in [1, 2])')])
+
+    def test_in_list(self):
+        self.check([('a in [3, 1, 3, 2]', '(a in [1, 2, 3])'),
+                    ('a not in ["b", "a", "b"]', '(not (a in [\'a\', \'b\']))'),
+                    ('a in [1, "x"]', "(a in [1, 'x'])")])
+
+    def test_contradictions(self):
+        self.check_false(['b in [1, 2] and b = 3', 'x between 1 and 5 and x > 9', 'a > 3 and a < 3',
+                          'a >= 3 and a <= 3 and a != 3', 'a in []', 'x between 5 and 1',
+                          '(a > 1 and b = 2) and a < 0', 'a = 1 and a = 2 or b in [1] and b in [2]',
+                          'c > 1 and 1 = 2', 'not (1 = 1)'])
+
+    def test_paren_comparisons(self):
+        self.check_false(['(a > 1) and (a < 0)', '((a = 1)) and a in [2, 3]', '(x between 1 and 5) and (x > 9)'])
+        self.check([('(a > 5) and (a > 10)', '(a > 10)'),
+                    ('(a > 1) and b = 1 and (a <= 3)', '(a > 1) and (a <= 3) and (b == 1)')])
+
+    def test_deep_nesting(self):
+        # 化简不使用递归，嵌套很深的括号和 not 不会超出递归深度
+        depth = 5000
+        self.assertEqual(query('(' * depth + 'a > 1' + ')' * depth)['expr'], '(' * depth + '(a > 1)' + ')' * depth)
+        self.assertEqual(query('not ' * depth + 'a > 1')['expr'], 'not ' * depth + '(a > 1)')
+        self.check_false(['(' * depth + 'a > 1 and a < 0' + ')' * depth, 'not ' * (depth + 1) + '1 = 1'])
+
+    def test_constant_terms(self):
+        self.check([('a > 1 and 1 = 1', '(a > 1)'), ('a > 1 or 2 < 1', '(a > 1)'),
+                    ('a = 1 or (b = 2 and b = 3)', '(a == 1)'),
+                    ('c = 1 and (a > 1 or 1 > 2) and (b = 2 or b > 3 and b < 1)', '(c == 1) and (a > 1) and (b == 2)')])
+
+    def test_unchanged(self):
+        # 无法化简的条件保持原样，包括恒为真的条件和需要保留的括号
+        self.check([('a > 1 or 1 = 1', '(a > 1) or (1 == 1)'),
+                    ('a > 5 or a <= 5', '(a > 5) or (a <= 5)'),
+                    ('a = "x" and a = 1', '(a == "x") and (a == 1)'),
+                    ('a > 1 and (b < 2 or c = 3)', '(a > 1) and ((b < 2) or (c == 3))'),
+                    ('json_contains(x, 1) and a = 1 and 3 > a', '(json_contains(x, 1)) and (a == 1)')])
+        tree = parse('select a from book where (a = 1 or b = 1) or c = 1;', tree=True)['where']
+        self.assertIs(simplify(tree), tree)
+
+    def test_float_bounds_unchanged(self):
+        # Milvus 按 float32 比较 FLOAT field，float 常量不合并也不判断矛盾
+        self.check([('a >= 0.1 + 0.2 and a <= 0.3', '(a >= 0.30000000000000004) and (a <= 0.3)'),
+                    ('a > 0.3 and a >= 0.30000000000000004', '(a > 0.3) and (a >= 0.30000000000000004)'),
+                    ('a between 0.30000000000000004 and 0.3', '(0.30000000000000004 <= a <= 0.3)'),
+                    ('a = 0.1 and a = 0.2', '(a == 0.1) and (a == 0.2)'),
+                    ('a in [0.1, 0.2] and a > 0.15', '(a in [0.1, 0.2]) and (a > 0.15)'),
+                    ('a > 1 and a > 2.5 and a > 3', '(a > 3) and (a > 2.5)')])
+
+    def test_paren_kept_after_merge(self):
+        self.check([('(a > 1 or b = 1) and c > 1 and c > 2', '((a > 1) or (b == 1)) and (c > 2)'),
+                    ('(a > 1 and a > 2 or b = 1) and c = 1', '((a > 2) or (b == 1)) and (c == 1)'),
+                    ('not (a > 1 and a > 2)', 'not (a > 2)')])
+
+    def test_node_results(self):
+        a = Compare('==', Identifier('a'), Literal(1))
+        self.assertEqual(simplify(BoolOp('and', [a, Compare('==', Literal(2), Literal(2))])), a)
+        self.assertIs(simplify(BoolOp('or', [a, Compare('<', Literal(1), Literal(2))])), True)
+
+    def test_search_and_delete(self):
+        search = parse('select a from book order by v <-> [[1.0]] limit 1 where a > 2 and a < 1 '
+                       'with {"metric_type": "L2"};')
+        self.assertTrue(search['always_false'])
+        search = parse('select a from book order by v <-> [[1.0]] limit 1 where a > 2 and a < 1 '
+                       'with {"metric_type": "L2", "expr": "a > 0"};')
+        self.assertNotIn('always_false', search)
+        self.assertTrue(parse('delete from book where a in [1] and a in [2];')['always_false'])
+
+    def test_prepared(self):
+        statement = prepare('select a from book where a in ? and a > 10;')
+        self.assertTrue(statement.bind([[1, 2]])['always_false'])
+        self.assertNotIn('always_false', statement.bind([[1, 20]]))
+
+    def test_simple_kind(self):
+        self.assertIsNotNone(simple_kind([1, 2.5]))
+        self.assertIsNotNone(simple_kind(['a', 'b']))
+        self.assertIsNone(simple_kind([1, 'a']))
+        self.assertIsNone(simple_kind([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
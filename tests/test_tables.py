@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from ply import lex, yacc
+
+from sqlparser import lexer, grammar, lextab, parsetab
+
+
+class TestTables(unittest.TestCase):
+    # 分析表在 optimize 模式下载入，不会自动检查，过期时需要运行 python -m sqlparser.build_tables
+    def test_parsetab_matches_grammar(self):
+        pinfo = yacc.ParserReflect(vars(grammar))
+        pinfo.get_all()
+        self.assertEqual(parsetab._lr_signature, pinfo.signature())
+
+    def test_lextab_matches_lexer(self):
+        fresh = lex.lex(module=lexer, optimize=False)
+        patterns = [regex.pattern for regex, _ in fresh.lexstatere['INITIAL']]
+        self.assertEqual([regex for regex, _ in lextab._lexstatere['INITIAL']], patterns)
+        self.assertEqual(lextab._lextokens, set(lexer.tokens))
+        self.assertEqual(lextab._lexliterals, lexer.literals)
+        self.assertEqual(lextab._lexstateignore['INITIAL'], lexer.t_ignore)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlparser.grammar import parse_handle
+from sqlparser.exceptions import GrammarException
+
+
+def statement(i):
+    return f'select a, b from c{i} limit {i} with {{"expr": "a > {i}"}};'
+
+
+def parse_or_error(sql):
+    try:
+        return parse_handle(sql)
+    except GrammarException:
+        return 'error'
+
+
+class TestThreadSafety(unittest.TestCase):
+    def test_concurrent_parse(self):
+        # 正确和错误的语句交替出现，错误的语句不能影响其他线程的解析状态
+        sqls = [statement(i) if i % 3 else f'select from c{i} where;' for i in range(2000)]
+        expected = [parse_or_error(sql) for sql in sqls]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(parse_or_error, sqls))
+        self.assertEqual(results, expected)
+
+    def test_thread_has_own_parser(self):
+        from sqlparser import grammar
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(grammar._thread_instances).result()
+        mine = grammar._thread_instances()
+        self.assertIsNot(mine[0], other[0])
+        self.assertIsNot(mine[1], other[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
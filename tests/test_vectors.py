@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import unittest
+from array import array
+
+from sqlparser import parse
+from sqlparser.vectors import FloatVectors, pack_float_vectors
+from sqlparser.exceptions import GrammarException, LexerException
+
+SEARCH_SQL = 'select book_id from book order by book_intro <-> %s limit 3 with {"metric_type":"L2"};'
+
+
+class TestVectorLiterals(unittest.TestCase):
+    def test_float_vectors(self):
+        data = parse(SEARCH_SQL % '[[1.0, 2.5], [-1, 0.5]]')['data']
+        self.assertEqual(data, [array('f', [1.0, 2.5]), array('f', [-1.0, 0.5])])
+
+    def test_binary_vectors(self):
+        data = parse(SEARCH_SQL % '[[1, 255], [0, 128]]')['data']
+        self.assertEqual(data, [b'\x01\xff', b'\x00\x80'])
+
+    def test_binary_vector_out_of_range(self):
+        with self.assertRaises(GrammarException):
+            parse(SEARCH_SQL % '[[1, 256]]')
+
+    def test_binary_literals(self):
+        data = parse(SEARCH_SQL % "[X'01ff', b64'AIA=', x'']")['data']
+        self.assertEqual(data, [b'\x01\xff', b'\x00\x80', b''])
+        query = parse("insert into book (book_id, book_intro) values (1, X'0fA3');")
+        self.assertEqual(query['data'][0]['book_intro'], b'\x0f\xa3')
+
+    def test_binary_literal_as_scalar(self):
+        # 二进制字面量不能出现在条件中
+        for sql in ["delete from book where a = X'0f';",
+                    "delete from book where a in [1, X'0f'];",
+                    "delete from book where ARRAY_CONTAINS(a, B64'Dw==');",
+                    "delete from book where a between X'00' and 1;",
+                    "select a from book where json_contains(a, {\"k\": X'0f'});"]:
+            with self.assertRaises(GrammarException):
+                parse(sql)
+
+    def test_bad_binary_literals(self):
+        for literal in ["X'abc'", "X'zz'", "B64'A@=='"]:
+            with self.assertRaises(LexerException):
+                parse(SEARCH_SQL % '[%s]' % literal)
+
+    def test_mixed_vector_types(self):
+        with self.assertRaises(GrammarException):
+            parse(SEARCH_SQL % "[X'01ff', [1.0, 2.0]]")
+
+    def test_float_vector_literal(self):
+        vector = array('f', [1.0, 2.5, -3.0])
+        literal = "F32'%s'" % base64.b64encode(vector.tobytes()).decode()
+        self.assertEqual(parse(SEARCH_SQL % '[%s]' % literal)['data'], [vector])
+        query = parse('insert into book (book_id, book_intro) values (1, %s), (2, [0.5, 1, 2]);' % literal, columnar=True)
+        self.assertEqual(query['columns']['book_intro'], [vector, [0.5, 1, 2]])
+        self.assertEqual(pack_float_vectors(query['columns']['book_intro']),
+                         FloatVectors(array('f', [1.0, 2.5, -3.0, 0.5, 1.0, 2.0]), 3))
+
+    def test_float_vector_literal_as_scalar(self):
+        # F32 字面量不能出现在条件中
+        for sql in ["delete from book where a = F32'AACAPw==';",
+                    "delete from book where a in [F32'AACAPw=='];",
+                    "delete from book where ARRAY_CONTAINS(a, F32'AACAPw==');",
+                    "delete from book where a in [[F32'AACAPw==']];"]:
+            with self.assertRaises(GrammarException):
+                parse(sql)
+
+    def test_bad_float_vector_literal(self):
+        for literal in ["F32'AAA='", "f32'@@@@'"]:
+            with self.assertRaises(LexerException):
+                parse(SEARCH_SQL % '[%s]' % literal)
+
+    def test_vector_file(self):
+        data = parse(SEARCH_SQL % "FILE 'queries.npy'")['data']
+        self.assertEqual(data, {'file': 'queries.npy', 'start': None, 'stop': None})
+        data = parse(SEARCH_SQL % "file 'queries.fvecs' [100:200]")['data']
+        self.assertEqual(data, {'file': 'queries.fvecs', 'start': 100, 'stop': 200})
+        data = parse(SEARCH_SQL % "file 'queries.bvecs'[:10]")['data']
+        self.assertEqual((data['start'], data['stop']), (None, 10))
+        with self.assertRaises(GrammarException):
+            parse(SEARCH_SQL % "path 'queries.npy'")
+
+    def test_insert_row_values_unchanged(self):
+        # 按行插入时无法区分 float vector 和浮点数组，保持为列表
+        query = parse('insert into book (book_id, book_intro) values (1, [1.0, 2.0]);')
+        self.assertEqual(query['data'][0]['book_intro'], [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()